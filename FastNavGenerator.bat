@@ -239,6 +239,24 @@ if not exist "!OUTPUT_FILE!" (
     call :GENERATE_WEBSITE_SILENT
 )
 
+:: Resolve generator (EXE first, then Python script) for the built-in server
+if not defined GENERATOR_CMD (
+    if exist "FastNavGenerator.exe" (
+        set "GENERATOR_CMD=FastNavGenerator.exe"
+    ) else if exist "FastNavGenerator.py" (
+        where python >nul 2>&1
+        if %errorlevel% equ 0 (
+            set "GENERATOR_CMD=python FastNavGenerator.py"
+        )
+    )
+)
+
+if not defined GENERATOR_CMD (
+    echo [ERROR] No working generator found!
+    pause
+    exit /b 1
+)
+
 :: Get network info
 set "IP=localhost"
 for /f "tokens=2 delims=:" %%i in ('ipconfig ^| findstr /c:"IPv4" 2^>nul') do (
@@ -257,9 +275,9 @@ echo.
 echo [INFO] Press Ctrl+C to stop server
 echo.
 
-:: Start temporary server using Python HTTP server
-echo [INFO] Starting Python HTTP server...
-start cmd /k "title FastNav Temporary Server - Port:!SERVER_PORT! && echo [INFO] Server running... && echo [URL] http://localhost:!SERVER_PORT! && echo [INFO] Press Ctrl+C to stop && python -m http.server !SERVER_PORT!"
+:: Start temporary server using the built-in asyncio static server
+echo [INFO] Starting built-in HTTP server...
+start cmd /k "title FastNav Temporary Server - Port:!SERVER_PORT! && echo [INFO] Server running... && echo [URL] http://localhost:!SERVER_PORT! && echo [INFO] Press Ctrl+C to stop && !GENERATOR_CMD! serve --port !SERVER_PORT!"
 
 if "!AUTO_OPEN!"=="true" (
     timeout /t 1 >nul
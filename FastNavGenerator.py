@@ -8,10 +8,56 @@
 
 import datetime
 import argparse
+import asyncio
+import email.utils
+import gzip
 import sys
 import os
 import json
+import queue
+import mimetypes
+import multiprocessing
+import pickle
+import re
+import time
+import hashlib
+import io
+import threading
+import urllib.parse
 from collections import defaultdict
+from contextlib import nullcontext, redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from types import MappingProxyType
+from typing import NamedTuple
+
+try:
+    import brotli  # 可选依赖，用于生成 Brotli 压缩版本
+except ImportError:
+    brotli = None
+
+# 流式写入模式的文件缓冲区大小
+STREAM_BUFFER_SIZE = 1 << 16
+
+# 虚拟化链接列表模式下，链接数达到该阈值的分类才改为客户端按需渲染
+VIRTUAL_LINKS_THRESHOLD = 200
+
+# 页面图标（同时用作 PWA 清单中的应用图标）
+FAVICON_DATA_URI = (
+    "data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'%3E%3Cdefs%3E"
+    "%3ClinearGradient id='g' x1='0%25' y1='0%25' x2='100%25' y2='100%25'%3E"
+    "%3Cstop offset='0%25' stop-color='%236366f1'/%3E%3Cstop offset='100%25' stop-color='%238b5cf6'/%3E"
+    "%3C/linearGradient%3E%3C/defs%3E%3Ccircle cx='50' cy='50' r='45' fill='url(%23g)'/%3E"
+    "%3Ccircle cx='50' cy='50' r='40' fill='white'/%3E%3Cpath d='M50 25 L62 45 L50 55 L38 45 Z' fill='url(%23g)'/%3E"
+    "%3Ccircle cx='50' cy='50' r='5' fill='%236366f1'/%3E%3C/svg%3E"
+)
+
+# 带内容哈希的静态资源文件名（如 app.3f2a9c1d0b7e4a65.css），可被浏览器永久缓存
+FINGERPRINTED_ASSET_RE = re.compile(r'\.[0-9a-f]{8,}\.(css|js|html)$')
+
+# 页面中对外部资源文件（--external-assets）的引用
+EXTERNAL_ASSET_REF_RE = re.compile(r'(?:href|src)="(app\.[0-9a-f]{8,}\.(?:css|js))"')
 
 
 class JavaScriptManager:
@@ -24,17 +70,72 @@ class JavaScriptManager:
         // 主初始化函数
         function initNavigation() {
             initCategoryNavigation();
+            // 分类类型和生成选项专用的脚本只在配置中存在对应分类、启用对应选项时才打包
+            if (typeof initVirtualLinks === 'function') initVirtualLinks();
             initSubcategoryNavigation();
-            initReleaseNotes();
+            if (typeof initReleaseNotes === 'function') initReleaseNotes();
             initLayoutControls();
             initTagFilters();
             initLocalFolderFeatures();
-            initInterfaceRoutes();
-            initIconReference();
+            if (typeof initInterfaceRoutes === 'function') initInterfaceRoutes();
+            if (typeof initIconReference === 'function') initIconReference();
             initUsageTooltip();
             initKeyboardShortcuts();
             initNotificationSystem();
+            if (typeof initGlobalSearch === 'function') initGlobalSearch();
+            initModalControls();
+            if (typeof initModuleInfo === 'function') initModuleInfo();
+
+            // 各功能就绪后挂载首屏分类，其余分类在首次激活时挂载
+            activateInitialSection();
+        }
+
+        // 0. 事件委托：每种事件只在 document 上注册一个监听器，按选择器分发给各功能，
+        //    分类内容延迟插入或虚拟列表重建卡片时无需重新绑定，处理函数数量不随页面操作增长
+        const delegatedEvents = new Map();  // 事件类型 -> [{ selector, handler }]
+        const eventStats = { native: 0, delegated: 0 };
+
+        // 直接注册的监听器（window 级事件等）统一经过这里，便于统计
+        function listen(target, type, handler, options) {
+            target.addEventListener(type, handler, options);
+            eventStats.native++;
+        }
+
+        // selector 为 null 时处理该类型的所有事件，handler(e, target) 中 target 为匹配到的元素
+        function delegate(type, selector, handler) {
+            let entries = delegatedEvents.get(type);
+            if (!entries) {
+                entries = [];
+                delegatedEvents.set(type, entries);
+                // scroll 不冒泡，在捕获阶段监听
+                const capture = type === 'scroll';
+                listen(document, type, e => dispatchDelegated(e, entries), { capture: capture, passive: capture });
+            }
+            entries.push({ selector: selector, handler: handler });
+            eventStats.delegated++;
         }
+
+        function dispatchDelegated(e, entries) {
+            const origin = e.target instanceof Element ? e.target : null;
+            for (const entry of entries) {
+                const target = entry.selector === null ? document : origin && origin.closest(entry.selector);
+                if (target) entry.handler(e, target);
+                if (e.cancelBubble) break;
+            }
+        }
+
+        // 调试：在控制台执行 fastNavDebug.handlers() 查看当前注册的处理函数数量
+        window.fastNavDebug = {
+            handlers() {
+                const delegated = {};
+                delegatedEvents.forEach((entries, type) => { delegated[type] = entries.length; });
+                return {
+                    total: eventStats.native + eventStats.delegated,
+                    native: eventStats.native,
+                    delegated: delegated
+                };
+            }
+        };
         """
 
     @staticmethod
@@ -43,33 +144,162 @@ class JavaScriptManager:
         return """
         // 1. 分类导航功能
         function initCategoryNavigation() {
-            document.querySelectorAll('.nav-item').forEach(item => {
-                item.addEventListener('click', (e) => {
-                    e.preventDefault();
-
-                    // 移除所有active类
-                    document.querySelectorAll('.nav-item').forEach(nav => nav.classList.remove('active'));
-                    document.querySelectorAll('.category-section').forEach(section => section.classList.remove('active'));
-
-                    // 添加active类
-                    item.classList.add('active');
-                    const category = item.getAttribute('data-category');
-                    const categorySection = document.getElementById(category);
-                    if (categorySection) {
-                        categorySection.classList.add('active');
-
-                        // 触发页面切换事件
-                        const event = new CustomEvent('categoryChanged', {
-                            detail: { category: category }
-                        });
-                        document.dispatchEvent(event);
-                    }
+            delegate('click', '.nav-item', (e, item) => {
+                e.preventDefault();
+                const category = item.getAttribute('data-category');
+
+                // 分类片段尚未加载时先获取，加载完成后重新执行切换
+                const loading = typeof loadSectionFragment === 'function' ? loadSectionFragment(category) : null;
+                if (loading) {
+                    loading.then(loaded => { if (loaded) item.click(); });
+                    return;
+                }
 
-                    // 检查是否有二级分类，如果有则初始化
-                    initSubcategoryForCategory(category);
-                });
+                // 只更新前后两个导航项，不再扫描全部导航项和分类
+                if (activeNavItem) activeNavItem.classList.remove('active');
+                item.classList.add('active');
+                activeNavItem = item;
+
+                if (typeof hydrateSection === 'function') hydrateSection(category);
+                const categorySection = document.getElementById(category);
+                if (categorySection) {
+                    activateSection(categorySection);
+                }
             });
         }
+
+        // 1.0 分类生命周期：按分类类型定义 mount（首次激活时执行一次）、activate 和 deactivate，
+        //     切换分类时直接调用，不依赖定时器等待 DOM，也不重复扫描整个文档
+        const sectionLifecycles = {
+            '普通分类': {
+                mount: section => {
+                    section._virtualLists = typeof mountVirtualLinks === 'function' ? mountVirtualLinks(section) : [];
+                    mountCardIndex(section);
+                },
+                activate: section => {
+                    // 检查是否有二级分类，如果有则初始化
+                    initSubcategoryForCategory(section.id);
+                    section._virtualLists.forEach(list => list.schedule());
+                },
+                // 虚拟列表在分类隐藏后释放已渲染的卡片
+                deactivate: section => section._virtualLists.forEach(list => list.schedule())
+            },
+            'ReleaseNotes': {},
+            'InterfaceMap': {
+                mount: section => {
+                    section._virtualTables = typeof mountVirtualInterfaceTables === 'function'
+                        ? mountVirtualInterfaceTables(section) : [];
+                },
+                activate: section => section._virtualTables.forEach(table => table.schedule())
+            },
+            'ModuleInfo': {
+                mount: () => updateCategoryCounts()
+            },
+            'ConfigDocs': {},
+            'IconsReference': {}
+        };
+
+        let activeNavItem = null;
+        let activeSection = null;
+
+        // 未知类型与服务端一致，按普通分类处理
+        function sectionLifecycle(section) {
+            return sectionLifecycles[section.getAttribute('data-category-type')] || sectionLifecycles['普通分类'];
+        }
+
+        function activateSection(section) {
+            if (activeSection && activeSection !== section) {
+                activeSection.classList.remove('active');
+                const previous = sectionLifecycle(activeSection);
+                if (previous.deactivate) previous.deactivate(activeSection);
+            }
+
+            const lifecycle = sectionLifecycle(section);
+            if (!section._mounted) {
+                section._mounted = true;
+                if (lifecycle.mount) lifecycle.mount(section);
+            }
+            section.classList.add('active');
+            activeSection = section;
+            if (lifecycle.activate) lifecycle.activate(section);
+
+            // 触发页面切换事件
+            document.dispatchEvent(new CustomEvent('categoryChanged', {
+                detail: { category: section.id }
+            }));
+        }
+
+        function activateInitialSection() {
+            activeNavItem = document.querySelector('.nav-item.active');
+            const section = document.querySelector('.category-section.active');
+            if (section) activateSection(section);
+        }
+        """
+
+    @staticmethod
+    def get_deferred_sections_script():
+        """延迟渲染分类脚本（defer_sections）"""
+        return """
+        // 1.0 延迟渲染：未激活的分类以 <template> 输出，首次导航到该分类时才插入文档
+        function hydrateSection(category) {
+            const template = Array.from(document.querySelectorAll('template.deferred-section'))
+                .find(t => t.getAttribute('data-section') === category);
+            if (!template) return;
+
+            // 插入后由 activateSection 挂载
+            template.replaceWith(template.content);
+        }
+        """
+
+    @staticmethod
+    def get_section_fragments_script():
+        """分片加载分类脚本（split_sections）"""
+        return """
+        // 1.0.1 分片输出：分类内容位于 sections/ 下带内容哈希的片段文件，按需获取
+        const sectionFragmentRequests = new Map();
+
+        async function fetchSectionFragment(src) {
+            // 文件名带内容哈希，可以放心长期缓存；Cache API 不可用（如非安全上下文）时只缓存在内存中
+            if (window.caches) {
+                try {
+                    const cache = await caches.open('fastnav-sections');
+                    const cached = await cache.match(src);
+                    if (cached) return cached.text();
+                    const response = await fetch(src);
+                    if (!response.ok) throw new Error(response.status);
+                    await cache.put(src, response.clone());
+                    return response.text();
+                } catch (err) {
+                    console.warn('Cache API 不可用，直接请求分类片段:', err);
+                }
+            }
+            const response = await fetch(src);
+            if (!response.ok) throw new Error(response.status);
+            return response.text();
+        }
+
+        // 返回 Promise 表示正在加载（resolve 为是否成功），片段已在文档中时返回 null
+        function loadSectionFragment(category) {
+            const placeholder = Array.from(document.querySelectorAll('.section-fragment'))
+                .find(p => p.getAttribute('data-section') === category);
+            if (!placeholder) return null;
+
+            const src = placeholder.getAttribute('data-src');
+            if (!sectionFragmentRequests.has(src)) {
+                sectionFragmentRequests.set(src, fetchSectionFragment(src).then(html => {
+                    if (!placeholder.isConnected) return true;
+                    placeholder.insertAdjacentHTML('beforebegin', html);
+                    placeholder.remove();
+                    return true;
+                }).catch(err => {
+                    console.error('分类片段加载失败:', src, err);
+                    sectionFragmentRequests.delete(src);
+                    showNotification('分类内容加载失败，请稍后重试', 'error');
+                    return false;
+                }));
+            }
+            return sectionFragmentRequests.get(src);
+        }
         """
 
     @staticmethod
@@ -79,21 +309,18 @@ class JavaScriptManager:
         // 1.1 二级分类导航功能
         function initSubcategoryNavigation() {
             // 二级分类项点击事件
-            document.addEventListener('click', function(e) {
-                if (e.target.closest('.subcategory-item')) {
-                    const item = e.target.closest('.subcategory-item');
-                    const subcategory = item.getAttribute('data-subcategory');
-                    const mainCategory = item.closest('.category-section').id;
-
-                    // 更新二级分类激活状态
-                    item.closest('.subcategory-list').querySelectorAll('.subcategory-item').forEach(subItem => {
-                        subItem.classList.remove('active');
-                    });
-                    item.classList.add('active');
+            delegate('click', '.subcategory-item', (e, item) => {
+                const subcategory = item.getAttribute('data-subcategory');
+                const mainCategory = item.closest('.category-section').id;
 
-                    // 显示对应的内容
-                    showSubcategoryContent(mainCategory, subcategory);
-                }
+                // 更新二级分类激活状态
+                item.closest('.subcategory-list').querySelectorAll('.subcategory-item').forEach(subItem => {
+                    subItem.classList.remove('active');
+                });
+                item.classList.add('active');
+
+                // 显示对应的内容
+                showSubcategoryContent(mainCategory, subcategory);
             });
         }
 
@@ -118,120 +345,311 @@ class JavaScriptManager:
             const categorySection = document.getElementById(mainCategory);
             if (!categorySection) return;
 
-            // 获取所有卡片容器
-            const allCardsContainer = categorySection.querySelector('.cards-container');
-            const subcategoryContainers = categorySection.querySelectorAll('.subcategory-cards');
+            // 卡片筛选由虚拟列表或构建时生成的卡片成员索引完成，不读取卡片属性
+            const cardFilter = getCardFilter(categorySection);
+            if (!cardFilter) return;
+            cardFilter.apply(cardFilter.model.setSubcategory(subcategory));
 
-            if (subcategory === '全部') {
-                // 显示所有卡片
-                if (allCardsContainer) {
-                    allCardsContainer.style.display = 'grid';
-                }
-                // 隐藏所有二级分类的卡片容器
-                subcategoryContainers.forEach(container => {
-                    container.style.display = 'none';
-                });
-            } else {
-                // 隐藏所有卡片容器
-                if (allCardsContainer) {
-                    allCardsContainer.style.display = 'none';
-                }
-                // 显示选中的二级分类卡片
-                subcategoryContainers.forEach(container => {
-                    if (container.getAttribute('data-subcategory') === subcategory) {
-                        container.style.display = 'grid';
-                    } else {
-                        container.style.display = 'none';
-                    }
-                });
-            }
+            // 重建标签筛选器，只保留当前二级分类下出现的标签
+            const tagFilters = categorySection.querySelector('.tag-filters');
+            if (tagFilters) renderTagChips(tagFilters, cardFilter.model);
+        }
 
-            // 更新筛选器状态
-            updateTagFiltersForSubcategory(mainCategory, subcategory);
+        // 分类卡片的筛选器：虚拟化分类为 VirtualLinkList，其余为 CardIndex（挂载时创建）
+        function getCardFilter(categorySection) {
+            const cardsContainer = categorySection.querySelector('.cards-container');
+            return cardsContainer && (cardsContainer._virtualLinks || cardsContainer._cardIndex);
         }
 
-        // 更新标签筛选器
-        function updateTagFiltersForSubcategory(mainCategory, subcategory) {
-            const categorySection = document.getElementById(mainCategory);
-            if (!categorySection) return;
+        // 1.1.1 卡片成员索引：标签 -> 升序卡片下标、二级分类 -> 连续下标区间 [start, end)，
+        //       由生成器在构建时计算；筛选只做数组运算，再对可见性变化的卡片切换一次类
+        function mountCardIndex(section) {
+            const container = section.querySelector('.cards-container');
+            const dataScript = container && container.querySelector('script.card-index');
+            if (dataScript && !container._cardIndex && !container.hasAttribute('data-virtual-links')) {
+                container._cardIndex = new CardIndex(container, JSON.parse(dataScript.textContent));
+            }
+        }
 
-            // 获取当前显示的卡片容器
-            let cardsContainer;
-            if (subcategory === '全部') {
-                cardsContainer = categorySection.querySelector('.cards-container');
-            } else {
-                cardsContainer = categorySection.querySelector(`.subcategory-cards[data-subcategory="${subcategory}"]`);
+        // 有序数组中第一个不小于 value 的位置
+        function lowerBound(sorted, value) {
+            let lo = 0;
+            let hi = sorted.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (sorted[mid] < value) lo = mid + 1; else hi = mid;
             }
+            return lo;
+        }
 
-            if (!cardsContainer) return;
+        // 两个升序数组的交集（有序归并）
+        function intersectSorted(a, b) {
+            const result = [];
+            for (let i = 0, j = 0; i < a.length && j < b.length;) {
+                if (a[i] === b[j]) { result.push(a[i]); i++; j++; }
+                else if (a[i] < b[j]) i++;
+                else j++;
+            }
+            return result;
+        }
+
+        // 多选标签筛选模型：CardIndex 和 VirtualLinkList 共用，只维护可见性和各标签计数
+        class TagFilterModel {
+            constructor(data, size) {
+                this.size = size;
+                this.tags = data.tags;
+                this.tagCards = data.tagCards;
+                this.subcategories = data.subcategories;
+                this.tagPositions = new Map(data.tags.map((tag, i) => [tag, i]));
+
+                // 卡片 -> 标签下标（CSR 结构），可见性变化时据此增量更新计数
+                const offsets = new Int32Array(size + 1);
+                this.tagCards.forEach(cards => cards.forEach(card => { offsets[card + 1]++; }));
+                for (let i = 0; i < size; i++) offsets[i + 1] += offsets[i];
+                const fill = offsets.slice(0, size);
+                this.cardTags = new Int32Array(offsets[size]);
+                this.tagCards.forEach((cards, tag) => cards.forEach(card => { this.cardTags[fill[card]++] = tag; }));
+                this.cardTagOffsets = offsets;
+
+                this.subcategory = '全部';
+                this.selected = new Set();
+                this.mode = 'and';
+                this.visible = new Uint8Array(size);
+                this.visibleCounts = new Int32Array(this.tags.length);  // 可见卡片中各标签的卡片数
+                this.rangeCounts = new Int32Array(this.tags.length);    // 当前二级分类中各标签的卡片数
+                this.countRange();
+                this.update();
+            }
 
-            // 收集当前显示卡片的标签
-            const allTags = new Set();
-            const visibleCards = cardsContainer.querySelectorAll('.link-card');
-            visibleCards.forEach(card => {
-                const cardTags = card.getAttribute('data-tags');
-                if (cardTags) {
-                    cardTags.split(',').forEach(tag => {
-                        if (tag.trim()) allTags.add(tag.trim());
-                    });
-                }
-            });
+            range() {
+                return this.subcategory === '全部' ? [0, this.size] : (this.subcategories[this.subcategory] || [0, 0]);
+            }
 
-            // 更新标签筛选器
-            const tagFilters = categorySection.querySelector('.tag-filters');
-            if (tagFilters) {
-                // 重建标签筛选器
-                tagFilters.innerHTML = '<div class="tag-filter active" data-tag="全部">全部</div>';
-                Array.from(allTags).sort().forEach(tag => {
-                    tagFilters.innerHTML += `<div class="tag-filter" data-tag="${tag}">${tag}</div>`;
+            // 二分查找各标签落在当前区间内的卡片数
+            countRange() {
+                const [start, end] = this.range();
+                this.tagCards.forEach((cards, i) => {
+                    this.rangeCounts[i] = lowerBound(cards, end) - lowerBound(cards, start);
                 });
+            }
 
-                // 重新绑定事件
-                initTagFiltersForContainer(tagFilters);
+            // 当前二级分类下出现的标签（保持构建时的排序）
+            getTags() {
+                return this.tags.filter((tag, i) => this.rangeCounts[i] > 0);
             }
-        }
 
-        // 初始化标签筛选器
-        function initTagFiltersForContainer(container) {
-            container.querySelectorAll('.tag-filter').forEach(filter => {
-                filter.addEventListener('click', function() {
-                    const tag = this.getAttribute('data-tag');
-                    const categorySection = container.closest('.category-section');
+            // 标签芯片上的数量：AND 模式为再选中该标签后的结果数，OR 模式为该标签在当前二级分类中的卡片数
+            count(tag) {
+                const i = this.tagPositions.get(tag);
+                if (i === undefined) return 0;
+                return this.mode === 'and' ? this.visibleCounts[i] : this.rangeCounts[i];
+            }
 
-                    // 获取当前激活的二级分类
-                    const activeSubcategory = categorySection.querySelector('.subcategory-item.active');
-                    const subcategory = activeSubcategory ? activeSubcategory.getAttribute('data-subcategory') : '全部';
+            setSubcategory(subcategory) {
+                this.subcategory = subcategory;
+                this.selected.clear();
+                this.countRange();
+                return this.update();
+            }
 
-                    // 获取对应的卡片容器
-                    let cardsContainer;
-                    if (subcategory === '全部') {
-                        cardsContainer = categorySection.querySelector('.cards-container');
-                    } else {
-                        cardsContainer = categorySection.querySelector(`.subcategory-cards[data-subcategory="${subcategory}"]`);
-                    }
+            toggleTag(tag) {
+                if (tag === '全部') this.selected.clear();
+                else if (!this.selected.delete(tag)) this.selected.add(tag);
+                return this.update();
+            }
 
-                    if (!cardsContainer) return;
-
-                    // 更新按钮状态
-                    container.querySelectorAll('.tag-filter').forEach(f => f.classList.remove('active'));
-                    this.classList.add('active');
-
-                    // 筛选卡片
-                    const cards = cardsContainer.querySelectorAll('.link-card');
-                    cards.forEach(card => {
-                        if (tag === '全部') {
-                            card.style.display = 'flex';
-                        } else {
-                            const cardTags = card.getAttribute('data-tags');
-                            if (cardTags && cardTags.includes(tag)) {
-                                card.style.display = 'flex';
-                            } else {
-                                card.style.display = 'none';
-                            }
+            setMode(mode) {
+                this.mode = mode;
+                return this.update();
+            }
+
+            // 重新计算可见卡片，返回可见性发生变化的卡片下标
+            update() {
+                const [start, end] = this.range();
+                const next = new Uint8Array(this.size);
+                const lists = Array.from(this.selected, tag => this.tagCards[this.tagPositions.get(tag)] || []);
+                if (!lists.length) {
+                    next.fill(1, start, end);
+                } else if (this.mode === 'or') {
+                    lists.forEach(cards => {
+                        for (let i = lowerBound(cards, start); i < cards.length && cards[i] < end; i++) {
+                            next[cards[i]] = 1;
                         }
                     });
+                } else {
+                    // AND：从最短的倒排列表出发，依次与其余列表求交集
+                    lists.sort((a, b) => a.length - b.length);
+                    let result = lists[0].slice(lowerBound(lists[0], start), lowerBound(lists[0], end));
+                    for (let i = 1; i < lists.length && result.length; i++) result = intersectSorted(result, lists[i]);
+                    result.forEach(card => { next[card] = 1; });
+                }
+
+                // 只处理可见性变化的卡片，同时增量调整可见计数
+                const changed = [];
+                const { visible, visibleCounts, cardTags, cardTagOffsets } = this;
+                for (let i = 0; i < this.size; i++) {
+                    if (next[i] !== visible[i]) {
+                        changed.push(i);
+                        const delta = next[i] ? 1 : -1;
+                        for (let k = cardTagOffsets[i]; k < cardTagOffsets[i + 1]; k++) {
+                            visibleCounts[cardTags[k]] += delta;
+                        }
+                    }
+                }
+                this.visible = next;
+                return changed;
+            }
+        }
+
+        class CardIndex {
+            constructor(container, data) {
+                this.cards = container.querySelectorAll(':scope > .link-card');
+                this.model = new TagFilterModel(data, this.cards.length);
+            }
+
+            // 只切换可见性发生变化的卡片
+            apply(changed) {
+                const visible = this.model.visible;
+                changed.forEach(i => this.cards[i].classList.toggle('card-hidden', !visible[i]));
+            }
+        }
+        """
+
+    @staticmethod
+    def get_virtual_links_script():
+        """虚拟化链接列表脚本"""
+        return """
+        // 1.2 虚拟化链接列表：链接数据以内嵌 JSON 提供，只为激活分类的可见行生成卡片
+        const virtualLinkLists = [];
+        let virtualLinksObserver = null;
+
+        function initVirtualLinks() {
+            // 所有虚拟列表共用一组滚动和尺寸监听，不随列表数量增加；分类切换由生命周期调度
+            const scheduleAll = () => virtualLinkLists.forEach(list => list.schedule());
+            delegate('scroll', null, scheduleAll);
+            listen(window, 'resize', scheduleAll);
+            // 所在分类显示/隐藏时容器尺寸变化
+            if (window.ResizeObserver) {
+                virtualLinksObserver = new ResizeObserver(entries => {
+                    entries.forEach(entry => entry.target._virtualLinks.schedule());
                 });
+            }
+        }
+
+        // 分类首次激活时创建其中的虚拟列表，返回创建的实例
+        function mountVirtualLinks(section) {
+            const lists = [];
+            section.querySelectorAll('.cards-container[data-virtual-links]').forEach(container => {
+                const dataScript = container.querySelector('script.link-data');
+                const indexScript = container.querySelector('script.card-index');
+                if (dataScript && indexScript && !container._virtualLinks) {
+                    container._virtualLinks = new VirtualLinkList(container, JSON.parse(dataScript.textContent),
+                        JSON.parse(indexScript.textContent));
+                    virtualLinkLists.push(container._virtualLinks);
+                    lists.push(container._virtualLinks);
+                    if (virtualLinksObserver) virtualLinksObserver.observe(container);
+                }
             });
+            return lists;
+        }
+
+        class VirtualLinkList {
+            constructor(container, data, indexData) {
+                this.container = container;
+                this.links = data.links;
+                this.subcategories = data.subcategories;
+                this.model = new TagFilterModel(indexData, this.links.length);
+                this.rowHeight = 0;  // 0 表示尚未测量
+                this.overscanRows = 4;
+                this.pending = false;
+                this.applyFilters();
+                // 滚动和尺寸变化由 initVirtualLinks 统一调度，卡片上的本地文件夹操作由文档级委托处理
+                this.render();
+            }
+
+            // 可见链接由筛选模型决定（链接数据与卡片成员索引顺序一致）
+            applyFilters() {
+                const visible = this.model.visible;
+                this.visible = this.links.filter((link, i) => visible[i]);
+            }
+
+            apply() {
+                this.applyFilters();
+                this.render();
+            }
+
+            setLayout() {
+                this.rowHeight = 0;
+                this.container.style.gridAutoRows = '';
+                this.render();
+            }
+
+            schedule() {
+                if (this.pending) return;
+                this.pending = true;
+                requestAnimationFrame(() => {
+                    this.pending = false;
+                    this.render();
+                });
+            }
+
+            renderCard(link) {
+                const [name, url, description, type, tag, subcategory, local] = link;
+                const action = local ? '打开' : '访问';
+                const tagAttr = tag ? ` data-tags="${tag}"` : '';
+                const subcategoryAttr = subcategory >= 0
+                    ? ` data-subcategory="${this.subcategories[subcategory]}"` : '';
+                return `<div class="link-card" data-is-local="${local ? 'true' : 'false'}" data-original-path="${url}"`
+                    + `${tagAttr}${subcategoryAttr}>`
+                    + `<div class="card-actions ${local ? 'local-folder' : ''}">`
+                    + `<a href="${url}" target="_blank" title="${action} ${name}" class="${local ? 'local-path' : ''}">`
+                    + `<i>${local ? '📁' : '🔗'}</i> ${action}</a>`
+                    + (tag ? `<div class="tag-container"><span class="link-tag">${tag}</span></div>` : '')
+                    + (local
+                        ? `<button class="copy-path-btn" data-path="${url}" title="复制路径"><i>Copy</i></button>` : '')
+                    + '</div><div class="card-content"><div class="card-info"><div class="card-header">'
+                    + `<h3>${name}</h3><span class="link-type">${type}</span></div>`
+                    + `<p class="description">${description}</p></div></div></div>`;
+            }
+
+            render() {
+                const container = this.container;
+                // 未激活的分类不保留任何卡片
+                if (!container.offsetParent) {
+                    if (container.childElementCount) container.innerHTML = '';
+                    return;
+                }
+
+                const style = getComputedStyle(container);
+                const columns = Math.max(1, style.gridTemplateColumns.split(' ').filter(Boolean).length);
+                const gap = parseFloat(style.rowGap) || 0;
+                const rowStride = (this.rowHeight || 150) + gap;
+                const totalRows = Math.ceil(this.visible.length / columns);
+
+                // 容器顶部相对视口的偏移决定可见行范围
+                const offset = -container.getBoundingClientRect().top;
+                const firstRow = Math.max(0, Math.floor(offset / rowStride) - this.overscanRows);
+                const lastRow = Math.min(totalRows,
+                    Math.ceil((offset + window.innerHeight) / rowStride) + this.overscanRows);
+
+                container.style.paddingTop = (firstRow * rowStride) + 'px';
+                container.style.paddingBottom = (Math.max(0, totalRows - lastRow) * rowStride) + 'px';
+                container.innerHTML = this.visible
+                    .slice(firstRow * columns, Math.max(firstRow, lastRow) * columns)
+                    .map(link => this.renderCard(link))
+                    .join('');
+
+                // 以实际渲染出的最高卡片作为统一行高，行高变化后按新行高重新计算
+                let tallest = 0;
+                for (const card of container.children) {
+                    tallest = Math.max(tallest, card.offsetHeight);
+                }
+                if (tallest > this.rowHeight) {
+                    this.rowHeight = tallest;
+                    container.style.gridAutoRows = tallest + 'px';
+                    this.schedule();
+                }
+            }
         }
         """
 
@@ -242,19 +660,17 @@ class JavaScriptManager:
         // 2. 发布说明功能
         function initReleaseNotes() {
             // 发布类型卡片点击事件
-            document.querySelectorAll('.release-type-card').forEach(card => {
-                card.addEventListener('click', (e) => {
-                    e.preventDefault();
+            delegate('click', '.release-type-card', (e, card) => {
+                e.preventDefault();
 
-                    // 移除所有active类
-                    document.querySelectorAll('.release-type-card').forEach(c => c.classList.remove('active'));
+                // 移除所有active类
+                document.querySelectorAll('.release-type-card').forEach(c => c.classList.remove('active'));
 
-                    // 添加active类
-                    card.classList.add('active');
+                // 添加active类
+                card.classList.add('active');
 
-                    const releaseType = card.getAttribute('data-release-type');
-                    showReleaseTimeline(releaseType);
-                });
+                const releaseType = card.getAttribute('data-release-type');
+                showReleaseTimeline(releaseType);
             });
         }
 
@@ -279,32 +695,24 @@ class JavaScriptManager:
         return """
         // 3. 布局切换功能
         function initLayoutControls() {
-            document.querySelectorAll('.layout-btn').forEach(btn => {
-                btn.addEventListener('click', function() {
-                    const layout = this.getAttribute('data-layout');
-                    const categorySection = this.closest('.category-section');
-
-                    // 更新按钮状态
-                    this.parentElement.querySelectorAll('.layout-btn').forEach(b => b.classList.remove('active'));
-                    this.classList.add('active');
-
-                    // 获取当前激活的二级分类
-                    const activeSubcategory = categorySection.querySelector('.subcategory-item.active');
-                    const subcategory = activeSubcategory ? activeSubcategory.getAttribute('data-subcategory') : '全部';
-
-                    // 获取对应的卡片容器
-                    let cardsContainer;
-                    if (subcategory === '全部') {
-                        cardsContainer = categorySection.querySelector('.cards-container');
-                    } else {
-                        cardsContainer = categorySection.querySelector(`.subcategory-cards[data-subcategory="${subcategory}"]`);
-                    }
-
-                    if (cardsContainer) {
-                        // 切换布局
-                        cardsContainer.className = (subcategory === '全部' ? 'cards-container ' : 'subcategory-cards ') + layout + '-layout';
+            delegate('click', '.layout-btn', (e, btn) => {
+                const layout = btn.getAttribute('data-layout');
+                const categorySection = btn.closest('.category-section');
+
+                // 更新按钮状态
+                btn.parentElement.querySelectorAll('.layout-btn').forEach(b => b.classList.remove('active'));
+                btn.classList.add('active');
+
+                // 所有二级分类共用同一个卡片容器
+                const cardsContainer = categorySection.querySelector('.cards-container');
+                if (cardsContainer) {
+                    // 切换布局
+                    cardsContainer.className = 'cards-container ' + layout + '-layout';
+                    if (cardsContainer._virtualLinks) {
+                        // 列数和行高随布局变化，重新测量后渲染
+                        cardsContainer._virtualLinks.setLayout();
                     }
-                });
+                }
             });
         }
         """
@@ -313,20 +721,63 @@ class JavaScriptManager:
     def get_tag_filters_script():
         """标签筛选脚本"""
         return """
-        // 4. 标签筛选功能
+        // 4. 标签筛选功能：可多选，按 AND（同时满足）或 OR（任一满足）组合
         function initTagFilters() {
-            // 在主分类切换时初始化标签筛选器
-            document.addEventListener('categoryChanged', function() {
-                setTimeout(() => {
-                    const activeCategory = document.querySelector('.category-section.active');
-                    if (activeCategory) {
-                        const tagFilters = activeCategory.querySelector('.tag-filters');
-                        if (tagFilters) {
-                            initTagFiltersForContainer(tagFilters);
-                        }
-                    }
-                }, 100);
+            // 筛选器按二级分类重建后仍由同一个委托处理；标签与二级分类的交集由卡片筛选器计算
+            delegate('click', '.tag-filter', (e, filter) => {
+                const container = filter.closest('.tag-filters');
+                const cardFilter = getCardFilter(container.closest('.category-section'));
+                if (!cardFilter) return;
+
+                cardFilter.apply(cardFilter.model.toggleTag(filter.getAttribute('data-tag')));
+                refreshTagChips(container, cardFilter.model);
+            });
+
+            delegate('click', '.tag-mode', (e, button) => {
+                const container = button.closest('.tag-filters');
+                const cardFilter = getCardFilter(container.closest('.category-section'));
+                if (!cardFilter) return;
+
+                const model = cardFilter.model;
+                cardFilter.apply(model.setMode(model.mode === 'and' ? 'or' : 'and'));
+                refreshTagChips(container, model);
+            });
+        }
+
+        function tagModeLabel(mode) {
+            return mode === 'and' ? '同时满足 (AND)' : '任一满足 (OR)';
+        }
+
+        // 按筛选模型重建标签芯片（切换二级分类时）
+        function renderTagChips(container, model) {
+            const chips = model.getTags()
+                .map(tag => `<div class="tag-filter" data-tag="${tag}">${tag}`
+                    + `<span class="tag-count">${model.count(tag)}</span></div>`);
+            container.innerHTML = '<div class="tag-filter active" data-tag="全部">全部</div>' + chips.join('')
+                + `<button class="tag-mode" data-mode="${model.mode}" title="点击切换多选标签的组合方式">`
+                + `${tagModeLabel(model.mode)}</button>`;
+        }
+
+        // 选择变化后更新芯片的选中状态，只改写数量发生变化的计数
+        function refreshTagChips(container, model) {
+            container.querySelectorAll('.tag-filter').forEach(chip => {
+                const tag = chip.getAttribute('data-tag');
+                if (tag === '全部') {
+                    chip.classList.toggle('active', !model.selected.size);
+                    return;
+                }
+                const selected = model.selected.has(tag);
+                const count = model.count(tag);
+                const counter = chip.querySelector('.tag-count');
+                if (counter && counter.textContent !== String(count)) counter.textContent = count;
+                chip.classList.toggle('active', selected);
+                chip.classList.toggle('empty', !selected && count === 0);
             });
+            const button = container.querySelector('.tag-mode');
+            if (button && button.getAttribute('data-mode') !== model.mode) {
+                button.setAttribute('data-mode', model.mode);
+                button.textContent = tagModeLabel(model.mode);
+            }
         }
         """
 
@@ -336,34 +787,28 @@ class JavaScriptManager:
         return """
         // 5. 本地文件夹功能
         function initLocalFolderFeatures() {
-            // 复制路径功能
-            document.querySelectorAll('.copy-path-btn').forEach(btn => {
-                btn.addEventListener('click', function(e) {
-                    e.stopPropagation();
-                    const path = this.getAttribute('data-path');
-                    copyToClipboard(path);
-                    showNotification('路径已复制到剪贴板', 'success');
-                });
+            // 复制路径功能（同样适用于虚拟列表随滚动生成的卡片）
+            delegate('click', '.copy-path-btn', (e, btn) => {
+                e.stopPropagation();
+                const path = btn.getAttribute('data-path');
+                copyToClipboard(path);
+                showNotification('路径已复制到剪贴板', 'success');
             });
 
             // 本地文件夹右键菜单
-            document.querySelectorAll('.card-actions.local-folder a.local-path').forEach(link => {
-                link.addEventListener('contextmenu', function(e) {
-                    e.preventDefault();
-                    const card = this.closest('.link-card');
-                    const path = card.getAttribute('data-original-path');
-                    showFolderOptions(path);
-                });
+            delegate('contextmenu', '.card-actions.local-folder a.local-path', (e, link) => {
+                e.preventDefault();
+                const card = link.closest('.link-card');
+                const path = card.getAttribute('data-original-path');
+                showFolderOptions(path);
             });
 
             // 双击卡片标题复制路径（仅限本地文件夹）
-            document.querySelectorAll('.link-card[data-is-local="true"] h3').forEach(title => {
-                title.addEventListener('dblclick', function() {
-                    const card = this.closest('.link-card');
-                    const path = card.getAttribute('data-original-path');
-                    copyToClipboard(path);
-                    showNotification('路径已复制到剪贴板', 'success');
-                });
+            delegate('dblclick', '.link-card[data-is-local="true"] h3', (e, title) => {
+                const card = title.closest('.link-card');
+                const path = card.getAttribute('data-original-path');
+                copyToClipboard(path);
+                showNotification('路径已复制到剪贴板', 'success');
             });
         }
         """
@@ -375,74 +820,269 @@ class JavaScriptManager:
         // 6. 版本接口功能
         function initInterfaceRoutes() {
             // 视图切换功能
-            document.querySelectorAll('.view-filter').forEach(filter => {
-                filter.addEventListener('click', function() {
-                    const view = this.getAttribute('data-view');
-                    const container = this.closest('.interface-route-container');
-                    const filters = container.querySelectorAll('.view-filter');
-
-                    // 更新按钮状态
-                    filters.forEach(f => f.classList.remove('active'));
-                    this.classList.add('active');
-
-                    // 切换视图内容
-                    const viewContents = container.querySelectorAll('.view-content');
-                    viewContents.forEach(content => {
-                        if (content.getAttribute('data-view') === view) {
-                            content.style.display = 'block';
-                        } else {
-                            content.style.display = 'none';
-                        }
-                    });
+            delegate('click', '.view-filter', (e, filter) => {
+                const view = filter.getAttribute('data-view');
+                const container = filter.closest('.interface-route-container');
+                const filters = container.querySelectorAll('.view-filter');
+
+                // 更新按钮状态
+                filters.forEach(f => f.classList.remove('active'));
+                filter.classList.add('active');
+
+                // 懒渲染模式：两个视图共用同一份数据，只切换行的组织方式
+                if (container._virtualTable) {
+                    container._virtualTable.setView(view);
+                    return;
+                }
+
+                // 切换视图内容
+                const viewContents = container.querySelectorAll('.view-content');
+                viewContents.forEach(content => {
+                    if (content.getAttribute('data-view') === view) {
+                        content.style.display = 'block';
+                    } else {
+                        content.style.display = 'none';
+                    }
                 });
             });
 
             // 分支筛选功能
-            document.querySelectorAll('.branch-filter').forEach(filter => {
-                filter.addEventListener('click', function() {
-                    const branch = this.getAttribute('data-branch');
-                    const container = this.closest('.interface-route-container');
-                    const filters = container.querySelectorAll('.branch-filter');
-
-                    // 更新按钮状态
-                    filters.forEach(f => f.classList.remove('active'));
-                    this.classList.add('active');
-
-                    // 筛选表格行
-                    const activeView = container.querySelector('.view-filter.active').getAttribute('data-view');
-                    const tableContainer = container.querySelector(`.view-content[data-view="${activeView}"]`);
-
-                    if (branch === 'all') {
-                        // 显示所有行
+            delegate('click', '.branch-filter', (e, filter) => {
+                const branch = filter.getAttribute('data-branch');
+                const container = filter.closest('.interface-route-container');
+                const filters = container.querySelectorAll('.branch-filter');
+
+                // 更新按钮状态
+                filters.forEach(f => f.classList.remove('active'));
+                filter.classList.add('active');
+
+                if (container._virtualTable) {
+                    container._virtualTable.setBranch(branch);
+                    return;
+                }
+
+                // 筛选表格行
+                const activeView = container.querySelector('.view-filter.active').getAttribute('data-view');
+                const tableContainer = container.querySelector(`.view-content[data-view="${activeView}"]`);
+
+                if (branch === 'all') {
+                    // 显示所有行
+                    tableContainer.querySelectorAll('tr[data-branch]').forEach(row => {
+                        row.style.display = '';
+                    });
+                    tableContainer.querySelectorAll('.branch-group').forEach(group => {
+                        group.style.display = 'block';
+                    });
+                } else {
+                    if (activeView === 'unified') {
+                        // 统一视图：筛选行
                         tableContainer.querySelectorAll('tr[data-branch]').forEach(row => {
-                            row.style.display = '';
+                            if (row.getAttribute('data-branch') === branch) {
+                                row.style.display = '';
+                            } else {
+                                row.style.display = 'none';
+                            }
                         });
+                    } else {
+                        // 分组视图：筛选分组
                         tableContainer.querySelectorAll('.branch-group').forEach(group => {
-                            group.style.display = 'block';
+                            if (group.getAttribute('data-branch') === branch) {
+                                group.style.display = 'block';
+                            } else {
+                                group.style.display = 'none';
+                            }
                         });
-                    } else {
-                        if (activeView === 'unified') {
-                            // 统一视图：筛选行
-                            tableContainer.querySelectorAll('tr[data-branch]').forEach(row => {
-                                if (row.getAttribute('data-branch') === branch) {
-                                    row.style.display = '';
-                                } else {
-                                    row.style.display = 'none';
-                                }
-                            });
-                        } else {
-                            // 分组视图：筛选分组
-                            tableContainer.querySelectorAll('.branch-group').forEach(group => {
-                                if (group.getAttribute('data-branch') === branch) {
-                                    group.style.display = 'block';
-                                } else {
-                                    group.style.display = 'none';
-                                }
-                            });
-                        }
                     }
+                }
+            });
+
+            if (typeof initVirtualInterfaceTables === 'function') initVirtualInterfaceTables();
+        }
+        """
+
+    @staticmethod
+    def get_virtual_interface_table_script():
+        """懒渲染版本接口矩阵脚本（lazy_interfaces）"""
+        return """
+        // 6.1 懒渲染的版本仓库
+        let interfaceViewportObserver = null;
+
+        function initVirtualInterfaceTables() {
+            // 虚拟表格视口滚动（scroll 不冒泡，由捕获阶段的委托分发）
+            delegate('scroll', '.interface-virtual-viewport', (e, viewport) => {
+                const container = viewport.closest('.interface-route-container');
+                if (container._virtualTable) container._virtualTable.schedule();
+            });
+
+            // 所在分类从隐藏变为显示时视口尺寸变化，需要重新计算可见范围
+            if (window.ResizeObserver) {
+                interfaceViewportObserver = new ResizeObserver(entries => {
+                    entries.forEach(entry => {
+                        entry.target.closest('.interface-route-container')._virtualTable.schedule();
+                    });
                 });
+            }
+        }
+
+        // 懒渲染的版本仓库：分类首次激活时从内嵌 JSON 构建虚拟表格，返回创建的实例
+        function mountVirtualInterfaceTables(section) {
+            const tables = [];
+            section.querySelectorAll('.interface-route-container[data-virtual-route]').forEach(container => {
+                const dataScript = container.querySelector('.interface-route-data');
+                if (dataScript && !container._virtualTable) {
+                    container._virtualTable = new VirtualInterfaceTable(container, JSON.parse(dataScript.textContent));
+                    tables.push(container._virtualTable);
+                    if (interfaceViewportObserver) interfaceViewportObserver.observe(container._virtualTable.viewport);
+                }
             });
+            return tables;
+        }
+
+        // 6.2 虚拟化接口矩阵：只渲染视口内可见的行和接口列
+        class VirtualInterfaceTable {
+            constructor(container, data) {
+                this.data = data;
+                this.viewport = container.querySelector('.interface-virtual-viewport');
+                this.sizer = container.querySelector('.interface-virtual-sizer');
+                this.table = container.querySelector('.interface-virtual-table');
+                this.view = 'unified';
+                this.branch = 'all';
+                this.rowHeight = 44;
+                this.headerHeight = 46;
+                this.columnWidth = 120;
+                this.overscan = 6;
+                // 固定列：版本、分支、日期、标签、父版本、合并目标、描述（分组视图不显示分支列）
+                this.fixedColumns = [
+                    ['版本', 140], ['分支', 140], ['日期', 120], ['标签', 110],
+                    ['父版本', 120], ['合并目标', 120], ['描述', 260]
+                ];
+                this.pending = false;
+                this.buildRows();
+                // 视口滚动和尺寸变化由 initInterfaceRoutes 统一调度
+                this.render();
+            }
+
+            setView(view) {
+                this.view = view;
+                this.buildRows();
+                this.viewport.scrollTop = 0;
+                this.render();
+            }
+
+            setBranch(branch) {
+                this.branch = branch;
+                this.buildRows();
+                this.viewport.scrollTop = 0;
+                this.render();
+            }
+
+            // 行列表：统一视图为按日期排序的版本；分组视图按分支分组并插入分组标题行
+            buildRows() {
+                const data = this.data;
+                const branchAllowed = index => this.branch === 'all' || data.branches[index][0] === this.branch;
+                this.rows = [];
+                if (this.view === 'grouped') {
+                    const groups = data.branches.slice(0, data.grouped).map(() => []);
+                    data.versions.forEach(version => {
+                        if (version[1] < data.grouped) groups[version[1]].push(version);
+                    });
+                    groups.forEach((versions, index) => {
+                        if (!versions.length || !branchAllowed(index)) return;
+                        this.rows.push({ group: index });
+                        versions.forEach(version => this.rows.push({ version: version }));
+                    });
+                } else {
+                    data.versions.forEach(version => {
+                        if (branchAllowed(version[1])) this.rows.push({ version: version });
+                    });
+                }
+                this.columns = this.view === 'grouped'
+                    ? this.fixedColumns.filter(column => column[0] !== '分支')
+                    : this.fixedColumns;
+                this.fixedWidth = this.columns.reduce((sum, column) => sum + column[1], 0);
+                this.sizer.style.height = (this.headerHeight + this.rows.length * this.rowHeight) + 'px';
+                this.sizer.style.width = (this.fixedWidth + data.interfaces.length * this.columnWidth) + 'px';
+            }
+
+            schedule() {
+                if (this.pending) return;
+                this.pending = true;
+                requestAnimationFrame(() => {
+                    this.pending = false;
+                    this.render();
+                });
+            }
+
+            render() {
+                const data = this.data;
+                const viewport = this.viewport;
+                const height = viewport.clientHeight || 600;
+                const width = viewport.clientWidth || 1200;
+
+                const firstRow = Math.max(0,
+                    Math.floor((viewport.scrollTop - this.headerHeight) / this.rowHeight) - this.overscan);
+                const lastRow = Math.min(this.rows.length,
+                    Math.ceil((viewport.scrollTop + height) / this.rowHeight) + this.overscan);
+                const scrolledColumns = Math.max(0, viewport.scrollLeft - this.fixedWidth) / this.columnWidth;
+                const firstColumn = Math.max(0, Math.floor(scrolledColumns) - 2);
+                const lastColumn = Math.min(data.interfaces.length,
+                    Math.ceil(scrolledColumns + width / this.columnWidth) + 2);
+                const leftPad = firstColumn * this.columnWidth;
+                const rightPad = (data.interfaces.length - lastColumn) * this.columnWidth;
+                const spanCount = this.columns.length + (lastColumn - firstColumn)
+                    + (leftPad ? 1 : 0) + (rightPad ? 1 : 0);
+
+                const html = ['<thead><tr>'];
+                this.columns.forEach(column => html.push(`<th style="width: ${column[1]}px;">${column[0]}</th>`));
+                if (leftPad) html.push(`<th style="width: ${leftPad}px;"></th>`);
+                for (let c = firstColumn; c < lastColumn; c++) {
+                    html.push(`<th style="width: ${this.columnWidth}px;">${data.interfaces[c]}</th>`);
+                }
+                if (rightPad) html.push(`<th style="width: ${rightPad}px;"></th>`);
+                html.push('</tr></thead><tbody>');
+
+                for (let r = firstRow; r < lastRow; r++) {
+                    const row = this.rows[r];
+                    if (row.group !== undefined) {
+                        const branch = data.branches[row.group];
+                        html.push(`<tr class="interface-virtual-group">`
+                            + `<td colspan="${spanCount}" style="background: ${branch[2]};">`
+                            + `<span>${branch[1]}</span><span>${branch[3]}</span></td></tr>`);
+                        continue;
+                    }
+                    const version = row.version;
+                    const branch = data.branches[version[1]];
+                    html.push(`<tr data-branch="${branch[0]}"><td><span class="version-id">${version[0]}</span></td>`);
+                    if (this.view !== 'grouped') {
+                        html.push(`<td><div class="branch-cell">`
+                            + `<div class="branch-color" style="background: ${branch[2]};"></div>`
+                            + `<span class="branch-name">${branch[1]}</span></div></td>`);
+                    }
+                    html.push(`<td>${version[2]}</td>`);
+                    html.push(`<td>${version[3] ? `<span class="tag ${version[4]}">${version[3]}</span>` : '-'}</td>`);
+                    html.push(`<td>${version[5]}</td><td>${version[6]}</td>`
+                        + `<td title="${version[7].replace(/"/g, '&quot;')}">${version[7]}</td>`);
+                    if (leftPad) html.push('<td></td>');
+                    // 稀疏单元格展开为可见列范围内的值
+                    const cells = version[8];
+                    const visible = {};
+                    for (let i = 0; i < cells.length; i += 2) {
+                        if (cells[i] >= firstColumn && cells[i] < lastColumn) {
+                            visible[cells[i]] = data.values[cells[i + 1]];
+                        }
+                    }
+                    for (let c = firstColumn; c < lastColumn; c++) {
+                        html.push(`<td>${visible[c] !== undefined ? visible[c] : '-'}</td>`);
+                    }
+                    if (rightPad) html.push('<td></td>');
+                    html.push('</tr>');
+                }
+                html.push('</tbody>');
+
+                this.table.style.top = (firstRow * this.rowHeight) + 'px';
+                this.table.style.width = this.sizer.style.width;
+                this.table.innerHTML = html.join('');
+            }
         }
         """
 
@@ -452,36 +1092,21 @@ class JavaScriptManager:
         return """
         // 7. 图标引用功能
         function initIconReference() {
-            // 统一复制函数
-            function copyIcon(value) {
-                copyToClipboard(value);
-                if (value.length <= 2) {
-                    // 可能是emoji
-                    showNotification(`Emoji已复制: ${value}`, 'success');
+            // 图标项点击事件
+            delegate('click', '.icon-item', (e, iconItem) => {
+                if (iconItem.classList.contains('svg-item')) {
+                    // SVG图标：复制ID
+                    const iconId = iconItem.getAttribute('data-icon-id');
+                    if (iconId) {
+                        copyToClipboard(iconId);
+                        showNotification(`SVG图标ID已复制: ${iconId}`, 'success');
+                    }
                 } else {
-                    // 可能是SVG ID
-                    showNotification(`SVG图标ID已复制: ${value}`, 'success');
-                }
-            }
-
-            // 修改图标项点击事件
-            document.addEventListener('click', (e) => {
-                const iconItem = e.target.closest('.icon-item');
-                if (iconItem) {
-                    if (iconItem.classList.contains('svg-item')) {
-                        // SVG图标：复制ID
-                        const iconId = iconItem.getAttribute('data-icon-id');
-                        if (iconId) {
-                            copyToClipboard(iconId);
-                            showNotification(`SVG图标ID已复制: ${iconId}`, 'success');
-                        }
-                    } else {
-                        // Emoji图标：复制emoji
-                        const icon = iconItem.getAttribute('data-icon');
-                        if (icon) {
-                            copyToClipboard(icon);
-                            showNotification(`Emoji已复制: ${icon}`, 'success');
-                        }
+                    // Emoji图标：复制emoji
+                    const icon = iconItem.getAttribute('data-icon');
+                    if (icon) {
+                        copyToClipboard(icon);
+                        showNotification(`Emoji已复制: ${icon}`, 'success');
                     }
                 }
             });
@@ -495,19 +1120,13 @@ class JavaScriptManager:
         // 8. 使用提示功能
         function initUsageTooltip() {
             // 简洁版使用说明功能
-            function toggleUsageTooltip() {
+            delegate('click', '.usage-help', () => {
                 const tooltip = document.getElementById('usageTooltip');
                 tooltip.classList.toggle('show');
-            }
-
-            // 绑定点击事件
-            const helpBtn = document.querySelector('.usage-help');
-            if (helpBtn) {
-                helpBtn.addEventListener('click', toggleUsageTooltip);
-            }
+            });
 
-            // 点击页面其他地方关闭工具提示
-            document.addEventListener('click', (e) => {
+            // 点击页面其他地方关闭工具提示（ESC 关闭由键盘快捷键处理）
+            delegate('click', null, (e) => {
                 const tooltip = document.getElementById('usageTooltip');
                 const helpBtn = document.querySelector('.usage-help');
 
@@ -517,16 +1136,6 @@ class JavaScriptManager:
                     tooltip.classList.remove('show');
                 }
             });
-
-            // ESC键关闭工具提示
-            document.addEventListener('keydown', (e) => {
-                if (e.key === 'Escape') {
-                    const tooltip = document.getElementById('usageTooltip');
-                    if (tooltip) {
-                        tooltip.classList.remove('show');
-                    }
-                }
-            });
         }
         """
 
@@ -536,7 +1145,7 @@ class JavaScriptManager:
         return """
         // 9. 键盘快捷键功能
         function initKeyboardShortcuts() {
-            document.addEventListener('keydown', (e) => {
+            delegate('keydown', null, (e) => {
                 // Alt + 数字 切换分类
                 if (e.altKey) {
                     const categories = Array.from(document.querySelectorAll('.nav-item'));
@@ -558,6 +1167,341 @@ class JavaScriptManager:
         }
         """
 
+    @staticmethod
+    def get_search_script():
+        """全局搜索脚本"""
+        return """
+        // 11. 全局搜索：基于构建时生成的倒排索引（页面中未嵌入索引时不启用）
+        class SearchIndex {
+            constructor(data) {
+                this.docs = data.docs;
+                this.terms = data.terms;
+                this.postings = data.postings;
+                this.decoded = new Map();
+                this.lowerTitles = null;
+                this.tags = data.tags || [];
+                this.tagPostings = data.tagPostings || [];
+                this.decodedTags = new Map();
+                this.lowerTags = null;
+            }
+
+            // 查询中的 #标签（含空格的标签写作 #"标签"）为标签条件，默认同时满足，出现 | 时满足任一
+            static parseQuery(query) {
+                const tags = [];
+                const text = query.replace(/#(?:"([^"]+)"|([^\\s#|"]+))/g, (match, quoted, plain) => {
+                    tags.push(quoted || plain);
+                    return ' ';
+                });
+                return { text, tags, mode: tags.length > 1 && text.includes('|') ? 'or' : 'and' };
+            }
+
+            // 与构建端一致的分词：英文数字按词，中日韩文字按单字和相邻双字
+            static tokenize(text) {
+                const tokens = [];
+                (text.toLowerCase().match(/[0-9a-z]+|[\u3400-\u9fff\uf900-\ufaff]+/g) || []).forEach(run => {
+                    if (run.charCodeAt(0) < 128) {
+                        tokens.push({ term: run, prefix: true });
+                    } else if (run.length === 1) {
+                        tokens.push({ term: run, prefix: false });
+                    } else {
+                        for (let i = 0; i < run.length - 1; i++) {
+                            tokens.push({ term: run.slice(i, i + 2), prefix: false });
+                        }
+                    }
+                });
+                return tokens;
+            }
+
+            // 倒排列表以差值编码存储，首次使用时解码
+            static decode(deltas) {
+                const list = new Int32Array(deltas.length);
+                let value = 0;
+                for (let i = 0; i < deltas.length; i++) {
+                    value += deltas[i];
+                    list[i] = value;
+                }
+                return list;
+            }
+
+            posting(termIndex) {
+                let list = this.decoded.get(termIndex);
+                if (!list) {
+                    list = SearchIndex.decode(this.postings[termIndex]);
+                    this.decoded.set(termIndex, list);
+                }
+                return list;
+            }
+
+            tagPosting(tagIndex) {
+                let list = this.decodedTags.get(tagIndex);
+                if (!list) {
+                    list = SearchIndex.decode(this.tagPostings[tagIndex]);
+                    this.decodedTags.set(tagIndex, list);
+                }
+                return list;
+            }
+
+            // 合并多个倒排列表（并集），结果保持升序
+            union(lists) {
+                if (lists.length === 1) return lists[0];
+                const marks = new Uint8Array(this.docs.length);
+                let count = 0;
+                for (const list of lists) {
+                    for (const doc of list) {
+                        if (!marks[doc]) { marks[doc] = 1; count++; }
+                    }
+                }
+                const merged = new Int32Array(count);
+                for (let doc = 0, i = 0; i < count; doc++) {
+                    if (marks[doc]) merged[i++] = doc;
+                }
+                return merged;
+            }
+
+            // 返回第一个不小于 term 的词项下标
+            lowerBound(term) {
+                let lo = 0;
+                let hi = this.terms.length;
+                while (lo < hi) {
+                    const mid = (lo + hi) >> 1;
+                    if (this.terms[mid] < term) lo = mid + 1; else hi = mid;
+                }
+                return lo;
+            }
+
+            // 英文按前缀匹配（合并多个词项的倒排列表），中文双字精确匹配
+            match(token) {
+                const start = this.lowerBound(token.term);
+                if (!token.prefix) {
+                    return this.terms[start] === token.term ? this.posting(start) : new Int32Array(0);
+                }
+                const end = this.lowerBound(token.term + '\uffff');
+                const lists = [];
+                for (let t = start; t < end; t++) lists.push(this.posting(t));
+                return lists.length ? this.union(lists) : new Int32Array(0);
+            }
+
+            // 标签不区分大小写：存在同名标签时精确匹配，否则合并所有以其开头的标签
+            matchTag(name) {
+                this.lowerTags = this.lowerTags || this.tags.map(tag => tag.toLowerCase());
+                const needle = name.toLowerCase();
+                const start = lowerBound(this.lowerTags, needle);
+                let end = start;
+                while (end < this.lowerTags.length && this.lowerTags[end] === needle) end++;
+                if (end === start) end = lowerBound(this.lowerTags, needle + '\uffff');
+                const lists = [];
+                for (let t = start; t < end; t++) lists.push(this.tagPosting(t));
+                return lists.length ? this.union(lists) : new Int32Array(0);
+            }
+
+            // 结果中出现最多的其他标签及其结果数，供继续追加标签条件（覆盖全部结果的标签无法再缩小范围，不列出）
+            tagFacets(result, selected, limit = 12) {
+                const marks = new Uint8Array(this.docs.length);
+                result.forEach(doc => { marks[doc] = 1; });
+                const exclude = new Set(selected.map(tag => tag.toLowerCase()));
+                const facets = [];
+                this.tags.forEach((tag, i) => {
+                    if (exclude.has(tag.toLowerCase())) return;
+                    let count = 0;
+                    for (const doc of this.tagPosting(i)) count += marks[doc];
+                    if (count && count < result.length) facets.push([tag, count]);
+                });
+                return facets.sort((a, b) => b[1] - a[1]).slice(0, limit);
+            }
+
+            search(query, limit = 50) {
+                const { text, tags, mode } = SearchIndex.parseQuery(query);
+                const tokens = SearchIndex.tokenize(text);
+                if (!tokens.length && !tags.length) return { total: 0, results: [], facets: [] };
+
+                const lists = tokens.map(token => this.match(token));
+                if (tags.length) {
+                    const tagLists = tags.map(tag => this.matchTag(tag));
+                    if (mode === 'or') lists.push(this.union(tagLists)); else lists.push(...tagLists);
+                }
+
+                // 从最短的倒排列表开始，依次与更长的列表做有序归并求交集
+                lists.sort((a, b) => a.length - b.length);
+                let result = lists[0];
+                for (let i = 1; i < lists.length && result.length; i++) {
+                    const other = lists[i];
+                    const next = new Int32Array(result.length);
+                    let count = 0;
+                    for (let a = 0, b = 0; a < result.length && b < other.length;) {
+                        if (result[a] === other[b]) { next[count++] = result[a]; a++; b++; }
+                        else if (result[a] < other[b]) a++;
+                        else b++;
+                    }
+                    result = next.subarray(0, count);
+                }
+
+                // 标题直接包含查询词的结果排在前面，凑满 limit 条即停止扫描
+                const needle = text.trim().toLowerCase();
+                this.lowerTitles = this.lowerTitles || this.docs.map(doc => doc[1].toLowerCase());
+                const titleHits = [];
+                const others = [];
+                for (let i = 0; i < result.length && titleHits.length < limit; i++) {
+                    const doc = result[i];
+                    if (this.lowerTitles[doc].includes(needle)) titleHits.push(doc);
+                    else if (others.length < limit) others.push(doc);
+                }
+                return {
+                    total: result.length,
+                    results: titleHits.concat(others).slice(0, limit).map(doc => this.docs[doc]),
+                    facets: tags.length ? this.tagFacets(result, tags) : []
+                };
+            }
+        }
+
+        function initGlobalSearch() {
+            const input = document.getElementById('globalSearch');
+            const panel = document.getElementById('globalSearchResults');
+            const dataScript = document.getElementById('searchIndexData');
+            if (!input || !panel || !dataScript) return;
+            const searchInput = '#globalSearch';
+
+            const kinds = [['🔗', '链接'], ['🧩', '模块'], ['📋', '版本'], ['🔌', '接口']];
+            let index = null;
+            let pending = 0;
+
+            const run = () => {
+                pending = 0;
+                const query = input.value.trim();
+                if (!query) {
+                    panel.classList.remove('show');
+                    panel.innerHTML = '';
+                    return;
+                }
+                index = index || new SearchIndex(JSON.parse(dataScript.textContent));
+                const started = performance.now();
+                const { total, results, facets } = index.search(query);
+                const elapsed = (performance.now() - started).toFixed(1);
+
+                const { tags, mode } = SearchIndex.parseQuery(query);
+                const condition = tags.length ? ` · 标签${mode === 'or' ? '任一满足' : '同时满足'}: ${tags.join('、')}` : '';
+                const html = [`<div class="search-summary">找到 ${total} 条结果 · ${elapsed} ms${condition}</div>`];
+                if (facets.length) {
+                    const facetHtml = facets.map(([tag, count]) =>
+                        `<span class="search-facet" data-tag="${tag}">#${tag}<b>${count}</b></span>`);
+                    html.push('<div class="search-facets">' + facetHtml.join('') + '</div>');
+                }
+                results.forEach(([kind, title, detail, section, url]) => {
+                    const [icon, label] = kinds[kind];
+                    const body = `<span class="search-kind">${icon} ${label}</span>`
+                        + `<span class="search-title">${title}</span>`
+                        + `<span class="search-detail">${detail || ''}</span>`
+                        + `<span class="search-section">${section}</span>`;
+                    html.push(url
+                        ? `<a class="search-result" href="${url}" target="_blank">${body}</a>`
+                        : `<div class="search-result" data-section="${section}">${body}</div>`);
+                });
+                panel.innerHTML = html.join('');
+                panel.classList.add('show');
+            };
+
+            delegate('input', searchInput, () => {
+                if (!pending) pending = requestAnimationFrame(run);
+            });
+            delegate('keydown', searchInput, e => {
+                if (e.key === 'Escape') {
+                    input.value = '';
+                    run();
+                    input.blur();
+                }
+            });
+
+            // 点击相关标签，追加为标签条件
+            delegate('click', '#globalSearchResults .search-facet', (e, facet) => {
+                const tag = facet.getAttribute('data-tag');
+                input.value = `${input.value.trim()} ${/[\\s#|]/.test(tag) ? `#"${tag}"` : `#${tag}`}`;
+                run();
+                input.focus();
+            });
+
+            // 非链接结果点击后切换到所在分类
+            delegate('click', '#globalSearchResults .search-result[data-section]', (e, result) => {
+                const section = result.getAttribute('data-section');
+                const navItem = Array.from(document.querySelectorAll('.nav-item'))
+                    .find(item => item.getAttribute('data-category') === section);
+                if (navItem) navItem.click();
+                panel.classList.remove('show');
+            });
+
+            delegate('click', null, e => {
+                if (!e.target.closest('.global-search, .search-facets')) panel.classList.remove('show');
+            });
+        }
+        """
+
+    @staticmethod
+    def get_offline_script():
+        """离线支持脚本"""
+        return """
+        // 12. 离线支持：注册由生成器写出的 service worker（file:// 打开时不可用）
+        function initServiceWorker() {
+            const manifest = document.querySelector('link[rel="manifest"][data-service-worker]');
+            if (!manifest || !('serviceWorker' in navigator) || !/^https?:$/.test(location.protocol)) return;
+
+            // 等首屏加载完成后再注册，预缓存请求不与页面资源争抢带宽
+            listen(window, 'load', () => {
+                navigator.serviceWorker.register(manifest.getAttribute('data-service-worker'),
+                    { scope: manifest.getAttribute('data-scope') || './' })
+                    .catch(error => console.warn('Service worker 注册失败:', error));
+            });
+        }
+        """
+
+    @staticmethod
+    def get_service_worker_script():
+        """service worker 脚本模板，占位符由 OfflineAppWriter 替换"""
+        return """// FastNav service worker - 由生成器写出，请勿手动修改
+const CACHE_PREFIX = __CACHE_PREFIX__;
+const CACHE_NAME = __CACHE_NAME__;
+const PRECACHE_URLS = __PRECACHE_URLS__;
+const FINGERPRINTED = new RegExp(__FINGERPRINT_RE__);
+
+// 安装：绕过HTTP缓存预取页面和资源，缓存名随构建内容变化
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            .then(cache => cache.addAll(PRECACHE_URLS.map(url => new Request(url, { cache: 'reload' }))))
+            .then(() => self.skipWaiting())
+    );
+});
+
+// 激活：删除旧版本缓存并接管已打开的页面
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(keys
+                .filter(key => key.startsWith(CACHE_PREFIX) && key !== CACHE_NAME)
+                .map(key => caches.delete(key))))
+            .then(() => self.clients.claim())
+    );
+});
+
+// 同源 GET 请求：带内容哈希的资源缓存优先，其余 stale-while-revalidate
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== self.location.origin) return;
+
+    event.respondWith(caches.open(CACHE_NAME).then(cache =>
+        cache.match(request, { ignoreSearch: request.mode === 'navigate' }).then(cached => {
+            if (cached && FINGERPRINTED.test(url.pathname)) return cached;
+
+            const network = fetch(request).then(response => {
+                if (response.ok) cache.put(request, response.clone());
+                return response;
+            });
+            if (!cached) return network;
+            event.waitUntil(network.catch(() => {}));
+            return cached;
+        })
+    ));
+});
+"""
+
     @staticmethod
     def get_notification_system_script():
         """通知系统脚本"""
@@ -616,128 +1560,49 @@ class JavaScriptManager:
         """模态框功能脚本"""
         return """
         // 模态框功能
-        document.getElementById('modalCopyPath').addEventListener('click', function() {
-            const path = document.getElementById('modalFolderPath').textContent;
-            copyToClipboard(path);
-            showNotification('路径已复制到剪贴板', 'success');
-            hideModal();
-        });
+        function initModalControls() {
+            delegate('click', '#modalCopyPath', () => {
+                const path = document.getElementById('modalFolderPath').textContent;
+                copyToClipboard(path);
+                showNotification('路径已复制到剪贴板', 'success');
+                hideModal();
+            });
 
-        document.getElementById('modalOpenDefault').addEventListener('click', function() {
-            const path = document.getElementById('modalFolderPath').textContent;
-            // 转换为 file:// URL 并打开
-            let fileUrl = path;
-            if (!fileUrl.startsWith('file://')) {
-                if (fileUrl.startsWith('/')) {
-                    fileUrl = 'file://' + fileUrl;
-                } else {
-                    fileUrl = 'file:///' + fileUrl.replace(/\\\\/g, '/');
+            delegate('click', '#modalOpenDefault', () => {
+                const path = document.getElementById('modalFolderPath').textContent;
+                // 转换为 file:// URL 并打开
+                let fileUrl = path;
+                if (!fileUrl.startsWith('file://')) {
+                    if (fileUrl.startsWith('/')) {
+                        fileUrl = 'file://' + fileUrl;
+                    } else {
+                        fileUrl = 'file:///' + fileUrl.replace(/\\\\/g, '/');
+                    }
                 }
-            }
-            window.open(fileUrl, '_blank');
-            hideModal();
-        });
+                window.open(fileUrl, '_blank');
+                hideModal();
+            });
 
-        document.getElementById('modalCancel').addEventListener('click', hideModal);
-        document.getElementById('folderOptionsModal').addEventListener('click', function(e) {
-            if (e.target === this) hideModal();
-        });
+            delegate('click', '#modalCancel', hideModal);
+            delegate('click', '#folderOptionsModal', (e, overlay) => {
+                if (e.target === overlay) hideModal();
+            });
+        }
         """
 
     @staticmethod
     def get_onload_script():
         """页面加载后执行的脚本"""
         return """
-        // 页面加载完成后初始化所有功能
-        document.addEventListener('DOMContentLoaded', function() {
+        // 页面加载完成后初始化所有功能（各功能只在这里注册一次事件委托）
+        listen(document, 'DOMContentLoaded', function() {
             console.log('DOM加载完成，开始初始化...');
 
             // 初始化所有功能模块
             initNavigation();
 
-            // 检查当前页面是否是模块信息页面
-            const activeSection = document.querySelector('.category-section.active');
-            if (activeSection) {
-                const categoryType = activeSection.getAttribute('data-category-type');
-                if (categoryType === 'ModuleInfo') {
-                    console.log('检测到模块信息页面，执行额外初始化...');
-                    // 确保模块信息功能已初始化
-                    setTimeout(() => {
-                        if (typeof initModuleInfo === 'function') {
-                            initModuleInfo();
-                        }
-                        updateCategoryCounts();
-                    }, 100);
-                }
-            }
-
-            // 绑定模态框事件（确保在DOM加载后）
-            const modalCopyBtn = document.getElementById('modalCopyPath');
-            const modalOpenBtn = document.getElementById('modalOpenDefault');
-            const modalCancelBtn = document.getElementById('modalCancel');
-            const modalOverlay = document.getElementById('folderOptionsModal');
-
-            if (modalCopyBtn) {
-                modalCopyBtn.addEventListener('click', function() {
-                    const path = document.getElementById('modalFolderPath').textContent;
-                    copyToClipboard(path);
-                    showNotification('路径已复制到剪贴板', 'success');
-                    hideModal();
-                });
-            }
-
-            if (modalOpenBtn) {
-                modalOpenBtn.addEventListener('click', function() {
-                    const path = document.getElementById('modalFolderPath').textContent;
-                    let fileUrl = path;
-                    if (!fileUrl.startsWith('file://')) {
-                        if (fileUrl.startsWith('/')) {
-                            fileUrl = 'file://' + fileUrl;
-                        } else {
-                            fileUrl = 'file:///' + fileUrl.replace(/\\\\/g, '/');
-                        }
-                    }
-                    window.open(fileUrl, '_blank');
-                    hideModal();
-                });
-            }
-
-            if (modalCancelBtn) {
-                modalCancelBtn.addEventListener('click', hideModal);
-            }
-
-            if (modalOverlay) {
-                modalOverlay.addEventListener('click', function(e) {
-                    if (e.target === this) hideModal();
-                });
-            }
-
-            // 绑定使用提示按钮
-            const helpBtn = document.querySelector('.usage-help');
-            if (helpBtn) {
-                helpBtn.addEventListener('click', function() {
-                    const tooltip = document.getElementById('usageTooltip');
-                    if (tooltip) {
-                        tooltip.classList.toggle('show');
-                    }
-                });
-            }
-
-            // 添加页面切换监听
-            document.addEventListener('categoryChanged', function() {
-                setTimeout(() => {
-                    const activeSection = document.querySelector('.category-section.active');
-                    if (activeSection && activeSection.querySelector('.module-info-container')) {
-                        console.log('切换到模块信息页面，重新初始化...');
-                        if (typeof initModuleInfo === 'function') {
-                            initModuleInfo();
-                        }
-                        if (typeof updateCategoryCounts === 'function') {
-                            updateCategoryCounts();
-                        }
-                    }
-                }, 50);
-            });
+            // 页面声明了 service worker 时注册离线缓存
+            if (typeof initServiceWorker === 'function') initServiceWorker();
         });
         """
 
@@ -746,39 +1611,32 @@ class JavaScriptManager:
         """模块信息页面脚本"""
         return """
         // 模块信息页面功能
+        // 启动时注册一次事件委托，分类计数在模块页面首次激活时计算（见 sectionLifecycles）
         function initModuleInfo() {
             console.log('初始化模块信息页面...');
 
             // 分类标签点击事件 - 使用事件委托
-            document.addEventListener('click', function(e) {
-                const categoryTab = e.target.closest('.category-tab');
-                if (categoryTab) {
-                    e.preventDefault();
-                    const category = categoryTab.getAttribute('data-category');
+            delegate('click', '.category-tab', (e, categoryTab) => {
+                e.preventDefault();
+                const category = categoryTab.getAttribute('data-category');
 
-                    // 更新按钮状态
-                    document.querySelectorAll('.category-tab').forEach(t => t.classList.remove('active'));
-                    categoryTab.classList.add('active');
+                // 更新按钮状态
+                document.querySelectorAll('.category-tab').forEach(t => t.classList.remove('active'));
+                categoryTab.classList.add('active');
 
-                    // 筛选模块卡片
-                    filterModulesByCategory(category);
-                }
+                // 筛选模块卡片
+                filterModulesByCategory(category);
             });
 
             // 搜索功能 - 实时搜索
-            const searchInput = document.getElementById('moduleSearch');
-            if (searchInput) {
-                searchInput.addEventListener('input', function() {
-                    const activeCategory = document.querySelector('.category-tab.active');
-                    if (activeCategory) {
-                        const category = activeCategory.getAttribute('data-category');
-                        filterModulesByCategory(category);
-                    }
-                });
-            }
+            delegate('input', '#moduleSearch', () => {
+                const activeCategory = document.querySelector('.category-tab.active');
+                if (activeCategory) {
+                    const category = activeCategory.getAttribute('data-category');
+                    filterModulesByCategory(category);
+                }
+            });
 
-            // 初始化分类计数
-            updateCategoryCounts();
         }
 
         // 按分类筛选模块
@@ -909,28 +1767,42 @@ class JavaScriptManager:
         """
 
     @staticmethod
-    def get_all_scripts():
-        """获取所有 JavaScript 脚本"""
+    def get_all_scripts(section_types=None, features=None):
+        """获取所有 JavaScript 脚本
+
+        Args:
+            section_types: 配置中存在的分类类型，提供时省略其余分类类型专用的脚本
+            features: 启用的生成选项（如 'virtual_links'），提供时省略未启用选项专用的脚本
+        """
+        # 第二项为需要该脚本的分类类型，第三项为需要该脚本的生成选项，None 表示总是包含
         scripts = [
-            JavaScriptManager.get_main_script(),
-            JavaScriptManager.get_category_navigation_script(),
-            JavaScriptManager.get_subcategory_navigation_script(),
-            JavaScriptManager.get_release_notes_script(),
-            JavaScriptManager.get_layout_controls_script(),
-            JavaScriptManager.get_tag_filters_script(),
-            JavaScriptManager.get_local_folder_script(),
-            JavaScriptManager.get_interface_routes_script(),
-            JavaScriptManager.get_icon_reference_script(),
-            JavaScriptManager.get_usage_tooltip_script(),
-            JavaScriptManager.get_keyboard_shortcuts_script(),
-            JavaScriptManager.get_notification_system_script(),
-            JavaScriptManager.get_modal_script(),
-            JavaScriptManager.get_onload_script(),
-            JavaScriptManager.get_module_info_script()
+            (JavaScriptManager.get_main_script, None, None),
+            (JavaScriptManager.get_category_navigation_script, None, None),
+            (JavaScriptManager.get_deferred_sections_script, None, 'defer_sections'),
+            (JavaScriptManager.get_section_fragments_script, None, 'split_sections'),
+            (JavaScriptManager.get_subcategory_navigation_script, None, None),
+            (JavaScriptManager.get_virtual_links_script, None, 'virtual_links'),
+            (JavaScriptManager.get_release_notes_script, ('ReleaseNotes',), None),
+            (JavaScriptManager.get_layout_controls_script, None, None),
+            (JavaScriptManager.get_tag_filters_script, None, None),
+            (JavaScriptManager.get_local_folder_script, None, None),
+            (JavaScriptManager.get_interface_routes_script, ('InterfaceMap',), None),
+            (JavaScriptManager.get_virtual_interface_table_script, ('InterfaceMap',), 'lazy_interfaces'),
+            (JavaScriptManager.get_icon_reference_script, ('IconsReference',), None),
+            (JavaScriptManager.get_usage_tooltip_script, None, None),
+            (JavaScriptManager.get_keyboard_shortcuts_script, None, None),
+            (JavaScriptManager.get_notification_system_script, None, None),
+            (JavaScriptManager.get_modal_script, None, None),
+            (JavaScriptManager.get_search_script, None, 'search_index'),
+            (JavaScriptManager.get_offline_script, None, 'pwa'),
+            (JavaScriptManager.get_onload_script, None, None),
+            (JavaScriptManager.get_module_info_script, ('ModuleInfo',), None)
         ]
 
         # 将所有脚本合并成一个字符串
-        return "\n".join(scripts)
+        return "\n".join(get() for get, types, feature in scripts
+                         if (types is None or section_types is None or not section_types.isdisjoint(types))
+                         and (feature is None or features is None or feature in features))
 
 
 class CSSManager:
@@ -1230,6 +2102,34 @@ class CSSManager:
             border-color: var(--primary-color);
         }
 
+        /* 标签的结果数，随多选状态更新 */
+        .tag-count {
+            margin-left: 6px;
+            padding: 0 6px;
+            border-radius: 10px;
+            background: var(--sidebar-bg);
+            font-size: 0.85em;
+        }
+
+        .tag-filter.active .tag-count {
+            background: rgba(255, 255, 255, 0.25);
+        }
+
+        .tag-filter.empty {
+            opacity: 0.45;
+        }
+
+        .tag-mode {
+            margin-left: auto;
+            padding: 6px 12px;
+            background: transparent;
+            border: 1px dashed var(--primary-color);
+            border-radius: 20px;
+            cursor: pointer;
+            font-size: 0.85em;
+            color: var(--primary-color);
+        }
+
         /* 布局切换按钮 */
         .layout-controls {
             display: flex;
@@ -1264,8 +2164,7 @@ class CSSManager:
         """卡片和链接样式"""
         return """
         /* 列表布局 */
-        .cards-container.list-layout,
-        .subcategory-cards.list-layout {
+        .cards-container.list-layout {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(540px, 1fr));
             gap: 16px;
@@ -1273,8 +2172,7 @@ class CSSManager:
         }
 
         /* 格子布局 */
-        .cards-container.grid-layout,
-        .subcategory-cards.grid-layout {
+        .cards-container.grid-layout {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
             gap: 20px;
@@ -1523,9 +2421,9 @@ class CSSManager:
             color: var(--copy-btn-hover);
         }
 
-        /* 二级分类卡片容器 */
-        .subcategory-cards {
-            display: none;
+        /* 被二级分类或标签筛选隐藏的卡片 */
+        .link-card.card-hidden {
+            display: none !important;
         }
         """
 		
@@ -2874,6 +3772,54 @@ class CSSManager:
         }
         """
 
+    @staticmethod
+    def get_virtual_interface_table_styles():
+        """懒渲染版本接口矩阵样式（lazy_interfaces）"""
+        return """
+        /* 懒渲染的虚拟接口矩阵 */
+        .interface-virtual-viewport {
+            position: relative;
+            height: 70vh;
+            overflow: auto;
+        }
+
+        .interface-virtual-sizer {
+            position: relative;
+        }
+
+        .interface-virtual-table {
+            position: absolute;
+            left: 0;
+            table-layout: fixed;
+        }
+
+        .interface-virtual-table th {
+            height: 46px;
+            box-sizing: border-box;
+            z-index: 1;
+        }
+
+        .interface-virtual-table td {
+            height: 44px;
+            box-sizing: border-box;
+            padding: 0 12px;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
+
+        .interface-virtual-group td {
+            color: white;
+            font-weight: 600;
+        }
+
+        .interface-virtual-group span + span {
+            margin-left: 12px;
+            font-weight: normal;
+            opacity: 0.9;
+        }
+        """
+
     @staticmethod
     def get_module_info_styles():
         """模块信息页面样式"""
@@ -3329,93 +4275,643 @@ class CSSManager:
                 min-width: auto;
             }
 
-            .category-selector {
-                justify-content: center;
-            }
+            .category-selector {
+                justify-content: center;
+            }
+
+            .module-search {
+                max-width: 100%;
+            }
+
+            .module-header {
+                flex-direction: column;
+                align-items: flex-start;
+            }
+
+            .attribute-item {
+                flex-direction: column;
+                gap: 8px;
+            }
+
+            .attribute-label {
+                min-width: auto;
+                margin-right: 0;
+            }
+
+            .owner-item {
+                width: 100%;
+            }
+        }
+
+        @media (max-width: 480px) {
+            .module-card {
+                padding: 20px;
+            }
+
+            .module-name {
+                font-size: 1.2em;
+            }
+
+            .category-tab {
+                padding: 6px 12px;
+                font-size: 0.85em;
+            }
+
+            .module-stats {
+                flex-direction: column;
+                gap: 15px;
+            }
+        }
+        """
+
+    @staticmethod
+    def get_search_styles():
+        """全局搜索样式"""
+        return """
+        /* 全局搜索 */
+        .global-search {
+            padding: 0 20px 20px 20px;
+        }
+
+        .global-search input {
+            width: 100%;
+            box-sizing: border-box;
+            padding: 10px 14px;
+            border: 1px solid var(--border-color);
+            border-radius: 8px;
+            background: var(--card-bg);
+            color: var(--text-primary);
+            font-size: 0.9em;
+            transition: var(--transition);
+        }
+
+        .global-search input:focus {
+            outline: none;
+            border-color: var(--primary-color);
+        }
+
+        .search-results {
+            display: none;
+            position: fixed;
+            top: 20px;
+            left: 290px;
+            width: min(560px, calc(100vw - 320px));
+            max-height: 70vh;
+            overflow-y: auto;
+            background: var(--card-bg);
+            border: 1px solid var(--border-color);
+            border-radius: var(--border-radius);
+            box-shadow: var(--shadow);
+            z-index: 1000;
+        }
+
+        .search-results.show {
+            display: block;
+        }
+
+        .search-summary {
+            padding: 10px 16px;
+            font-size: 0.85em;
+            color: var(--text-secondary);
+            border-bottom: 1px solid var(--border-color);
+        }
+
+        .search-facets {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 6px;
+            padding: 8px 16px;
+            border-bottom: 1px solid var(--border-color);
+        }
+
+        .search-facet {
+            padding: 2px 10px;
+            border: 1px solid var(--border-color);
+            border-radius: 12px;
+            font-size: 0.8em;
+            color: var(--text-secondary);
+            cursor: pointer;
+        }
+
+        .search-facet:hover {
+            border-color: var(--primary-color);
+            color: var(--primary-color);
+        }
+
+        .search-facet b {
+            margin-left: 4px;
+            font-weight: 600;
+        }
+
+        .search-result {
+            display: grid;
+            grid-template-columns: 80px 1fr auto;
+            gap: 4px 12px;
+            padding: 10px 16px;
+            color: var(--text-primary);
+            text-decoration: none;
+            cursor: pointer;
+            border-bottom: 1px solid var(--border-color);
+        }
+
+        .search-result:hover {
+            background: rgba(99, 102, 241, 0.05);
+        }
+
+        .search-kind,
+        .search-section,
+        .search-detail {
+            font-size: 0.8em;
+            color: var(--text-secondary);
+        }
+
+        .search-title {
+            font-weight: 600;
+        }
+
+        .search-detail {
+            grid-column: 2 / 4;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            white-space: nowrap;
+        }
+        """
+
+    @staticmethod
+    def get_all_styles(section_types=None, features=None):
+        """获取所有CSS样式
+
+        Args:
+            section_types: 配置中存在的分类类型，提供时省略其余分类类型专用的样式
+            features: 启用的生成选项（如 'search_index'），提供时省略未启用选项专用的样式
+        """
+        # 第二项为需要该样式的分类类型，第三项为需要该样式的生成选项，None 表示总是包含
+        # （文档样式含导航栏 SVG 图标规则，属于公共部分）；
+        # 版本接口和模块信息的样式都定义了 .control-group/.control-label 并依赖层叠顺序，二者同进同出
+        styles = [
+            (CSSManager.get_base_styles, None, None),
+            (CSSManager.get_layout_styles, None, None),
+            (CSSManager.get_logo_styles, None, None),
+            (CSSManager.get_section_styles, None, None),
+            (CSSManager.get_card_styles, None, None),
+            (CSSManager.get_release_notes_styles, ('ReleaseNotes',), None),
+            (CSSManager.get_docs_styles, None, None),
+            (CSSManager.get_ui_styles, None, None),
+            (CSSManager.get_version_tag_styles, ('ReleaseNotes',), None),
+            (CSSManager.get_interface_route_styles, ('InterfaceMap', 'ModuleInfo'), None),
+            (CSSManager.get_virtual_interface_table_styles, ('InterfaceMap',), 'lazy_interfaces'),
+            (CSSManager.get_responsive_styles, None, None),
+            (CSSManager.get_module_info_styles, ('InterfaceMap', 'ModuleInfo'), None),
+            (CSSManager.get_search_styles, None, 'search_index')
+        ]
+        return "\n".join(get() for get, types, feature in styles
+                         if (types is None or section_types is None or not section_types.isdisjoint(types))
+                         and (feature is None or features is None or feature in features))
+
+
+class AssetMinifier:
+    """纯 Python 的 CSS/JS/HTML 压缩器（构建时使用，不依赖外部工具）
+
+    采用保守策略：字符串、模板字符串、正则字面量和 <pre>/<textarea>/<script>/<style> 内容保持原样，
+    只去掉注释、调试日志和多余空白，并保留 JS 中影响自动分号插入的换行。
+    同时记录压缩前后的字节数用于报告。
+    """
+
+    # 两侧空白可以安全删除的 JS 标点（不含 + - /，避免 a + +b、a - -b、正则歧义）
+    JS_PUNCTUATION = set('{}()[];,:=<>!&|?*%^~')
+    # 其后的换行可以安全删除的 JS 字符
+    JS_NEWLINE_SAFE_BEFORE = set('{;,([:')
+    JS_NEWLINE_SAFE_AFTER = set('})]')
+    # 出现在这些字符之后的 / 视为正则字面量开始
+    JS_REGEX_PREFIX = set('(,=:[!&|?{};+-*%<>~^\n')
+    # 构建时移除的调试日志调用
+    JS_DEBUG_CALLS = ('console.log(', 'console.debug(')
+
+    # 两侧空白可以安全删除的 CSS 标点（冒号只删除其后的空白，避免改变 ".a :hover" 选择器语义）
+    CSS_PUNCTUATION = set('{};,>')
+
+    HTML_PROTECTED_RE = re.compile(r'(<(pre|textarea|script|style)\b[^>]*>.*?</\2\s*>)', re.IGNORECASE | re.DOTALL)
+    HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+    HTML_TAG_RE = re.compile(r'''(<(?:[^>"']|"[^"]*"|'[^']*')*>)''')
+    HTML_QUOTED_RE = re.compile(r'''("[^"]*"|'[^']*')''')
+    WHITESPACE_RE = re.compile(r'\s+')
+
+    def __init__(self):
+        self.stats = {'css': [0, 0], 'js': [0, 0], 'html': [0, 0]}
+
+    def _record(self, kind, before, after):
+        stats = self.stats[kind]
+        stats[0] += len(before.encode('utf-8'))
+        stats[1] += len(after.encode('utf-8'))
+        return after
+
+    def record(self, kind, before, after):
+        """计入在别处完成的压缩（如 AssetBundles 缓存的压缩结果），用于报告"""
+        return self._record(kind, before, after)
+
+    @staticmethod
+    def _collapse_whitespace(match):
+        """空白序列折叠为一个换行或一个空格，渲染结果不变"""
+        return '\n' if '\n' in match.group(0) else ' '
+
+    @staticmethod
+    def _end_of_quoted(text, start):
+        """返回从 start 开始的字符串/模板字符串结束后的位置"""
+        quote = text[start]
+        i = start + 1
+        n = len(text)
+        while i < n:
+            c = text[i]
+            if c == '\\':
+                i += 2
+                continue
+            if c == quote:
+                return i + 1
+            if quote == '`' and text.startswith('${', i):
+                # 模板插值：跳过其中的代码（可能包含嵌套字符串）
+                i += 2
+                depth = 1
+                while i < n and depth:
+                    c = text[i]
+                    if c in '"\'`':
+                        i = AssetMinifier._end_of_quoted(text, i)
+                        continue
+                    if c == '{':
+                        depth += 1
+                    elif c == '}':
+                        depth -= 1
+                    i += 1
+                continue
+            i += 1
+        return n
+
+    @staticmethod
+    def _end_of_regex(text, start):
+        """返回从 start 开始的正则字面量（含修饰符）结束后的位置"""
+        i = start + 1
+        n = len(text)
+        in_class = False
+        while i < n:
+            c = text[i]
+            if c == '\\':
+                i += 2
+                continue
+            if c == '\n':
+                return i
+            if c == '[':
+                in_class = True
+            elif c == ']':
+                in_class = False
+            elif c == '/' and not in_class:
+                i += 1
+                while i < n and text[i].isalpha():
+                    i += 1
+                return i
+            i += 1
+        return n
+
+    @staticmethod
+    def _end_of_call(text, start):
+        """返回从 start（左括号之后）开始到匹配右括号之后的位置"""
+        i = start
+        n = len(text)
+        depth = 1
+        while i < n and depth:
+            c = text[i]
+            if c in '"\'`':
+                i = AssetMinifier._end_of_quoted(text, i)
+                continue
+            if c == '(':
+                depth += 1
+            elif c == ')':
+                depth -= 1
+            i += 1
+        return i
+
+    def js(self, text):
+        """压缩 JavaScript：去掉注释、调试日志和多余空白"""
+        out = []
+        last = '\n'  # 最后输出的非空白字符
+        i = 0
+        n = len(text)
+        while i < n:
+            c = text[i]
+            if c in '"\'`':
+                j = self._end_of_quoted(text, i)
+                out.append(text[i:j])
+                last = c
+                i = j
+            elif text.startswith('//', i):
+                j = text.find('\n', i)
+                i = n if j == -1 else j
+            elif text.startswith('/*', i):
+                j = text.find('*/', i + 2)
+                i = n if j == -1 else j + 2
+            elif c == '/' and last in self.JS_REGEX_PREFIX:
+                j = self._end_of_regex(text, i)
+                out.append(text[i:j])
+                last = '/'
+                i = j
+            elif c.isspace():
+                j = i
+                while j < n and text[j].isspace():
+                    j += 1
+                following = text[j] if j < n else '\n'
+                if '\n' in text[i:j]:
+                    if not (out and out[-1] == '\n') and last not in self.JS_NEWLINE_SAFE_BEFORE \
+                            and following not in self.JS_NEWLINE_SAFE_AFTER:
+                        out.append('\n')
+                elif last not in self.JS_PUNCTUATION and following not in self.JS_PUNCTUATION and last != '\n':
+                    out.append(' ')
+                i = j
+            elif last in ';{}\n' and text.startswith(self.JS_DEBUG_CALLS, i):
+                # 移除独立成句的调试日志调用
+                j = self._end_of_call(text, text.index('(', i) + 1)
+                while j < n and text[j] in ' \t':
+                    j += 1
+                if j < n and text[j] == ';':
+                    j += 1
+                i = j
+            else:
+                if out and out[-1] == ' ' and c in self.JS_PUNCTUATION:
+                    out.pop()
+                out.append(c)
+                last = c
+                i += 1
+        return self._record('js', text, ''.join(out).strip())
+
+    def css(self, text):
+        """压缩 CSS：去掉注释和多余空白"""
+        out = []
+        i = 0
+        n = len(text)
+        while i < n:
+            c = text[i]
+            if c in '"\'':
+                j = self._end_of_quoted(text, i)
+                out.append(text[i:j])
+                i = j
+            elif text.startswith('/*', i):
+                j = text.find('*/', i + 2)
+                i = n if j == -1 else j + 2
+            elif c.isspace():
+                j = i
+                while j < n and text[j].isspace():
+                    j += 1
+                previous = out[-1][-1] if out else '{'
+                following = text[j] if j < n else '}'
+                if previous not in self.CSS_PUNCTUATION and previous != ':' and following not in self.CSS_PUNCTUATION:
+                    out.append(' ')
+                i = j
+            else:
+                if c == '}' and out and out[-1] == ';':
+                    out.pop()  # 规则块最后一个分号可以省略
+                out.append(c)
+                i += 1
+        return self._record('css', text, ''.join(out).strip())
+
+    def html(self, text):
+        """压缩 HTML：去掉注释，折叠标签间和文本中的空白（保护 pre/textarea/script/style 内容）"""
+        parts = []
+        segments = self.HTML_PROTECTED_RE.split(text)
+        # split 结果按 [普通, 受保护整体, 标签名, 普通, ...] 排列
+        for index in range(0, len(segments), 3):
+            plain = self.HTML_COMMENT_RE.sub('', segments[index])
+            for k, token in enumerate(self.HTML_TAG_RE.split(plain)):
+                if k % 2:
+                    # 标签内：只折叠引号外的空白
+                    token = ''.join(
+                        piece if q % 2 else self.WHITESPACE_RE.sub(' ', piece)
+                        for q, piece in enumerate(self.HTML_QUOTED_RE.split(token))
+                    )
+                else:
+                    token = self.WHITESPACE_RE.sub(self._collapse_whitespace, token)
+                parts.append(token)
+            if index + 1 < len(segments):
+                parts.append(segments[index + 1])
+        return self._record('html', text, ''.join(parts))
+
+    def report(self):
+        """返回压缩前后字节数报告"""
+        lines = []
+        for kind in ('css', 'js', 'html'):
+            before, after = self.stats[kind]
+            if before:
+                saved = (1 - after / before) * 100
+                lines.append(f"{kind.upper()} {before:,} → {after:,} 字节 (-{saved:.1f}%)")
+        return ' | '.join(lines)
+
+
+class AssetBundle:
+    """静态资源包 - 组装好的 CSS 或 JS，附带 UTF-8 字节、内容哈希，预压缩版本在首次使用时生成"""
+
+    __slots__ = ('kind', 'text', 'data', 'hash', '_compressed')
+
+    def __init__(self, kind, text):
+        self.kind = kind
+        self.text = text
+        self.data = text.encode('utf-8')
+        self.hash = hashlib.sha256(self.data).hexdigest()[:16]
+        self._compressed = None
+
+    @property
+    def file_name(self):
+        """外部资源文件名 app.<hash>.css / app.<hash>.js"""
+        return f"app.{self.hash}.{self.kind}"
+
+    def compressed(self):
+        """预压缩版本 {'.gz': ..., '.br': ...}（.br 需要安装 brotli），只压缩一次"""
+        if self._compressed is None:
+            # mtime=0 保证相同内容得到相同的 .gz，便于部署时比对
+            compressed = {'.gz': gzip.compress(self.data, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                compressed['.br'] = brotli.compress(self.data, quality=11)
+            self._compressed = compressed
+        return self._compressed
+
+
+class AssetBundles:
+    """静态资源包缓存 - CSS/JS 在每个进程中只组装（以及压缩、计算哈希）一次
+
+    生成器实例、监视模式的每次重建、批量模式的每个门户都从这里取资源包，不再逐实例拼接。
+    section_types 为配置中存在的分类类型，features 为启用的生成选项，提供时返回只含所需样式和脚本的子资源包，
+    为 None 时不按该项筛选（两者都为 None 时返回完整资源包）。
+    """
+
+    _bundles = {}
+    _lock = threading.RLock()  # 压缩版本由未压缩版本得到，会在持锁时再次进入
+
+    @classmethod
+    def get(cls, kind, section_types=None, minify=False, features=None):
+        """返回 kind（'css' 或 'js'）的资源包，minify 为 True 时返回压缩后的版本"""
+        key = (kind, None if section_types is None else frozenset(section_types), minify,
+               None if features is None else frozenset(features))
+        bundle = cls._bundles.get(key)
+        if bundle is None:
+            with cls._lock:
+                bundle = cls._bundles.get(key)
+                if bundle is None:
+                    if minify:
+                        source = cls.get(kind, section_types, features=features).text
+                        text = AssetMinifier().css(source) if kind == 'css' else AssetMinifier().js(source)
+                    elif kind == 'css':
+                        text = CSSManager.get_all_styles(key[1], key[3])
+                    else:
+                        text = JavaScriptManager.get_all_scripts(key[1], key[3])
+                    bundle = cls._bundles[key] = AssetBundle(kind, text)
+        return bundle
+
+
+class HtmlFragmentBuilder:
+    """HTML片段构建器 - 收集片段后一次性拼接，避免在循环中用 += 反复复制字符串"""
+
+    __slots__ = ('_parts',)
+
+    def __init__(self, *fragments):
+        self._parts = list(fragments)
+
+    def add(self, fragment):
+        """追加一个片段"""
+        self._parts.append(fragment)
+        return self
 
-            .module-search {
-                max-width: 100%;
-            }
+    def extend(self, fragments):
+        """追加多个片段（可以是生成器）"""
+        self._parts.extend(fragments)
+        return self
 
-            .module-header {
-                flex-direction: column;
-                align-items: flex-start;
-            }
+    def __iter__(self):
+        return iter(self._parts)
 
-            .attribute-item {
-                flex-direction: column;
-                gap: 8px;
-            }
+    def __bool__(self):
+        return any(self._parts)
 
-            .attribute-label {
-                min-width: auto;
-                margin-right: 0;
-            }
+    def build(self):
+        """拼接所有片段"""
+        return ''.join(self._parts)
 
-            .owner-item {
-                width: 100%;
-            }
-        }
+    __str__ = build
 
-        @media (max-width: 480px) {
-            .module-card {
-                padding: 20px;
-            }
 
-            .module-name {
-                font-size: 1.2em;
-            }
+class InterfaceRouteModel:
+    """版本仓库预解析模型 - 每个版本仓库只解析一次，统一视图和分组视图共用
 
-            .category-tab {
-                padding: 6px 12px;
-                font-size: 0.85em;
-            }
+    versions 中每个版本的 interfaces 只在构建时解析一次；
+    接口列的 <td> 单元格按版本预先拼接，两个视图直接复用，
+    避免 版本数 × 接口数 的矩阵被重复解析和格式化。
+    """
 
-            .module-stats {
-                flex-direction: column;
-                gap: 15px;
-            }
+    __slots__ = ('route_data', 'interfaces', 'version_interfaces', 'sorted_versions', 'branch_versions',
+                 'header_cells', 'interface_cells')
+
+    def __init__(self, route_data):
+        self.route_data = route_data
+        versions = route_data['versions']
+
+        # 版本 -> {接口: 接口版本}
+        self.version_interfaces = {
+            version_id: dict(InterfaceRouteGenerator._parse_interfaces(version_data.get('interfaces', '')))
+            for version_id, version_data in versions.items()
         }
+        all_interfaces = set()
+        for interfaces_dict in self.version_interfaces.values():
+            all_interfaces.update(interfaces_dict)
+        self.interfaces = sorted(all_interfaces)
+
+        # 按日期排序的版本，以及按分支分组（组内同样按日期排序）
+        self.sorted_versions = sorted(versions.items(), key=lambda x: x[1].get('date', ''))
+        self.branch_versions = defaultdict(list)
+        for version_id, version_data in self.sorted_versions:
+            self.branch_versions[version_data.get('branch', 'master')].append((version_id, version_data))
+
+        self.header_cells = ''.join(f'<th>{interface}</th>' for interface in self.interfaces)
+        self.interface_cells = {
+            version_id: ''.join(f'<td>{interfaces_dict.get(interface, "-")}</td>' for interface in self.interfaces)
+            for version_id, interfaces_dict in self.version_interfaces.items()
+        }
+
+    def to_client_data(self, tag_class):
+        """生成客户端虚拟表格使用的紧凑数据
+
+        结构:
+            interfaces: 接口列名数组
+            values: 去重后的接口版本字符串
+            branches: [[分支ID, 名称, 颜色, 描述], ...]，前 grouped 个为配置中的分支（按ID排序，用于分组视图）
+            versions: 按日期排序的 [版本ID, 分支下标, 日期, 标签, 标签样式, 父版本, 合并目标, 描述, 稀疏单元格]，
+                      稀疏单元格为扁平的 [列下标, 值下标, 列下标, 值下标, ...]
         """
+        configured = self.route_data['branches']
+        branch_ids = sorted(configured)
+        branch_index = {branch_id: index for index, branch_id in enumerate(branch_ids)}
+        for version_id, version_data in self.sorted_versions:
+            branch_index.setdefault(version_data.get('branch', 'master'), len(branch_index))
+
+        branches = []
+        for branch_id in branch_index:
+            branch_data = configured.get(branch_id, {})
+            # 客户端按字符串处理各字段；配置中的数字或 null 与服务端渲染一致，按 str() 输出
+            branches.append([str(branch_id), str(branch_data.get('name', branch_id)),
+                             str(branch_data.get('color', '#6366f1')), str(branch_data.get('description', ''))])
+
+        column_index = {interface: index for index, interface in enumerate(self.interfaces)}
+        value_index = {}
+        versions = []
+        for version_id, version_data in self.sorted_versions:
+            cells = []
+            for interface, value in self.version_interfaces[version_id].items():
+                cells.append(column_index[interface])
+                cells.append(value_index.setdefault(value, len(value_index)))
+            tag = str(version_data.get('tag') or '')
+            versions.append([
+                str(version_id),
+                branch_index[version_data.get('branch', 'master')],
+                str(version_data.get('date', '')),
+                tag,
+                tag_class(tag) if tag else '',
+                str(version_data.get('parent', '-')),
+                str(version_data.get('merge_target', '-')),
+                str(version_data.get('description', '')),
+                cells
+            ])
+
+        return {
+            'interfaces': self.interfaces,
+            'values': list(value_index),
+            'branches': branches,
+            'grouped': len(branch_ids),
+            'versions': versions
+        }
 
-    @staticmethod
-    def get_all_styles():
-        """获取所有CSS样式"""
-        styles = [
-            CSSManager.get_base_styles(),
-            CSSManager.get_layout_styles(),
-            CSSManager.get_logo_styles(),
-            CSSManager.get_section_styles(),
-            CSSManager.get_card_styles(),
-            CSSManager.get_release_notes_styles(),
-            CSSManager.get_docs_styles(),
-            CSSManager.get_ui_styles(),
-            CSSManager.get_version_tag_styles(),
-            CSSManager.get_interface_route_styles(),
-            CSSManager.get_responsive_styles(),
-            CSSManager.get_module_info_styles()
-        ]
-        return "\n".join(styles)
 
 class InterfaceRouteGenerator:
     def __init__(self, title="版本接口"):
         self.title = title
         self.interface_routes = {}  # 存储版本仓库数据
+        self.route_models = {}  # 版本仓库名 -> InterfaceRouteModel
+        self.lazy_render = False  # 为 True 时嵌入 JSON 数据，由客户端虚拟表格渲染
         self.generator_info = "InterfaceRouteTable v2.0 | 分支分组表格 | 标签状态 | 开发者: @wanqiang.liu"
 
     def add_interface_route(self, route_name, route_data):
         """添加版本仓库"""
         self.interface_routes[route_name] = route_data
+        self.route_models.pop(route_name, None)
+
+    def get_route_model(self, route_name, route_data):
+        """获取版本仓库的预解析模型，数据被替换时重新构建"""
+        model = self.route_models.get(route_name)
+        if model is None or model.route_data is not route_data:
+            model = InterfaceRouteModel(route_data)
+            self.route_models[route_name] = model
+        return model
 
     def _generate_interface_route_html(self, route_name, route_data):
         """生成版本仓库HTML"""
-        
-        # 收集所有接口名称
-        all_interfaces = set()
-        for version_id, version_data in route_data['versions'].items():
-            interfaces = self._parse_interfaces(version_data.get('interfaces', ''))
-            all_interfaces.update([iface for iface, ver in interfaces])
-        
+        return ''.join(self._iter_interface_route_html(route_name, route_data))
+
+    def _iter_interface_route_html(self, route_name, route_data):
+        """逐块生成版本仓库HTML（流式输出）"""
+        model = self.get_route_model(route_name, route_data)
+
         # 生成视图切换器
         view_filters_html = """
             <button class="view-filter active" data-view="unified">统一视图</button>
@@ -3423,23 +4919,23 @@ class InterfaceRouteGenerator:
         """
         
         # 生成分支筛选器
-        branch_filters_html = '<button class="branch-filter active" data-branch="all">全部</button>'
+        branch_filters = HtmlFragmentBuilder('<button class="branch-filter active" data-branch="all">全部</button>')
         for branch_id, branch_data in route_data['branches'].items():
             name = branch_data.get('name', branch_id)
             color = branch_data.get('color', '#6366f1')
-            branch_filters_html += f'''
+            branch_filters.add(f'''
             <button class="branch-filter" data-branch="{branch_id}">
                 <div class="branch-color-indicator" style="background: {color};"></div>
                 {name}
-            </button>'''
-        
-        # 生成统一视图表格
-        unified_table_html = self._generate_unified_table(route_data, sorted(all_interfaces))
-        
-        # 生成分组视图表格
-        grouped_tables_html = self._generate_grouped_tables(route_data, sorted(all_interfaces))
+            </button>''')
+        branch_filters_html = branch_filters.build()
+
+        if self.lazy_render:
+            yield from self._iter_lazy_route_html(route_name, route_data, model, view_filters_html,
+                                                  branch_filters_html)
+            return
         
-        html = f"""
+        yield f"""
         <div class="interface-route-container">
             <div class="route-title">
                 <span>{route_name}</span>
@@ -3465,27 +4961,80 @@ class InterfaceRouteGenerator:
             
             <!-- 统一视图 -->
             <div class="view-content" data-view="unified">
-                {unified_table_html}
+                """
+        
+        # 生成统一视图表格
+        yield from self._iter_unified_table(model)
+        
+        yield """
             </div>
             
             <!-- 分组视图 -->
             <div class="view-content" data-view="grouped" style="display: none;">
-                {grouped_tables_html}
+                """
+        
+        # 生成分组视图表格
+        yield from self._iter_grouped_tables(model)
+        
+        yield """
             </div>
         </div>
         """
-        
-        return html
 
-    def _generate_unified_table(self, route_data, all_interfaces):
+    def _iter_lazy_route_html(self, route_name, route_data, model, view_filters_html, branch_filters_html):
+        """逐块生成懒渲染的版本仓库HTML
+
+        只输出控制面板、空的虚拟表格视口和一份 JSON 数据，
+        统一视图与分组视图都由客户端基于同一份数据按可见行列渲染。
+        """
+        payload = json.dumps(model.to_client_data(self._get_tag_class), ensure_ascii=False, separators=(',', ':'))
+        # 防止数据中的 "</script>" 提前结束脚本块
+        payload = payload.replace('</', '<\\/')
+
+        yield f"""
+        <div class="interface-route-container" data-virtual-route>
+            <div class="route-title">
+                <span>{route_name}</span>
+            </div>
+            <div class="route-description">
+                {route_data.get('description', '接口版本演变路线')}
+            </div>
+            
+            <div class="control-panel">
+                <div class="control-group">
+                    <div class="control-label">视图模式:</div>
+                    <div class="view-filters">
+                        {view_filters_html}
+                    </div>
+                </div>
+                <div class="control-group">
+                    <div class="control-label">分支筛选:</div>
+                    <div class="branch-filters">
+                        {branch_filters_html}
+                    </div>
+                </div>
+            </div>
+            
+            <div class="interface-table-container interface-virtual-viewport">
+                <div class="interface-virtual-sizer">
+                    <table class="interface-table interface-virtual-table"></table>
+                </div>
+            </div>
+            <script type="application/json" class="interface-route-data">"""
+        yield payload
+        yield """</script>
+        </div>
+        """
+
+    def _generate_unified_table(self, model):
         """生成统一视图表格"""
-        # 按日期排序版本
-        sorted_versions = sorted(
-            route_data['versions'].items(),
-            key=lambda x: x[1].get('date', '')
-        )
-        
-        table_html = """
+        return ''.join(self._iter_unified_table(model))
+
+    def _iter_unified_table(self, model):
+        """逐块生成统一视图表格"""
+        route_data = model.route_data
+
+        yield """
         <div class="interface-table-container">
             <table class="interface-table">
                 <thead>
@@ -3500,27 +5049,25 @@ class InterfaceRouteGenerator:
         """
         
         # 添加接口列
-        for interface in all_interfaces:
-            table_html += f'<th>{interface}</th>'
+        yield model.header_cells
         
-        table_html += """
+        yield """
                     </tr>
                 </thead>
                 <tbody>
         """
         
         # 添加版本行
-        for version_id, version_data in sorted_versions:
+        for version_id, version_data in model.sorted_versions:
             branch_id = version_data.get('branch', 'master')
             branch_data = route_data['branches'].get(branch_id, {})
             branch_name = branch_data.get('name', branch_id)
             branch_color = branch_data.get('color', '#6366f1')
             
-            interfaces_dict = dict(self._parse_interfaces(version_data.get('interfaces', '')))
             tag = version_data.get('tag', '')
             tag_class = self._get_tag_class(tag)
             
-            table_html += f"""
+            yield f"""
                     <tr data-branch="{branch_id}">
                         <td><span class="version-id">{version_id}</span></td>
                         <td>
@@ -3536,35 +5083,24 @@ class InterfaceRouteGenerator:
                         <td>{version_data.get('description', '')}</td>
             """
             
-            for interface in all_interfaces:
-                version = interfaces_dict.get(interface, '-')
-                table_html += f'<td>{version}</td>'
+            yield model.interface_cells[version_id]
             
-            table_html += '</tr>'
+            yield '</tr>'
         
-        table_html += """
+        yield """
                 </tbody>
             </table>
         </div>
         """
-        
-        return table_html
 
-    def _generate_grouped_tables(self, route_data, all_interfaces):
+    def _generate_grouped_tables(self, model):
         """生成分组视图表格"""
-        # 按分支分组版本
-        branch_versions = defaultdict(list)
-        for version_id, version_data in route_data['versions'].items():
-            branch = version_data.get('branch', 'master')
-            branch_versions[branch].append((version_id, version_data))
-        
-        # 对每个分支的版本按日期排序
-        for branch, versions in branch_versions.items():
-            versions.sort(key=lambda x: x[1].get('date', ''))
-        
-        branch_tables_html = ""
-        for branch_id, branch_data in sorted(route_data['branches'].items()):
-            versions = branch_versions.get(branch_id, [])
+        return ''.join(self._iter_grouped_tables(model))
+
+    def _iter_grouped_tables(self, model):
+        """逐块生成分组视图表格"""
+        for branch_id, branch_data in sorted(model.route_data['branches'].items()):
+            versions = model.branch_versions.get(branch_id, [])
             if not versions:
                 continue
                 
@@ -3572,7 +5108,7 @@ class InterfaceRouteGenerator:
             branch_description = branch_data.get('description', '')
             branch_color = branch_data.get('color', '#6366f1')
             
-            branch_tables_html += f"""
+            yield f"""
             <div class="branch-group" data-branch="{branch_id}">
                 <div class="branch-header" style="background: {branch_color}; color: white;">
                     <div>{branch_name}</div>
@@ -3591,10 +5127,9 @@ class InterfaceRouteGenerator:
             """
             
             # 添加接口列
-            for interface in all_interfaces:
-                branch_tables_html += f'<th>{interface}</th>'
+            yield model.header_cells
             
-            branch_tables_html += """
+            yield """
                             </tr>
                         </thead>
                         <tbody>
@@ -3602,11 +5137,10 @@ class InterfaceRouteGenerator:
             
             # 添加版本行
             for version_id, version_data in versions:
-                interfaces_dict = dict(self._parse_interfaces(version_data.get('interfaces', '')))
                 tag = version_data.get('tag', '')
                 tag_class = self._get_tag_class(tag)
                 
-                branch_tables_html += f"""
+                yield f"""
                             <tr>
                                 <td><span class="version-id">{version_id}</span></td>
                                 <td>{version_data.get('date', '')}</td>
@@ -3616,23 +5150,20 @@ class InterfaceRouteGenerator:
                                 <td>{version_data.get('description', '')}</td>
                 """
                 
-                for interface in all_interfaces:
-                    version = interfaces_dict.get(interface, '-')
-                    branch_tables_html += f'<td>{version}</td>'
+                yield model.interface_cells[version_id]
                 
-                branch_tables_html += '</tr>'
+                yield '</tr>'
             
-            branch_tables_html += """
+            yield """
                         </tbody>
                     </table>
                 </div>
             </div>
             """
-        
-        return branch_tables_html
 
-    def _parse_interfaces(self, interfaces_input):
-        """解析接口输入，支持多种格式"""
+    @staticmethod
+    def _parse_interfaces(interfaces_input):
+        """解析接口输入，支持多种格式（字符串、字符串/字典/(接口, 版本)对组成的列表）"""
         interfaces = []
 
         if not interfaces_input:
@@ -3661,9 +5192,28 @@ class InterfaceRouteGenerator:
                     interfaces.append((str(item['name']).strip(), str(item['version']).strip()))
                 elif isinstance(item, dict) and 'name' in item:
                     interfaces.append((str(item['name']).strip(), 'v1.0'))
+                elif isinstance(item, (list, tuple)) and len(item) == 2:
+                    # 已解析的 (接口, 版本) 对
+                    interfaces.append((str(item[0]), str(item[1])))
 
         return interfaces
 
+    @classmethod
+    def normalize_interfaces(cls, interfaces_input):
+        """将配置中的 interfaces 规范化为 [(接口, 版本), ...]
+
+        与旧版先拼接为逗号字符串再拆分的结果一致，但不再经过字符串往返。
+        """
+        if not isinstance(interfaces_input, list):
+            # 已经是字符串或空值
+            return cls._parse_interfaces(str(interfaces_input) if interfaces_input else '')
+        interfaces = []
+        for item in interfaces_input:
+            if isinstance(item, dict) and 'name' in item:
+                item = f"{item['name']}:{item.get('version', 'v1.0')}"
+            interfaces.extend(cls._parse_interfaces(item.strip() if isinstance(item, str) else str(item)))
+        return interfaces
+
     def _get_tag_class(self, tag):
         """根据标签内容获取CSS类名"""
         tag_lower = tag.lower()
@@ -3685,14 +5235,706 @@ class InterfaceRouteGenerator:
         if not self.interface_routes:
             return ""
         
-        content_sections = ""
+        return ''.join(self.iter_interface_routes_html())
+
+    def iter_interface_routes_html(self):
+        """逐块生成版本接口HTML内容（流式输出）"""
         for route_name, route_data in self.interface_routes.items():
-            content_sections += self._generate_interface_route_html(route_name, route_data)
-        
-        return content_sections
+            yield from self._iter_interface_route_html(route_name, route_data)
+
+
+class SVGIconRegistry:
+    """SVG图标注册表 - 进程内懒加载一次，构建后只读
+
+    包含三个索引：
+        svgs: 图标名 -> SVG代码
+        categories: 分类 -> 图标名元组（保持定义顺序）
+        tag_index: 小写标签 -> 图标名元组（倒排索引）
+    """
+
+    # 构建次数计数器，用于确认每次运行只构建一次
+    build_count = 0
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, svg_data):
+        icons = {}
+        categories = defaultdict(list)
+        tag_index = defaultdict(list)
+
+        for icon_name, icon_data in svg_data["icons"].items():
+            tags = tuple(icon_data["tags"])
+            icons[icon_name] = MappingProxyType({
+                "svg": icon_data["svg"],
+                "category": icon_data["category"],
+                "tags": tags
+            })
+            categories[icon_data["category"]].append(icon_name)
+            for tag in tags:
+                names = tag_index[tag.lower()]
+                if icon_name not in names:
+                    names.append(icon_name)
+
+        self.icons = MappingProxyType(icons)
+        self.svgs = MappingProxyType({name: data["svg"] for name, data in icons.items()})
+        self.categories = MappingProxyType({name: tuple(names) for name, names in categories.items()})
+        self.tag_index = MappingProxyType({tag: tuple(names) for tag, names in tag_index.items()})
+        # 图标名 -> 定义顺序，用于保持搜索结果顺序
+        self._order = MappingProxyType({name: i for i, name in enumerate(icons)})
+
+    @classmethod
+    def get(cls):
+        """获取注册表实例，首次调用时构建"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(SoftNavGenerator._get_svg_data())
+                    cls.build_count += 1
+        return cls._instance
+
+    def search(self, keyword):
+        """按名称或标签子串搜索图标，结果按定义顺序返回"""
+        keyword_lower = keyword.lower()
+        matched = {name for name in self.icons if keyword_lower in name.lower()}
+        for tag, names in self.tag_index.items():
+            if keyword_lower in tag:
+                matched.update(names)
+        return {name: self.svgs[name] for name in sorted(matched, key=self._order.__getitem__)}
+
+
+class IncrementalBuildCache:
+    """增量构建缓存 - 保存在输出文件旁
+
+    为每个页面片段记录其输入数据（配置切片）的内容哈希和渲染结果，
+    重新生成时只渲染哈希发生变化的片段，其余直接从缓存拼接。
+    生成器代码变化时（源码指纹不同）整个缓存失效。
+    """
+
+    CACHE_FORMAT = 1
+    _source_fingerprint = None
+
+    def __init__(self, cache_file, fingerprint):
+        self.cache_file = cache_file  # 为 None 时仅在内存中保留（监视模式）
+        self.fingerprint = fingerprint
+        self.entries = {}
+        self.used_entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_output(cls, output_file, generator_info=""):
+        """创建并加载输出文件对应的缓存"""
+        cache = cls(output_file + '.buildcache.json', cls.source_fingerprint() + '|' + generator_info)
+        cache.load()
+        return cache
+
+    @classmethod
+    def source_fingerprint(cls):
+        """生成器源码指纹，代码变化时缓存自动失效"""
+        if cls._source_fingerprint is None:
+            try:
+                with open(os.path.abspath(__file__), 'rb') as f:
+                    cls._source_fingerprint = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                # 打包为可执行文件时可能无法读取源码，退化为可执行文件路径和修改时间
+                cls._source_fingerprint = f"{sys.executable}:{os.path.getmtime(sys.executable)}"
+        return cls._source_fingerprint
+
+    @staticmethod
+    def digest(inputs):
+        """计算片段输入数据的内容哈希"""
+        payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def load(self):
+        """加载缓存文件，格式或指纹不匹配时视为空缓存"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('format') == self.CACHE_FORMAT and data.get('fingerprint') == self.fingerprint:
+            self.entries = data.get('entries', {})
+
+    def begin_build(self):
+        """开始新一轮构建：上一轮用到的片段成为可复用缓存，重置统计"""
+        if self.used_entries:
+            self.entries = self.used_entries
+            self.used_entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key, digest):
+        """查找缓存片段，命中返回HTML，否则返回 None"""
+        entry = self.entries.get(key)
+        if entry and entry.get('hash') == digest:
+            self.hits += 1
+            self.used_entries[key] = entry
+            return entry['html']
+        self.misses += 1
+        return None
+
+    def store(self, key, digest, html):
+        """记录新渲染的片段"""
+        self.used_entries[key] = {'hash': digest, 'html': html}
+
+    def save(self):
+        """写回缓存文件（只保留本次构建用到的片段），先写临时文件再原子替换"""
+        if self.cache_file is None:
+            return
+        data = {
+            'format': self.CACHE_FORMAT,
+            'fingerprint': self.fingerprint,
+            'entries': self.used_entries
+        }
+        tmp_file = self.cache_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_file, self.cache_file)
+
+
+class PrecompressWorker:
+    """预压缩工作线程 - 为输出文件生成 .gz / .br 版本
+
+    写入方通过 feed() 把内容块交给后台线程，压缩与主文件写入并行进行；
+    zlib 和 brotli 压缩时释放 GIL，因此不会拖慢页面渲染。
+    压缩结果先写临时文件，commit() 时在主文件替换之后再原子替换，
+    保证预压缩文件的修改时间不早于源文件，静态服务器可以直接使用。
+    """
+
+    QUEUE_SIZE = 64
+
+    def __init__(self, path):
+        self.path = path
+        self.sizes = {}
+        self.error = None
+        self._queue = queue.Queue(self.QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._run, name=f"precompress:{os.path.basename(path)}",
+                                        daemon=True)
+        self._thread.start()
+
+    def feed(self, data):
+        """提交一块待压缩内容（str 按 UTF-8 编码）"""
+        if self.error is None:
+            self._queue.put(data)
+
+    def close(self):
+        """通知内容结束并等待压缩完成，压缩失败时抛出原始异常"""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+        if self.error is not None:
+            self._discard()
+            raise self.error
+
+    def commit(self):
+        """将压缩结果原子替换到正式文件名，返回各编码的字节数"""
+        for suffix in self.sizes:
+            os.replace(self.path + suffix + '.tmp', self.path + suffix)
+        return self.sizes
+
+    def abort(self):
+        """放弃本次压缩（主文件写入失败时调用）"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._discard()
+
+    def _discard(self):
+        for suffix in ('.gz', '.br'):
+            try:
+                os.remove(self.path + suffix + '.tmp')
+            except OSError:
+                pass
+
+    def _run(self):
+        try:
+            br_compressor = brotli.Compressor(quality=11) if brotli is not None else None
+            br_file = open(self.path + '.br.tmp', 'wb') if br_compressor else None
+            try:
+                # mtime=0 保证相同内容得到相同的 .gz，便于部署时比对
+                with open(self.path + '.gz.tmp', 'wb') as raw, \
+                        gzip.GzipFile(filename='', mode='wb', compresslevel=9, fileobj=raw, mtime=0) as gz:
+                    while True:
+                        data = self._queue.get()
+                        if data is None:
+                            break
+                        if isinstance(data, str):
+                            data = data.encode('utf-8')
+                        gz.write(data)
+                        if br_compressor:
+                            br_file.write(br_compressor.process(data))
+                    if br_compressor:
+                        br_file.write(br_compressor.finish())
+            finally:
+                if br_file:
+                    br_file.close()
+            self.sizes['.gz'] = os.path.getsize(self.path + '.gz.tmp')
+            if br_compressor:
+                self.sizes['.br'] = os.path.getsize(self.path + '.br.tmp')
+        except Exception as e:  # 在调用线程中重新抛出
+            self.error = e
+            # 继续取走剩余内容，避免写入方阻塞在已满的队列上
+            while self._queue.get() is not None:
+                pass
+
+
+class SectionFragmentWriter:
+    """分类片段写入器 - 分片输出模式下把未激活的分类写为 sections/<页面名>/<slug>.<hash>.html
+
+    文件名包含内容哈希，内容未变化的片段不会重写，浏览器和代理缓存保持有效；
+    本次构建未引用的旧片段在 prune() 时删除。每个页面使用自己的子目录，
+    多个页面（批量模式、多个输出）共用输出目录时不会删除彼此的片段。
+    """
+
+    SUBDIR = 'sections'
+
+    def __init__(self, output_file, compressors=None):
+        self.page_dir = os.path.splitext(os.path.basename(output_file))[0] or 'index'
+        self.directory = os.path.join(os.path.dirname(os.path.abspath(output_file)), self.SUBDIR, self.page_dir)
+        self.compressors = compressors
+        self.files = set()
+        self.written = 0
+
+    @staticmethod
+    def slugify(name, index):
+        """分类名转为文件名（保留中文等文字字符），为空时使用序号"""
+        slug = re.sub(r'[^\w-]+', '-', name).strip('-')
+        return slug or f'section-{index}'
+
+    def write(self, index, category_name, html):
+        """写入分类片段，返回页面中引用的相对URL"""
+        data = html.encode('utf-8')
+        file_name = f"{self.slugify(category_name, index)}.{hashlib.sha256(data).hexdigest()[:16]}.html"
+        file_path = os.path.join(self.directory, file_name)
+        self.files.add(file_name)
+        if not os.path.exists(file_path):
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_file = file_path + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, file_path)
+            self.written += 1
+        if self.compressors is not None and not os.path.exists(file_path + '.gz'):
+            worker = PrecompressWorker(file_path)
+            worker.feed(data)
+            self.compressors.append(worker)
+        return f"{self.SUBDIR}/{urllib.parse.quote(self.page_dir)}/{urllib.parse.quote(file_name)}"
+
+    def prune(self):
+        """删除本次构建未引用的片段文件（含预压缩版本），返回删除数量"""
+        removed = 0
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return removed
+        for name in names:
+            base = name[:-3] if name.endswith(('.gz', '.br')) else name
+            if FINGERPRINTED_ASSET_RE.search(base) and base.endswith('.html') and base not in self.files:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+class ParallelSectionRenderer:
+    """并行分类渲染器 - 各分类在进程池中并发渲染，生成器状态无法序列化时退化为线程池
+
+    分类之间只依赖已解析的生成器状态，互不影响。结果按配置顺序取回拼接，
+    前面的分类完成即可写出，页面写入仍是流式的。
+    工作进程拿到的是增量构建缓存的快照，各分类用到的缓存片段随结果返回，再合并到主进程的缓存。
+    """
+
+    _worker_generator = None  # 工作进程中反序列化得到的生成器
+
+    def __init__(self, generator, jobs):
+        self.generator = generator
+        self.jobs = max(1, jobs)
+        self.mode = '串行'
+        self.timings = {}  # 分类下标 -> (分类名, 渲染耗时秒)
+        self.wall_time = 0.0
+        self._tasks = []
+        self._futures = None
+        self._executor = None
+        self._started = None
+
+    def start(self, category_list):
+        """提交所有分类的渲染任务；jobs 为 1 时在取回结果时才串行渲染"""
+        self._started = time.perf_counter()
+        self._tasks = [(category_name, "active" if i == 0 else "")
+                       for i, (category_name, _) in enumerate(category_list)]
+        if self.jobs == 1:
+            return
+
+        executor = None
+        state = self._pickle_state()
+        if state is not None:
+            try:
+                executor = ProcessPoolExecutor(self.jobs, initializer=ParallelSectionRenderer._init_worker,
+                                               initargs=(state,))
+                self.mode = '进程池'
+            except (OSError, NotImplementedError, ImportError) as e:
+                # 部分平台（如缺少 sem_open 的环境）无法创建进程池
+                print(f"⚠️ 无法创建进程池（{e}），改用线程池渲染分类")
+        if executor is None:
+            executor = ThreadPoolExecutor(self.jobs, thread_name_prefix='section')
+            self.mode = '线程池'
+        self._executor = executor
+
+        if self.mode == '进程池':
+            # 进程池延迟到 submit 时才启动工作进程，创建失败在这里才会暴露
+            try:
+                self._futures = [executor.submit(ParallelSectionRenderer._render_in_worker, *task)
+                                 for task in self._tasks]
+            except (BrokenProcessPool, OSError) as e:
+                self._fall_back_to_threads(0, f"无法启动渲染进程（{e}）")
+        else:
+            # 线程共享同一个生成器和增量构建缓存
+            self._futures = [executor.submit(self._render, self.generator, *task) for task in self._tasks]
+
+    def _fall_back_to_threads(self, first_index, reason):
+        """进程池不可用时改用线程池，重新提交第 first_index 个及之后尚未成功的分类"""
+        print(f"⚠️ {reason}，改用线程池渲染剩余分类")
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = ThreadPoolExecutor(self.jobs, thread_name_prefix='section')
+        self.mode = '线程池'
+        futures = self._futures or [None] * len(self._tasks)
+        for i in range(first_index, len(self._tasks)):
+            future = futures[i]
+            # 已在工作进程中渲染成功的分类保留结果
+            if future is None or not future.done() or future.cancelled() or future.exception() is not None:
+                futures[i] = self._executor.submit(self._render, self.generator, *self._tasks[i])
+        self._futures = futures
+
+    def _pickle_state(self):
+        """序列化生成器状态（含增量构建缓存），失败返回 None"""
+        try:
+            return pickle.dumps(self.generator, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            print(f"⚠️ 生成器状态无法序列化（{e}），改用线程池渲染分类")
+            return None
+
+    @classmethod
+    def _init_worker(cls, state):
+        """进程池初始化：每个工作进程只反序列化一次生成器状态"""
+        cls._worker_generator = pickle.loads(state)
+
+    @classmethod
+    def _render_in_worker(cls, category_name, active_section):
+        """在工作进程中渲染一个分类，同时返回本分类用到的缓存片段和命中统计"""
+        generator = cls._worker_generator
+        cache = generator._build_cache
+        if cache is not None:
+            cache.used_entries = {}
+            cache.hits = cache.misses = 0
+        html, elapsed, _ = cls._render(generator, category_name, active_section)
+        usage = (cache.used_entries, cache.hits, cache.misses) if cache is not None else None
+        return html, elapsed, usage
+
+    @staticmethod
+    def _render(generator, category_name, active_section):
+        started = time.perf_counter()
+        category_data = generator.categories[category_name]
+        html = ''.join(generator._iter_category_section(category_name, category_data, active_section))
+        return html, time.perf_counter() - started, None
+
+    def result(self, index):
+        """按配置顺序取回第 index 个分类的HTML，阻塞到该分类渲染完成"""
+        category_name, active_section = self._tasks[index]
+        if self._futures is None:
+            html, elapsed, usage = self._render(self.generator, category_name, active_section)
+        else:
+            try:
+                html, elapsed, usage = self._futures[index].result()
+            except (BrokenProcessPool, OSError) as e:
+                if self.mode != '进程池':
+                    raise
+                # 工作进程异常退出或无法启动时，本分类及剩余分类改用线程池渲染
+                self._fall_back_to_threads(index, f"渲染进程异常（{type(e).__name__}: {e}）")
+                html, elapsed, usage = self._futures[index].result()
+
+        cache = self.generator._build_cache
+        if usage is not None and cache is not None:
+            used_entries, hits, misses = usage
+            cache.used_entries.update(used_entries)
+            cache.hits += hits
+            cache.misses += misses
+        self.timings[index] = (category_name, elapsed)
+        self.wall_time = time.perf_counter() - self._started
+        return html
+
+    def close(self):
+        """关闭工作池，未取回的任务（生成中途出错时）直接取消"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def report(self, limit=10):
+        """打印分类渲染的墙钟时间和各分类渲染耗时（最慢的 limit 个）
+
+        各分类耗时在各自的工作进程中测得，并发时会因争用 CPU 而变长，合计值不能换算为加速比；
+        评估加速效果请对比 --jobs 1 的墙钟时间。
+        """
+        total = sum(elapsed for _, elapsed in self.timings.values())
+        print(f"⏱️ 分类渲染: {self.mode} × {self.jobs}, 墙钟 {self.wall_time * 1000:.1f} ms, "
+              f"各分类耗时合计 {total * 1000:.1f} ms")
+        ranked = sorted(self.timings.values(), key=lambda item: item[1], reverse=True)
+        for category_name, elapsed in ranked[:limit]:
+            print(f"   {elapsed * 1000:9.1f} ms  {category_name}")
+        if len(ranked) > limit:
+            rest = sum(elapsed for _, elapsed in ranked[limit:])
+            print(f"   {rest * 1000:9.1f} ms  其余 {len(ranked) - limit} 个分类")
+
+
+class OfflineAppWriter:
+    """PWA 离线支持 - 写出 Web 应用清单和 service worker
+
+    缓存名由本次构建的页面内容哈希决定：页面重新生成后 <页面名>.sw.js 随之变化，
+    浏览器下次访问时安装新版本并预缓存新页面，重复访问直接从本地缓存加载。
+    清单、service worker、作用域和缓存名都按页面区分，多个页面共用输出目录时互不覆盖。
+    """
+
+    MANIFEST_SUFFIX = '.webmanifest'
+    WORKER_SUFFIX = '.sw.js'
+    CACHE_PREFIX = 'fastnav-pwa-'
+
+    def __init__(self, output_file):
+        self.output_dir = os.path.dirname(os.path.abspath(output_file))
+        self.page_name = os.path.basename(output_file)
+        page_stem = os.path.splitext(self.page_name)[0] or 'index'
+        self.manifest_file = page_stem + self.MANIFEST_SUFFIX
+        self.worker_file = page_stem + self.WORKER_SUFFIX
+        # index.html 同时以目录地址访问，作用域为整个目录；其余页面只控制自身
+        self.scope = './' if self.page_name == 'index.html' else f'./{urllib.parse.quote(self.page_name)}'
+        # 页面名不含 '/'，作为分隔符保证一个页面清理旧缓存时不会匹配到其他页面的缓存
+        self.cache_prefix = f'{self.CACHE_PREFIX}{page_stem}/'
+        self.hasher = hashlib.sha256()
+        self.version = None
+
+    def feed(self, chunk):
+        """累计页面内容哈希（与 PrecompressWorker.feed 接口一致，可直接用于 _tee_chunks）"""
+        self.hasher.update(chunk.encode('utf-8'))
+
+    def head_html(self):
+        """页面头部声明清单、主题色和 service worker 地址"""
+        manifest_url = urllib.parse.quote(self.manifest_file)
+        worker_url = urllib.parse.quote(self.worker_file)
+        return (f'\n            <link rel="manifest" href="{manifest_url}" data-service-worker="{worker_url}" '
+                f'data-scope="{self.scope}">'
+                f'\n            <meta name="theme-color" content="#6366f1">')
+
+    def _write_file(self, file_name, content):
+        """先写临时文件再原子替换"""
+        file_path = os.path.join(self.output_dir, file_name)
+        tmp_file = file_path + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_file, file_path)
+
+    def write(self, title, assets=None):
+        """页面写入完成后写出清单和 service worker，返回缓存版本号
+
+        Args:
+            title: 应用名称
+            assets: write_external_assets() 返回的外部资源文件名
+        """
+        page_url = urllib.parse.quote(self.page_name)
+        precache = ['./', page_url] if self.page_name == 'index.html' else [page_url]
+        precache.append(urllib.parse.quote(self.manifest_file))
+        if assets:
+            precache.extend((assets['css'], assets['js']))
+
+        # 外部资源文件名本身带哈希，一并计入版本号
+        self.hasher.update(json.dumps(precache).encode('utf-8'))
+        self.version = self.hasher.hexdigest()[:16]
+
+        manifest = {
+            'name': title,
+            'short_name': title,
+            'start_url': f'./{page_url}',
+            'scope': self.scope,
+            'display': 'standalone',
+            'background_color': '#ffffff',
+            'theme_color': '#6366f1',
+            'icons': [{'src': FAVICON_DATA_URI, 'sizes': 'any', 'type': 'image/svg+xml'}]
+        }
+        self._write_file(self.manifest_file, json.dumps(manifest, ensure_ascii=False, indent=2))
+
+        worker = (JavaScriptManager.get_service_worker_script()
+                  .replace('__CACHE_PREFIX__', json.dumps(self.cache_prefix, ensure_ascii=False))
+                  .replace('__CACHE_NAME__', json.dumps(self.cache_prefix + self.version, ensure_ascii=False))
+                  .replace('__PRECACHE_URLS__', json.dumps(precache))
+                  .replace('__FINGERPRINT_RE__', json.dumps(FINGERPRINTED_ASSET_RE.pattern)))
+        self._write_file(self.worker_file, worker)
+        return self.version
+
+
+class SearchIndexBuilder:
+    """全文搜索索引构建器 - 构建时生成倒排索引，嵌入页面供客户端搜索
+
+    索引按来源分片（每个普通分类、模块信息、每个发布类型、每个版本仓库各一片），
+    每片以配置切片的内容哈希为键存入增量构建缓存，只有配置变化的分片才重新分词。
+    输出结构:
+        docs: [[类型, 标题, 详情, 所在分类, URL], ...]，类型见 KIND_*
+        terms: 排序后的词项（客户端二分查找、前缀匹配）
+        postings: 与 terms 对应的文档ID列表，差值编码
+        tags: 链接标签（按小写排序，客户端不区分大小写二分查找）
+        tagPostings: 与 tags 对应的链接文档ID列表，差值编码，供全站多选标签筛选
+    """
+
+    KIND_LINK, KIND_MODULE, KIND_RELEASE, KIND_INTERFACE = range(4)
+    TOKEN_RE = re.compile(r'[0-9a-z]+|[\u3400-\u9fff\uf900-\ufaff]+')
+
+    def __init__(self, build_cache=None):
+        self.build_cache = build_cache
+        self.parts = []
+
+    @classmethod
+    def tokenize(cls, text):
+        """分词：英文数字按词，中日韩文字取单字和相邻双字"""
+        tokens = set()
+        for run in cls.TOKEN_RE.findall(text.lower()):
+            if run[0] < '\x80':
+                tokens.add(run)
+            else:
+                tokens.update(run)
+                tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+        return tokens
+
+    @staticmethod
+    def flatten_text(value):
+        """将属性值（字符串、列表、字典）展开为可分词的文本"""
+        if isinstance(value, dict):
+            return ' '.join(SearchIndexBuilder.flatten_text(item) for item in value.values())
+        if isinstance(value, (list, tuple)):
+            return ' '.join(SearchIndexBuilder.flatten_text(item) for item in value)
+        return '' if value is None else str(value)
+
+    def add_part(self, key, inputs, collect):
+        """添加一个索引分片
+
+        Args:
+            key: 分片缓存键
+            inputs: 决定分片内容的配置切片
+            collect: 返回 [(文档, 可搜索文本, *标签), ...] 的函数
+        """
+        cache = self.build_cache
+        digest = None
+        if cache is not None:
+            digest = cache.digest(inputs)
+            cached = cache.lookup(key, digest)
+            if cached is not None:
+                self.parts.append(json.loads(cached))
+                return
+
+        docs = []
+        terms = defaultdict(list)
+        tags = defaultdict(list)
+        for doc_id, (doc, text, *doc_tags) in enumerate(collect()):
+            docs.append(doc)
+            for term in self.tokenize(text):
+                terms[term].append(doc_id)
+            for tag in doc_tags:
+                tags[tag].append(doc_id)
+        part = {'docs': docs, 'terms': terms, 'tags': tags}
+        if cache is not None:
+            cache.store(key, digest, json.dumps(part, ensure_ascii=False))
+        self.parts.append(part)
+
+    def build(self):
+        """合并所有分片为最终索引"""
+        docs = []
+        merged = defaultdict(list)
+        merged_tags = defaultdict(list)
+        for part in self.parts:
+            offset = len(docs)
+            docs.extend(part['docs'])
+            for term, doc_ids in part['terms'].items():
+                merged[term].extend(doc_id + offset for doc_id in doc_ids)
+            for tag, doc_ids in part['tags'].items():
+                merged_tags[tag].extend(doc_id + offset for doc_id in doc_ids)
+
+        terms = sorted(merged)
+        tags = sorted(merged_tags, key=lambda tag: (tag.lower(), tag))
+        return {'docs': docs, 'terms': terms, 'postings': [self._delta_encode(merged[term]) for term in terms],
+                'tags': tags, 'tagPostings': [self._delta_encode(merged_tags[tag]) for tag in tags]}
+
+    @staticmethod
+    def _delta_encode(doc_ids):
+        """差值编码：各分片按顺序合并，文档ID天然递增"""
+        return [doc_ids[0]] + [b - a for a, b in zip(doc_ids, doc_ids[1:])]
+
+
+# 标签字段 -> 拆分后的标签元组；标签在大量链接间高度重复，每种写法只拆分一次
+_LINK_TAGS = {'': ()}
+
+
+class Link(NamedTuple):
+    """链接记录 - 普通分类中单个链接的紧凑表示
+
+    基于元组，无逐实例字典；类型和标签在大量链接间高度重复，构造时驻留（intern）共享同一字符串对象，
+    多标签的拆分结果同样按标签字段共享（_LINK_TAGS）。
+    """
+
+    name: str
+    url: str
+    description: str = ""
+    type: str = "网站"
+    tag: str = ""
+
+    @classmethod
+    def create(cls, name, url, description="", link_type="网站", tag=""):
+        """创建链接记录，驻留类型和标签字符串（配置中为 null 或非字符串时按字符串处理）"""
+        tag = sys.intern(str(tag or ""))
+        if tag not in _LINK_TAGS:
+            _LINK_TAGS[tag] = cls._split_tags(tag)
+        return cls(name, url, description, sys.intern(str(link_type or "网站")), tag)
+
+    @staticmethod
+    def _split_tags(tag):
+        return tuple(part for part in (item.strip() for item in re.split(r'[,，]', tag)) if part)
+
+    @classmethod
+    def from_config(cls, link):
+        """由 JSON 配置中的链接字典创建"""
+        return cls.create(
+            link.get('name', ''),
+            link.get('url', ''),
+            link.get('description', ''),
+            link.get('type', '网站'),
+            link.get('tag', '')
+        )
+
+    @classmethod
+    def coerce(cls, link_data):
+        """兼容旧格式 [名称, URL, 描述(, 类型(, 标签))]，已是 Link 时原样返回"""
+        if isinstance(link_data, cls):
+            return link_data
+        if len(link_data) == 3:
+            return cls.create(*link_data)
+        if len(link_data) == 4:
+            # 旧格式中四元组的类型字段同时充当标签（"网站"除外）
+            link_name, url, description, link_type = link_data
+            return cls.create(link_name, url, description, link_type, link_type if link_type != "网站" else "")
+        return cls.create(*link_data[:5])
+
+    @property
+    def tags(self):
+        """标签列表：tag 字段可用逗号分隔多个标签，如 "Jenkins,产线" """
+        tags = _LINK_TAGS.get(self.tag)
+        if tags is None:
+            # 工作进程中反序列化得到的链接没有经过 create()
+            tags = _LINK_TAGS[self.tag] = self._split_tags(self.tag)
+        return tags
 
 
 class SoftNavGenerator:
+    # 有专用渲染方法的分类类型，其余类型均按普通分类渲染
+    SPECIAL_SECTION_TYPES = ('ModuleInfo', 'ReleaseNotes', 'InterfaceMap', 'ConfigDocs', 'IconsReference')
+
     def __init__(self, title="嵌入式开发中心", default_layout="list"):
         self.title = title
         self.default_layout = default_layout
@@ -3701,8 +5943,21 @@ class SoftNavGenerator:
         self.interface_routes = InterfaceRouteGenerator()
         self.module_info = {}  # 新增：存储模块信息
         self.generator_info = "SoftNavGenerator v4.0 | 支持二级路由和模块信息 | 增强本地文件夹支持 | 开发者: @wanqiang.liu"
-        self.css_style = CSSManager.get_all_styles()
-        self.js_script = JavaScriptManager.get_all_scripts()
+        # 完整的 CSS/JS 由 AssetBundles 按进程缓存，各实例共享同一个字符串
+        self.css_style = AssetBundles.get('css').text
+        self.js_script = AssetBundles.get('js').text
+        self._build_cache = None  # 增量构建缓存，仅在 generate_html(incremental=True) 期间有效
+        self.virtual_links = False  # 大分类的链接以 JSON 内嵌，由客户端按可见行渲染卡片
+        self.defer_sections = False  # 未激活的分类以 <template> 输出，首次导航时才解析渲染
+
+    def reset_content(self, title, default_layout):
+        """清空已解析的配置内容以便重新加载，保留已组装的CSS/JS"""
+        self.title = title
+        self.default_layout = default_layout
+        self.categories = {}
+        self.release_notes = {}
+        self.interface_routes = InterfaceRouteGenerator()
+        self.module_info = {}
 
     def add_module_info(self, modules_data, categories_config=None):
         """添加模块信息
@@ -3741,9 +5996,13 @@ class SoftNavGenerator:
 
     def _generate_module_info_section(self, category_name, active_class):
         """生成模块信息页面"""
+        return ''.join(self._iter_module_info_section(category_name, active_class))
+
+    def _iter_module_info_section(self, category_name, active_class):
+        """逐块生成模块信息页面（流式输出）"""
         if not self.module_info.get('modules'):
-            return f"""
-            <div class="category-section {active_class}" id="{category_name}">
+            yield f"""
+            <div class="category-section {active_class}" id="{category_name}" data-category-type="ModuleInfo">
                 <div class="section-header">
                     <div class="section-title">
                         <h2>{category_name}</h2>
@@ -3757,6 +6016,7 @@ class SoftNavGenerator:
                 </div>
             </div>
             """
+            return
 
         modules = self.module_info['modules']
         categories_config = self.module_info['categories']
@@ -3788,34 +6048,21 @@ class SoftNavGenerator:
                     all_categories.add(category_list)
 
         # 生成分类选择器
-        category_tabs_html = '<div class="category-tab active" data-category="全部">全部 <span class="category-count">{}</span></div>'.format(
-            total_modules)
+        category_tabs = HtmlFragmentBuilder(
+            '<div class="category-tab active" data-category="全部">全部 '
+            f'<span class="category-count">{total_modules}</span></div>')
 
         for category in sorted(all_categories):
-            category_tabs_html += f'''
+            category_tabs.add(f'''
             <div class="category-tab" data-category="{category}">
                 {category}
                 <span class="category-count">0</span>
             </div>
-            '''
-
-        # 生成模块卡片
-        module_cards_html = ''
-        for module in modules:
-            module_cards_html += self._generate_module_card_html(module)
-
-        # 如果没有模块，显示空状态
-        if not module_cards_html:
-            module_cards_html = '''
-            <div class="empty-modules">
-                <i>📂</i>
-                <p>暂无模块信息</p>
-                <p style="font-size: 0.9em; margin-top: 10px; opacity: 0.7;">请检查配置文件中的ModuleInfo数据</p>
-            </div>
-            '''
+            ''')
+        category_tabs_html = category_tabs.build()
 
-        return f"""
-        <div class="category-section {active_class}" id="{category_name}">
+        yield f"""
+        <div class="category-section {active_class}" id="{category_name}" data-category-type="ModuleInfo">
             <div class="section-header">
                 <div class="section-title">
                     <h2>{category_name}</h2>
@@ -3861,7 +6108,26 @@ class SoftNavGenerator:
 
                 <!-- 模块卡片容器 -->
                 <div class="module-cards-container">
-                    {module_cards_html}
+                    """
+
+        # 生成模块卡片
+        has_cards = False
+        for module in modules:
+            module_card_html = self._generate_module_card_html(module)
+            has_cards = has_cards or bool(module_card_html)
+            yield module_card_html
+
+        # 如果没有模块，显示空状态
+        if not has_cards:
+            yield '''
+            <div class="empty-modules">
+                <i>📂</i>
+                <p>暂无模块信息</p>
+                <p style="font-size: 0.9em; margin-top: 10px; opacity: 0.7;">请检查配置文件中的ModuleInfo数据</p>
+            </div>
+            '''
+
+        yield """
                 </div>
             </div>
         </div>
@@ -3886,7 +6152,7 @@ class SoftNavGenerator:
                 all_categories.append(str(category_list).strip())
 
         # 生成分类标签HTML
-        tags_html = ''
+        tags = HtmlFragmentBuilder()
         for category in all_categories:
             if not category:
                 continue
@@ -3908,10 +6174,11 @@ class SoftNavGenerator:
             elif any(biz in category_lower for biz in ['业务', 'domain', '用户', '订单', '支付', 'business']):
                 tag_type = 'business'
 
-            tags_html += f'<span class="module-tag {tag_type}">{category}</span>'
+            tags.add(f'<span class="module-tag {tag_type}">{category}</span>')
+        tags_html = tags.build()
 
         # 生成动态属性HTML - 修复：确保变量被定义
-        attributes_html = ''
+        attributes_builder = HtmlFragmentBuilder()
         attributes = module_data.get('attributes', {})
 
         # 默认字段映射到图标
@@ -3949,17 +6216,18 @@ class SoftNavGenerator:
                 else:
                     value_html = str(value)
 
-                attributes_html += f'''
+                attributes_builder.add(f'''
                 <div class="attribute-item">
                     <div class="attribute-label">
                         <i>{icon}</i>{display_name}
                     </div>
                     <div class="attribute-value">{value_html}</div>
                 </div>
-                '''
+                ''')
+        attributes_html = attributes_builder.build()
 
         # 生成负责人HTML - 修复：确保变量被定义
-        owners_html = ''
+        owners_builder = HtmlFragmentBuilder()
         owners = module_data.get('owners', [])
 
         for owner in owners:
@@ -3979,13 +6247,14 @@ class SoftNavGenerator:
             # 生成头像首字母
             avatar_text = name[0].upper() if name else '?'
 
-            contact_html = ''
+            contact = HtmlFragmentBuilder()
             if email:
-                contact_html += f'<a href="mailto:{email}" title="发送邮件">📧</a>'
+                contact.add(f'<a href="mailto:{email}" title="发送邮件">📧</a>')
             if phone:
-                contact_html += f'<a href="tel:{phone}" title="拨打电话">📞</a>'
+                contact.add(f'<a href="tel:{phone}" title="拨打电话">📞</a>')
+            contact_html = contact.build()
 
-            owners_html += f'''
+            owners_builder.add(f'''
             <div class="owner-item">
                 <div class="owner-avatar">{avatar_text}</div>
                 <div class="owner-info">
@@ -3996,7 +6265,8 @@ class SoftNavGenerator:
                     {contact_html}
                 </div>
             </div>
-            '''
+            ''')
+        owners_html = owners_builder.build()
 
         # 构建模块卡片HTML - 确保分类属性格式正确
         module_categories_attr = '|'.join(all_categories) if all_categories else ''
@@ -4097,16 +6367,20 @@ class SoftNavGenerator:
 
         Args:
             category_name: 分类名称
-            links_list: 主分类下的链接列表
+            links_list: 主分类下的链接列表，元素为 Link 或旧格式 ["链接名", "URL", "描述", "类型", "标签"]
             icon: 分类图标
             category_type: 分类类型
-            subcategories: 二级分类字典，格式 [["链接名", "URL", "描述", "类型", "标签"], ...]
+            subcategories: 二级分类字典，格式 {"名称": {"icon": "📁", "links": [...]}}
         """
+        subcategories = {
+            subcat_name: dict(subcat_data, links=[Link.coerce(link) for link in subcat_data.get("links", [])])
+            for subcat_name, subcat_data in (subcategories or {}).items()
+        }
         self.categories[category_name] = {
             "icon": icon,
             "type": category_type,
-            "links": links_list,
-            "subcategories": subcategories or {}
+            "links": [Link.coerce(link) for link in links_list],
+            "subcategories": subcategories
         }
 
     def add_release_note(self, release_type, releases):
@@ -4136,6 +6410,10 @@ class SoftNavGenerator:
 
     def _generate_normal_category_section(self, category_name, category_data, active_class):
         """生成普通分类页面，支持二级路由"""
+        return ''.join(self._iter_normal_category_section(category_name, category_data, active_class))
+
+    def _iter_normal_category_section(self, category_name, category_data, active_class):
+        """逐块生成普通分类页面（流式输出）"""
         # 检查是否有二级分类
         has_subcategories = bool(category_data.get("subcategories"))
 
@@ -4153,42 +6431,47 @@ class SoftNavGenerator:
             for subcat_name, subcat_data in category_data["subcategories"].items():
                 all_links.extend(subcat_data.get("links", []))
 
-        # 生成标签筛选器（基于所有链接）
-        all_tags = set()
-        for link_data in all_links:
-            if len(link_data) >= 5:
-                tag = link_data[4]
-                if tag:
-                    all_tags.add(tag)
+        # 链接较多时改为内嵌数据，由客户端虚拟列表渲染
+        virtual = self.virtual_links and len(all_links) >= VIRTUAL_LINKS_THRESHOLD
+        virtual_attr = ' data-virtual-links' if virtual else ''
+
+        # 卡片成员索引：标签倒排列表和二级分类区间，同时决定标签筛选器及各标签的卡片数
+        card_index = self._build_card_index(category_data)
+        all_tags = card_index['tags']
 
         tag_filters_html = ""
         if all_tags:
-            tag_filters_html = '<div class="tag-filters">'
-            tag_filters_html += '<div class="tag-filter active" data-tag="全部">全部</div>'
-            for tag in sorted(all_tags):
-                tag_filters_html += f'<div class="tag-filter" data-tag="{tag}">{tag}</div>'
-            tag_filters_html += '</div>'
+            tag_filters = HtmlFragmentBuilder(
+                '<div class="tag-filters">',
+                '<div class="tag-filter active" data-tag="全部">全部</div>'
+            )
+            tag_filters.extend(f'<div class="tag-filter" data-tag="{tag}">{tag}'
+                               f'<span class="tag-count">{len(cards)}</span></div>'
+                               for tag, cards in zip(all_tags, card_index['tagCards']))
+            # 多选标签的组合方式，默认同时满足（AND）
+            tag_filters.add('<button class="tag-mode" data-mode="and" title="点击切换多选标签的组合方式">同时满足 (AND)</button>')
+            tag_filters.add('</div>')
+            tag_filters_html = tag_filters.build()
 
         # 生成二级导航HTML
         subcategory_nav_html = ""
-        subcategory_content_html = ""
 
         if has_subcategories:
             # 标记这个分类有二级分类
             subcategory_class = "has-subcategories"
 
             # 生成二级导航
-            subcategory_nav_html = '<div class="subcategory-nav">\n<div class="subcategory-list">\n'
+            subcategory_nav = HtmlFragmentBuilder('<div class="subcategory-nav">\n<div class="subcategory-list">\n')
 
             # 添加"全部"选项
             total_count = len(all_links)
-            subcategory_nav_html += f'''
+            subcategory_nav.add(f'''
             <button class="subcategory-item active" data-subcategory="全部">
                 <i>📂</i>
                 <span>全部</span>
                 <span class="count">{total_count}</span>
             </button>
-            '''
+            ''')
 
             # 添加二级分类选项
             for subcat_name, subcat_data in category_data["subcategories"].items():
@@ -4196,101 +6479,152 @@ class SoftNavGenerator:
                 subcat_links = subcat_data.get("links", [])
                 subcat_count = len(subcat_links)
 
-                subcategory_nav_html += f'''
+                subcategory_nav.add(f'''
                 <button class="subcategory-item" data-subcategory="{subcat_name}">
                     <i>{subcat_icon}</i>
                     <span>{subcat_name}</span>
                     <span class="count">{subcat_count}</span>
                 </button>
-                '''
-
-            subcategory_nav_html += '</div>\n</div>\n'
-
-            # 生成二级分类内容容器
-            subcategory_content_html = '<div class="subcategory-content">\n'
-            subcategory_content_html += tag_filters_html + '\n'
+                ''')
 
-            # 主分类的所有链接容器（"全部"视图）
-            all_links_container = f'''
-            <div class="cards-container {default_layout_class}" id="all-links-{category_name}">
-            '''
+            subcategory_nav.add('</div>\n</div>\n')
+            subcategory_nav_html = subcategory_nav.build()
+        else:
+            # 没有二级分类的普通分类
+            subcategory_class = ""
 
-            for link_data in all_links:
-                all_links_container += self._generate_link_card_html(link_data)
+        section_class = f"category-section {active_class} {subcategory_class}"
+        yield f"""
+            <div class="{section_class}" id="{category_name}" data-category-type="普通分类">
+                <div class="section-header">
+                    <div class="section-title">
+                        <h2>{category_name}</h2>
+                        <p>发现 {len(all_links)} 个精选资源</p>
+                    </div>
+                    <div class="layout-controls">
+                        <button class="layout-btn {default_list_btn_active}" data-layout="list">列表视图</button>
+                        <button class="layout-btn {default_grid_btn_active}" data-layout="grid">格子视图</button>
+                    </div>
+                </div>
+                """
 
-            all_links_container += '</div>\n'
-            subcategory_content_html += all_links_container
+        if has_subcategories:
+            # 内容容器
+            yield f'''
+            <div class="category-content-container">
+                {subcategory_nav_html}
+                '''
 
-            # 每个二级分类的链接容器
-            for subcat_name, subcat_data in category_data["subcategories"].items():
-                subcat_links = subcat_data.get("links", [])
+            # 生成二级分类内容容器
+            yield '<div class="subcategory-content">\n'
+            yield tag_filters_html + '\n'
 
-                subcategory_content_html += f'''
-                <div class="subcategory-cards {default_layout_class}" data-subcategory="{subcat_name}" style="display: none;">
-                '''
+            # 所有链接只渲染一次，二级分类的卡片带 data-subcategory 属性，由脚本按属性筛选
+            yield f'''
+            <div class="cards-container {default_layout_class}" id="all-links-{category_name}"{virtual_attr}>
+            '''
 
-                for link_data in subcat_links:
-                    subcategory_content_html += self._generate_link_card_html(link_data)
+            yield self._generate_card_index_island(card_index)
+            if virtual:
+                yield self._generate_link_data_island(category_data)
+            else:
+                for link in category_data["links"]:
+                    yield self._generate_link_card_html(link)
 
-                subcategory_content_html += '</div>\n'
+                for subcat_name, subcat_data in category_data["subcategories"].items():
+                    for link in subcat_data.get("links", []):
+                        yield self._generate_link_card_html(link, subcat_name)
 
-            subcategory_content_html += '</div>\n'
+            yield '</div>\n'
 
-            # 内容容器
-            category_content = f'''
-            <div class="category-content-container">
-                {subcategory_nav_html}
-                {subcategory_content_html}
+            yield '</div>\n'
+            yield '''
             </div>
             '''
         else:
-            # 没有二级分类的普通分类
-            subcategory_class = ""
-            category_content = f'''
+            yield f'''
             <div class="category-content-container">
                 <div class="subcategory-content" style="width: 100%;">
                     {tag_filters_html}
-                    <div class="cards-container {default_layout_class}">
+                    <div class="cards-container {default_layout_class}"{virtual_attr}>
             '''
 
-            for link_data in category_data["links"]:
-                category_content += self._generate_link_card_html(link_data)
+            # 虚拟列表总是依赖索引筛选；直接输出的卡片只在有标签时才需要
+            if virtual or all_tags:
+                yield self._generate_card_index_island(card_index)
+            if virtual:
+                yield self._generate_link_data_island(category_data)
+            else:
+                for link in category_data["links"]:
+                    yield self._generate_link_card_html(link)
 
-            category_content += '''
+            yield '''
                     </div>
                 </div>
             </div>
             '''
 
-        category_section = f"""
-            <div class="category-section {active_class} {subcategory_class}" id="{category_name}">
-                <div class="section-header">
-                    <div class="section-title">
-                        <h2>{category_name}</h2>
-                        <p>发现 {len(all_links)} 个精选资源</p>
-                    </div>
-                    <div class="layout-controls">
-                        <button class="layout-btn {default_list_btn_active}" data-layout="list">列表视图</button>
-                        <button class="layout-btn {default_grid_btn_active}" data-layout="grid">格子视图</button>
-                    </div>
-                </div>
-                {category_content}
+        yield """
             </div>
         """
 
-        return category_section
+    @staticmethod
+    def _is_local_link(link):
+        """判断链接是否指向本地/共享文件夹"""
+        return link.url.startswith(r'\\') or '本地文件夹' in link.type
+
+    def _generate_link_data_island(self, category_data):
+        """生成虚拟化分类的链接数据（内嵌 JSON）
+
+        每个链接为 [名称, URL, 描述, 类型, 标签, 二级分类下标(-1 表示主分类), 是否本地文件夹]。
+        """
+        subcategories = list(category_data["subcategories"])
+        links = [[*link, -1, int(self._is_local_link(link))] for link in category_data["links"]]
+        for index, subcat_data in enumerate(category_data["subcategories"].values()):
+            links.extend([*link, index, int(self._is_local_link(link))] for link in subcat_data.get("links", []))
+
+        payload = json.dumps({'subcategories': subcategories, 'links': links}, ensure_ascii=False,
+                             separators=(',', ':'))
+        # 防止数据中的 "</script>" 提前结束脚本块
+        payload = payload.replace('</', '<\\/')
+        return f'<script type="application/json" class="link-data">{payload}</script>\n'
 
-    def _generate_link_card_html(self, link_data):
-        """生成链接卡片HTML"""
-        if len(link_data) == 3:
-            link_name, url, description = link_data
-            link_type = "网站"
-            tag = ""
-        elif len(link_data) == 4:
-            link_name, url, description, link_type = link_data
-            tag = link_type if link_type != "网站" else ""
-        else:
-            link_name, url, description, link_type, tag = link_data
+    @staticmethod
+    def _build_card_index(category_data):
+        """构建分类的卡片成员索引，客户端多选标签筛选和计数只做数组运算
+
+        卡片按主分类、各二级分类的顺序输出，每个二级分类对应连续的下标区间 [start, end)；
+        每个标签（逗号分隔的多个标签分别计入）对应升序排列的卡片下标数组。
+        """
+        tag_cards = defaultdict(list)
+        subcategories = {}
+        index = 0
+        groups = [(None, category_data["links"])]
+        groups.extend((subcat_name, subcat_data.get("links", []))
+                      for subcat_name, subcat_data in category_data["subcategories"].items())
+        for subcat_name, links in groups:
+            start = index
+            for link in links:
+                for tag in link.tags:
+                    tag_cards[tag].append(index)
+                index += 1
+            if subcat_name is not None:
+                subcategories[subcat_name] = [start, index]
+
+        tags = sorted(tag_cards)
+        return {'tags': tags, 'tagCards': [tag_cards[tag] for tag in tags], 'subcategories': subcategories}
+
+    @staticmethod
+    def _generate_card_index_island(card_index):
+        """生成卡片成员索引（内嵌 JSON）"""
+        payload = json.dumps(card_index, ensure_ascii=False, separators=(',', ':'))
+        # 防止数据中的 "</script>" 提前结束脚本块
+        payload = payload.replace('</', '<\\/')
+        return f'<script type="application/json" class="card-index">{payload}</script>\n'
+
+    def _generate_link_card_html(self, link, subcategory=None):
+        """生成链接卡片HTML，subcategory 为所属二级分类名称"""
+        link_name, url, description, link_type, tag = link
 
         # 检测是否为本地路径
         is_local_path = False
@@ -4298,7 +6632,7 @@ class SoftNavGenerator:
         local_path_text = "访问"
 
         original_path = url
-        if (url.startswith(r'\\') or '本地文件夹' in link_type):
+        if self._is_local_link(link):
             is_local_path = True
             local_path_icon = "📁"
             local_path_text = "打开"
@@ -4323,6 +6657,8 @@ class SoftNavGenerator:
 
         # 添加数据标签属性用于筛选
         data_tag_attr = f'data-tags="{tag}"' if tag else ""
+        if subcategory:
+            data_tag_attr += f' data-subcategory="{subcategory}"'
 
         link_card_html = f"""
             <div class="link-card" data-is-local="{str(is_local_path).lower()}" data-original-path="{original_path}" {data_tag_attr}>
@@ -4350,8 +6686,12 @@ class SoftNavGenerator:
 
     def _generate_release_notes_section(self, category_name, active_class):
         """生成发布说明页面"""
-        category_section = f"""
-            <div class="category-section {active_class}" id="{category_name}">
+        return ''.join(self._iter_release_notes_section(category_name, active_class))
+
+    def _iter_release_notes_section(self, category_name, active_class):
+        """逐块生成发布说明页面（流式输出）"""
+        yield f"""
+            <div class="category-section {active_class}" id="{category_name}" data-category-type="ReleaseNotes">
                 <div class="section-header">
                     <div class="section-title">
                         <h2>{category_name}</h2>
@@ -4361,7 +6701,7 @@ class SoftNavGenerator:
         """
 
         if self.release_notes:
-            category_section += """
+            yield """
                 <div class="timeline-layout">
                     <!-- 左侧发布类型列表 -->
                     <div class="release-types-sidebar">
@@ -4374,7 +6714,7 @@ class SoftNavGenerator:
                 count = len(releases)
                 description = releases[0].get('type_description', '') if releases else ''
 
-                category_section += f"""
+                yield f"""
                         <div class="release-type-card {active_card_class}" data-release-type="{release_type}">
                             <div class="release-type-header">
                                 <div class="release-type-icon">{icon}</div>
@@ -4385,71 +6725,100 @@ class SoftNavGenerator:
                         </div>
                 """
 
-            category_section += """
+            yield """
                     </div>
                     <!-- 右侧时间轴容器 -->
                     <div class="timeline-container">
             """
 
-            # 为每个发布类型生成时间轴
+            # 为每个发布类型生成时间轴（按发布类型增量缓存）
             for j, (release_type, releases) in enumerate(self.release_notes.items()):
                 display_style = "block" if j == 0 else "none"
-                category_section += f"""
+                yield from self._iter_cached(
+                    f"ReleaseNotes:{release_type}", (display_style, releases),
+                    self._iter_release_timeline, release_type, releases, display_style)
+
+            yield """
+                    </div>
+                </div>
+            """
+        else:
+            yield """
+                <div style="text-align: center; padding: 40px; color: var(--text-secondary);">
+                    <p>暂无发布说明数据</p>
+                </div>
+            """
+
+        yield """
+            </div>
+        """
+
+    def _iter_release_timeline(self, release_type, releases, display_style):
+        """逐块生成单个发布类型的时间轴"""
+        yield f"""
                         <div class="timeline" id="timeline-{release_type}" style="display: {display_style};">"""
 
-                for release in reversed(releases):
-                    version = release.get('version', '')
-                    date = release.get('date', '')
-                    description = release.get('description', '')
-                    details = release.get('details', '')
-
-                    # 新增字段
-                    main_version = release.get('main_version', '')
-                    dev = release.get('dev', '')
-                    branch = release.get('branch', '')
-                    tag = release.get('tag', '')
-                    commit = release.get('commit', '')
-
-                    # 解析特性列表
-                    features_html = ""
-                    if details:
-                        if isinstance(details, str):
-                            features = [f.strip() for f in details.split(';') if f.strip()]
-                        else:
-                            features = details
-                        if features:
-                            features_html = "<ul class='features'>" + "".join(
-                                [f"<li>{f}</li>" for f in features]) + "</ul>"
-
-                    # 生成元信息HTML
-                    meta_html = ""
-                    if main_version or dev or branch or tag or commit:
-                        meta_html = '<div class="release-meta">'
-
-                        if main_version:
-                            meta_html += f'<div class="meta-item"><i>📦</i><span class="meta-label">主线版本:</span><span class="meta-value">{main_version}</span></div>'
-
-                        if dev:
-                            meta_html += f'<div class="meta-item dev"><i>👤</i><span class="meta-label">开发:</span><span class="meta-value">{dev}</span></div>'
-
-                        if branch:
-                            meta_html += f'<div class="meta-item branch"><i>🌿</i><span class="meta-label">分支:</span><span class="meta-value">{branch}</span></div>'
-
-                        if tag:
-                            meta_html += f'<div class="meta-item tag"><i>🏷️</i><span class="meta-label">标签:</span><span class="meta-value">{tag}</span></div>'
-
-                        if commit:
-                            # 如果提交哈希较长，可以截取前7位
-                            commit_display = commit[:7] if len(commit) > 7 else commit
-                            meta_html += f'<div class="meta-item commit"><i>🔗</i><span class="meta-label">提交:</span><span class="meta-value">{commit_display}</span></div>'
-
-                        meta_html += '</div>'
-
-                    # 版本标签
-                    version_html = f'<span class="version-tag stable">{release_type}:{str(version).upper()}</span>' if version else ''
-                    main_version_html = f'<span class="version-tag beta">软件版本:{str(main_version).upper()}</span>' if main_version else ''
-
-                    category_section += f"""
+        for release in reversed(releases):
+            version = release.get('version', '')
+            date = release.get('date', '')
+            description = release.get('description', '')
+            details = release.get('details', '')
+
+            # 新增字段
+            main_version = release.get('main_version', '')
+            dev = release.get('dev', '')
+            branch = release.get('branch', '')
+            tag = release.get('tag', '')
+            commit = release.get('commit', '')
+
+            # 解析特性列表
+            features_html = ""
+            if details:
+                if isinstance(details, str):
+                    features = [f.strip() for f in details.split(';') if f.strip()]
+                else:
+                    features = details
+                if features:
+                    features_html = "<ul class='features'>" + "".join(
+                        [f"<li>{f}</li>" for f in features]) + "</ul>"
+
+            # 生成元信息HTML
+            meta_html = ""
+            if main_version or dev or branch or tag or commit:
+                meta = HtmlFragmentBuilder('<div class="release-meta">')
+
+                if main_version:
+                    meta.add(f'<div class="meta-item"><i>📦</i><span class="meta-label">主线版本:</span>'
+                             f'<span class="meta-value">{main_version}</span></div>')
+
+                if dev:
+                    meta.add(f'<div class="meta-item dev"><i>👤</i><span class="meta-label">开发:</span>'
+                             f'<span class="meta-value">{dev}</span></div>')
+
+                if branch:
+                    meta.add(f'<div class="meta-item branch"><i>🌿</i><span class="meta-label">分支:</span>'
+                             f'<span class="meta-value">{branch}</span></div>')
+
+                if tag:
+                    meta.add(f'<div class="meta-item tag"><i>🏷️</i><span class="meta-label">标签:</span>'
+                             f'<span class="meta-value">{tag}</span></div>')
+
+                if commit:
+                    # 如果提交哈希较长，可以截取前7位
+                    commit_display = commit[:7] if len(commit) > 7 else commit
+                    meta.add(f'<div class="meta-item commit"><i>🔗</i><span class="meta-label">提交:</span>'
+                             f'<span class="meta-value">{commit_display}</span></div>')
+
+                meta.add('</div>')
+                meta_html = meta.build()
+
+            # 版本标签
+            version_html = (f'<span class="version-tag stable">{release_type}:{str(version).upper()}</span>'
+                            if version else '')
+            main_version_html = (f'<span class="version-tag beta">软件版本:{str(main_version).upper()}</span>'
+                                 if main_version else '')
+
+            yield f"""
                             <div class="timeline-item">
                                 <div class="timeline-date">{date}</div>
                                 <div class="timeline-content">
@@ -4461,55 +6830,51 @@ class SoftNavGenerator:
                             </div>
                     """
 
-                category_section += """
+        yield """
                         </div>
                 """
 
-            category_section += """
+    def _generate_interface_map_section(self, category_name, active_class):
+        """生成版本接口页面"""
+        return ''.join(self._iter_interface_map_section(category_name, active_class))
+
+    def _iter_interface_map_section(self, category_name, active_class):
+        """逐块生成版本接口页面（流式输出）"""
+        yield f"""
+            <div class="category-section {active_class}" id="{category_name}" data-category-type="InterfaceMap">
+                <div class="section-header">
+                    <div class="section-title">
+                        <h2>{category_name}</h2>
+                        <p>Git分支演变与接口版本管理</p>
                     </div>
                 </div>
-            """
-        else:
-            category_section += """
-                <div style="text-align: center; padding: 40px; color: var(--text-secondary);">
-                    <p>暂无发布说明数据</p>
-                </div>
-            """
-
-        category_section += """
-            </div>
-        """
-        return category_section
+                """
 
-    def _generate_interface_map_section(self, category_name, active_class):
-        """生成版本接口页面"""
         if self.interface_routes.interface_routes:
-            interface_routes_content = self.interface_routes.generate_interface_routes_html()
+            # 按版本仓库增量缓存
+            for route_name, route_data in self.interface_routes.interface_routes.items():
+                yield from self._iter_cached(
+                    f"InterfaceMap:{route_name}", (self.interface_routes.lazy_render, route_data),
+                    self.interface_routes._iter_interface_route_html, route_name, route_data)
         else:
-            interface_routes_content = """
+            yield """
                 <div style="text-align: center; padding: 40px; color: var(--text-secondary);">
                     <p>暂无版本接口数据</p>
                 </div>
             """
 
-        return f"""
-            <div class="category-section {active_class}" id="{category_name}">
-                <div class="section-header">
-                    <div class="section-title">
-                        <h2>{category_name}</h2>
-                        <p>Git分支演变与接口版本管理</p>
-                    </div>
-                </div>
-                {interface_routes_content}
+        yield """
             </div>
         """
 
     def _generate_config_docs_section(self, category_name, active_class):
         """生成配置说明页面"""
-        config_docs_content = self._generate_config_documentation()
+        return ''.join(self._iter_config_docs_section(category_name, active_class))
 
-        return f"""
-            <div class="category-section {active_class}" id="{category_name}">
+    def _iter_config_docs_section(self, category_name, active_class):
+        """逐块生成配置说明页面（流式输出）"""
+        yield f"""
+            <div class="category-section {active_class}" id="{category_name}" data-category-type="ConfigDocs">
                 <div class="section-header">
                     <div class="section-title">
                         <h2>{category_name}</h2>
@@ -4517,17 +6882,21 @@ class SoftNavGenerator:
                     </div>
                 </div>
                 <div class="config-docs">
-                    {config_docs_content}
+                    """
+        yield self._generate_config_documentation()
+        yield """
                 </div>
             </div>
         """
 
     def _generate_icons_reference_section(self, category_name, active_class):
         """生成图标引用页面"""
-        icons_reference_content = self._generate_icons_reference()
+        return ''.join(self._iter_icons_reference_section(category_name, active_class))
 
-        return f"""
-            <div class="category-section {active_class}" id="{category_name}">
+    def _iter_icons_reference_section(self, category_name, active_class):
+        """逐块生成图标引用页面（流式输出）"""
+        yield f"""
+            <div class="category-section {active_class}" id="{category_name}" data-category-type="IconsReference">
                 <div class="section-header">
                     <div class="section-title">
                         <h2>{category_name}</h2>
@@ -4535,7 +6904,9 @@ class SoftNavGenerator:
                     </div>
                 </div>
                 <div class="config-docs">
-                    {icons_reference_content}
+                    """
+        yield self._generate_icons_reference()
+        yield """
                 </div>
             </div>
         """
@@ -5409,8 +7780,9 @@ class SoftNavGenerator:
             </div>
             """
 
-    def _get_svg_data(self):
-        """获取SVG图标数据和分类 - 统一管理"""
+    @staticmethod
+    def _get_svg_data():
+        """获取SVG图标数据和分类 - 统一管理（原始数据，请通过 SVGIconRegistry 访问）"""
         return {
             "icons": {
                 # ============ 文件操作 ============
@@ -5891,65 +8263,31 @@ class SoftNavGenerator:
             "categories": None  # 这里会在初始化时自动生成
         }
 
-    # 在你的类中添加辅助方法
     def _init_svg_data(self):
-        """初始化SVG数据，自动生成分类索引"""
-        svg_data = self._get_svg_data()
-
-        # 自动生成分类索引
-        categories = {}
-        for icon_name, icon_data in svg_data["icons"].items():
-            category = icon_data["category"]
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(icon_name)
-
-        svg_data["categories"] = categories
-        return svg_data
+        """获取SVG数据（兼容原有接口），数据来自进程级只读注册表"""
+        registry = SVGIconRegistry.get()
+        return {"icons": registry.icons, "categories": registry.categories}
 
     def _get_svg_icons(self):
         """获取所有SVG图标（兼容原有接口）"""
-        svg_data = self._init_svg_data()
-        return {name: data["svg"] for name, data in svg_data["icons"].items()}
+        return SVGIconRegistry.get().svgs
 
     def _get_svg_categories(self):
         """获取SVG分类（兼容原有接口）"""
-        svg_data = self._init_svg_data()
-        return svg_data["categories"]
+        return SVGIconRegistry.get().categories
 
     def _get_icon_info(self, icon_name):
         """获取图标详细信息"""
-        svg_data = self._init_svg_data()
-        if icon_name in svg_data["icons"]:
-            return svg_data["icons"][icon_name]
-        return None
+        return SVGIconRegistry.get().icons.get(icon_name)
 
     def _get_icons_by_category(self, category):
         """按分类获取图标"""
-        svg_data = self._init_svg_data()
-        icons = {}
-        for icon_name in svg_data["categories"].get(category, []):
-            if icon_name in svg_data["icons"]:
-                icons[icon_name] = svg_data["icons"][icon_name]["svg"]
-        return icons
+        registry = SVGIconRegistry.get()
+        return {icon_name: registry.svgs[icon_name] for icon_name in registry.categories.get(category, ())}
 
     def _search_icons(self, keyword):
         """搜索图标（按名称或标签）"""
-        svg_data = self._init_svg_data()
-        results = {}
-        keyword_lower = keyword.lower()
-
-        for icon_name, icon_data in svg_data["icons"].items():
-            # 匹配图标名称
-            if keyword_lower in icon_name.lower():
-                results[icon_name] = icon_data["svg"]
-                continue
-
-            # 匹配标签
-            if any(keyword_lower in tag.lower() for tag in icon_data["tags"]):
-                results[icon_name] = icon_data["svg"]
-
-        return results
+        return SVGIconRegistry.get().search(keyword)
 
     def _render_icon(self, icon_value):
         """根据icon值渲染图标，支持emoji和SVG ID
@@ -6042,28 +8380,28 @@ class SoftNavGenerator:
         ]
 
         # 生成Emoji部分
-        emoji_sections = ""
+        emoji_sections = HtmlFragmentBuilder()
         for category in emoji_categories:
-            emoji_grid = ""
+            emoji_grid = HtmlFragmentBuilder()
             for emoji in category["emojis"]:
                 # 简化处理，避免复杂的ord()调用
                 char_code = f"U+{ord(emoji[0]):04X}" if emoji else "U+0000"
 
-                emoji_grid += f"""
-                <div class="icon-item emoji-item" data-icon="{emoji}" onclick="copyIcon('{emoji}')">
+                emoji_grid.add(f"""
+                <div class="icon-item emoji-item" data-icon="{emoji}">
                     <div class="icon-display">{emoji}</div>
                     <div class="icon-code">{char_code}</div>
                 </div>
-                """
+                """)
 
-            emoji_sections += f"""
+            emoji_sections.add(f"""
             <div class="icon-category">
                 <h4>{category["name"]}</h4>
                 <div class="icon-grid">
-                    {emoji_grid}
+                    {emoji_grid.build()}
                 </div>
             </div>
-            """
+            """)
 
         # SVG图标部分 - 简化为按分类显示
         # 1. 获取所有图标（兼容原有代码）
@@ -6079,29 +8417,29 @@ class SoftNavGenerator:
         search_results = self._search_icons("代码")
         # 搜索"代码"会返回: code, file-code等
 
-        svg_sections = ""
+        svg_sections = HtmlFragmentBuilder()
         for category_name, icon_ids in svg_categories.items():
-            svg_grid = ""
+            svg_grid = HtmlFragmentBuilder()
             for icon_id in icon_ids:
                 if icon_id in svg_icons:
                     svg_code = svg_icons[icon_id]
-                    svg_grid += f"""
-                    <div class="icon-item svg-item" data-icon-id="{icon_id}" onclick="copyIcon('{icon_id}')">
+                    svg_grid.add(f"""
+                    <div class="icon-item svg-item" data-icon-id="{icon_id}">
                         <div class="icon-display svg-display">
                             {svg_code}
                         </div>
                         <div class="icon-id">{icon_id}</div>
                     </div>
-                    """
+                    """)
 
-            svg_sections += f"""
+            svg_sections.add(f"""
             <div class="icon-category">
                 <h4>{category_name}</h4>
                 <div class="icon-grid svg-grid">
-                    {svg_grid}
+                    {svg_grid.build()}
                 </div>
             </div>
-            """
+            """)
 
         return f"""
         <div class="docs-container">
@@ -6124,14 +8462,14 @@ class SoftNavGenerator:
                 <h3>😀 Emoji 图标</h3>
                 <p>Unicode Emoji，直接使用字符串格式。</p>
 
-                {emoji_sections}
+                {emoji_sections.build()}
             </div>
 
             <div class="doc-section">
                 <h3>🎨 SVG 矢量图标</h3>
                 <p>使用Lucide图标集，点击复制图标ID。</p>
 
-                {svg_sections}
+                {svg_sections.build()}
 
                 <h4>使用示例</h4>
                 <div class="config-example">
@@ -6154,53 +8492,240 @@ class SoftNavGenerator:
         </div>
         """
 
-    def generate_html(self, output_file="soft_navigation.html"):
-        """生成导航网站"""
-        # 生成时间
-        generated_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def _iter_cached(self, cache_key, inputs, render, *args):
+        """增量构建：输入哈希未变化时直接输出缓存片段，否则渲染并写入缓存
+
+        Args:
+            cache_key: 片段缓存键
+            inputs: 决定片段内容的配置切片
+            render: 逐块生成片段的方法，使用 *args 调用
+        """
+        cache = self._build_cache
+        if cache is None:
+            yield from render(*args)
+            return
+
+        digest = cache.digest(inputs)
+        html = cache.lookup(cache_key, digest)
+        if html is None:
+            html = ''.join(render(*args))
+            cache.store(cache_key, digest, html)
+        yield html
+
+    def _iter_category_section(self, category_name, category_data, active_section):
+        """根据分类类型逐块生成分类内容区域"""
+        category_type = category_data.get('type', '普通分类')
+
+        if category_type == 'ModuleInfo':
+            # 模块信息页面
+            return self._iter_cached(
+                f"ModuleInfo:{category_name}", (active_section, self.module_info),
+                self._iter_module_info_section, category_name, active_section)
+        elif category_type == 'ReleaseNotes':
+            # 发布说明页面（时间轴按发布类型缓存）
+            return self._iter_release_notes_section(category_name, active_section)
+        elif category_type == 'InterfaceMap':
+            # 版本接口页面（按版本仓库缓存）
+            return self._iter_interface_map_section(category_name, active_section)
+        elif category_type == 'ConfigDocs':
+            # 配置说明页面
+            return self._iter_cached(
+                f"ConfigDocs:{category_name}", active_section,
+                self._iter_config_docs_section, category_name, active_section)
+        elif category_type == 'IconsReference':
+            # 图标引用页面
+            return self._iter_cached(
+                f"IconsReference:{category_name}", active_section,
+                self._iter_icons_reference_section, category_name, active_section)
+        else:
+            # 普通分类页面（支持二级路由）
+            return self._iter_cached(
+                f"普通分类:{category_name}", (active_section, self.default_layout, self.virtual_links, category_data),
+                self._iter_normal_category_section, category_name, category_data, active_section)
 
-        # 生成分类导航HTML
-        nav_items = ""
-        category_sections = ""
+    @staticmethod
+    def _iter_deferred_section(category_name, section_chunks):
+        """将分类内容包装为惰性的 <template>"""
+        yield f'<template class="deferred-section" data-section="{category_name}">'
+        yield from section_chunks
+        yield '</template>\n'
 
-        # 首先生成所有分类的导航项
+    def build_search_index(self):
+        """构建全文搜索索引，返回索引字典
+
+        模块、发布说明和版本接口只在存在对应类型的分类页面时才编入索引。
+        """
+        builder = SearchIndexBuilder(self._build_cache)
+        sections = {}
+        for category_name, category_data in self.categories.items():
+            sections.setdefault(category_data.get('type', '普通分类'), category_name)
+
+        for category_name, category_data in self.categories.items():
+            # 与 _iter_category_section 一致：未知类型按普通分类渲染
+            if category_data.get('type', '普通分类') in self.SPECIAL_SECTION_TYPES:
+                continue
+
+            def collect_links(category_name=category_name, category_data=category_data):
+                groups = [('', category_data["links"])]
+                groups.extend((subcat_name, subcat_data.get("links", []))
+                              for subcat_name, subcat_data in category_data["subcategories"].items())
+                for subcat_name, links in groups:
+                    for link in links:
+                        doc = [SearchIndexBuilder.KIND_LINK, link.name, link.description, category_name, link.url]
+                        yield (doc, ' '.join((link.name, link.description, link.type, link.tag, subcat_name)),
+                               *link.tags)
+
+            builder.add_part(f"SearchIndex:普通分类:{category_name}", (category_name, category_data), collect_links)
+
+        module_section = sections.get('ModuleInfo')
+        if module_section and self.module_info.get('modules'):
+            def collect_modules():
+                for module in self.module_info['modules']:
+                    name = module.get('name', '未命名模块')
+                    doc = [SearchIndexBuilder.KIND_MODULE, name,
+                           f"{module.get('id', '')} {module.get('description', '')}".strip(), module_section, '']
+                    # 分类属性和负责人（姓名、角色、联系方式）全部参与检索
+                    text = ' '.join((name, SearchIndexBuilder.flatten_text(
+                        [module.get('id'), module.get('description'), module.get('categories', {}),
+                         module.get('owners', [])])))
+                    yield doc, text
+
+            builder.add_part("SearchIndex:ModuleInfo", (module_section, self.module_info), collect_modules)
+
+        release_section = sections.get('ReleaseNotes')
+        if release_section:
+            for release_type, releases in self.release_notes.items():
+                def collect_releases(release_type=release_type, releases=releases):
+                    for release in releases:
+                        version = release.get('version', '')
+                        doc = [SearchIndexBuilder.KIND_RELEASE, f"{release_type} {version}",
+                               release.get('description', ''), release_section, '']
+                        text = ' '.join((release_type, version, str(release.get('description', '')),
+                                         release.get('details', ''), str(release.get('main_version', ''))))
+                        yield doc, text
+
+                builder.add_part(f"SearchIndex:ReleaseNotes:{release_type}", (release_section, release_type, releases),
+                                 collect_releases)
+
+        interface_section = sections.get('InterfaceMap')
+        if interface_section:
+            routes = self.interface_routes
+            for route_name, route_data in routes.interface_routes.items():
+                def collect_interfaces(route_name=route_name, route_data=route_data):
+                    model = routes.get_route_model(route_name, route_data)
+                    for interface in model.interfaces:
+                        doc = [SearchIndexBuilder.KIND_INTERFACE, interface, route_name, interface_section, '']
+                        yield doc, f"{interface} {route_name}"
+
+                builder.add_part(f"SearchIndex:InterfaceMap:{route_name}", (interface_section, route_data),
+                                 collect_interfaces)
+
+        return builder.build()
+
+    def _iter_html_page(self, generated_time, stats_text, assets=None, css_style=None, js_script=None, minifier=None,
+                        section_writer=None, search_index=None, offline_writer=None, section_renderer=None):
+        """逐块生成完整页面HTML
+
+        Args:
+            generated_time: 生成时间
+            stats_text: 右下角统计信息
+            assets: 外部资源文件名 {'css': ..., 'js': ...}，为 None 时内联 CSS/JS
+            css_style: 内联的CSS，默认为 self.css_style
+            js_script: 内联的JS，默认为 self.js_script
+            minifier: AssetMinifier 实例，提供时按块压缩页面HTML
+            section_writer: SectionFragmentWriter 实例，提供时未激活的分类写为独立片段文件
+            search_index: build_search_index() 返回的索引，提供时在侧边栏加入搜索框并内嵌索引
+            offline_writer: OfflineAppWriter 实例，提供时在页面头部声明清单和 service worker
+            section_renderer: 已启动的 ParallelSectionRenderer，提供时按配置顺序取回并发渲染的分类HTML
+        """
         category_list = list(self.categories.items())
+        css_style = self.css_style if css_style is None else css_style
+        js_script = self.js_script if js_script is None else js_script
+        emit = minifier.html if minifier else str
+
+        search_html = search_index_html = ''
+        if search_index is not None:
+            search_html = """
+                <div class="global-search">
+                    <input type="search" id="globalSearch" placeholder="🔍 搜索链接、模块、版本、接口，#标签 筛选" autocomplete="off">
+                </div>
+                <div class="search-results" id="globalSearchResults"></div>"""
+            payload = json.dumps(search_index, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+            search_index_html = f'<script type="application/json" id="searchIndexData">{payload}</script>\n            '
+
+        offline_html = offline_writer.head_html() if offline_writer else ''
+
+        if assets:
+            style_html = f'<link rel="stylesheet" href="{assets["css"]}">'
+            script_html = f'''<!-- 外部 JavaScript（文件名带内容哈希，可长期缓存） -->
+            <script src="{assets["js"]}"></script>'''
+        else:
+            style_html = f'<style>{css_style}</style>'
+            script_html = f'''<!-- 使用内联 JavaScript -->
+            <script>
+            {js_script}
+            </script>'''
+
+        yield emit(f"""
+        <!DOCTYPE html>
+        <html lang="zh-CN">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>{self.title}</title>
+            <link rel="icon" href="{FAVICON_DATA_URI}">
+            {style_html}{offline_html}
+        </head>
+        <body>
+            <div class="sidebar">
+                <div class="logo">
+                    <h1>{self.title}</h1>
+                    <p>简洁 · 高效 · 实用</p>
+                </div>{search_html}
+                <nav class="nav-categories">
+                    """)
+
+        # 首先生成所有分类的导航项
         for i, (category_name, category_data) in enumerate(category_list):
             # 获取分类图标
             category_icon = self._render_icon(category_data['icon'])
             # 导航项
             active_class = "active" if i == 0 else ""
-            nav_items += f"""
+            yield emit(f"""
                 <button class="nav-item {active_class}" data-category="{category_name}">
                     <i>{category_icon }</i>
                     {category_name}
                 </button>
-            """
+            """)
+
+        yield emit("""
+                </nav>
+            </div>
+
+            <div class="main-content">
+                """)
 
         # 接着生成所有分类的内容区域
         for i, (category_name, category_data) in enumerate(category_list):
             active_section = "active" if i == 0 else ""
-            category_type = category_data.get('type', '普通分类')
-
-            if category_type == 'ModuleInfo':
-                # 模块信息页面
-                category_sections += self._generate_module_info_section(category_name, active_section)
-            elif category_type == 'ReleaseNotes':
-                # 发布说明页面
-                category_sections += self._generate_release_notes_section(category_name, active_section)
-            elif category_type == 'InterfaceMap':
-                # 版本接口页面
-                category_sections += self._generate_interface_map_section(category_name, active_section)
-            elif category_type == 'ConfigDocs':
-                # 配置说明页面
-                category_sections += self._generate_config_docs_section(category_name, active_section)
-            elif category_type == 'IconsReference':
-                # 图标引用页面
-                category_sections += self._generate_icons_reference_section(category_name, active_section)
+            if section_renderer:
+                section_chunks = (section_renderer.result(i),)
+            else:
+                section_chunks = self._iter_category_section(category_name, category_data, active_section)
+            if section_writer and not active_section:
+                # 分片输出：页面中只保留占位元素，内容由导航脚本按需获取
+                html = ''.join(section_chunks)
+                src = section_writer.write(i, category_name, minifier.html(html) if minifier else html)
+                yield f'<div class="section-fragment" data-section="{category_name}" data-src="{src}"></div>\n'
+                continue
+            if self.defer_sections and not active_section:
+                # 模板内容不参与首屏解析和渲染，导航脚本首次切换到该分类时再插入
+                section_chunks = self._iter_deferred_section(category_name, section_chunks)
+            if minifier:
+                # 按分类整体压缩，保证 <pre> 等受保护区域不会被分块截断
+                yield minifier.html(''.join(section_chunks))
             else:
-                # 普通分类页面（支持二级路由）
-                category_sections += self._generate_normal_category_section(category_name, category_data,
-                                                                            active_section)
+                yield from section_chunks
 
         # 使用说明工具提示
         usage_tooltip = """
@@ -6219,48 +8744,7 @@ class SoftNavGenerator:
         </div>
         """
 
-        # 统计总链接数
-        total_links = 0
-        total_categories = 0
-        categories_with_sub = 0
-
-        for cat in self.categories.values():
-            if cat.get('type') == '普通分类':
-                total_categories += 1
-                # 主分类链接
-                total_links += len(cat.get("links", []))
-                # 二级分类链接
-                if cat.get("subcategories"):
-                    categories_with_sub += 1
-                    for subcat in cat["subcategories"].values():
-                        total_links += len(subcat.get("links", []))
-
-        total_release_notes = sum(len(releases) for releases in self.release_notes.values())
-        total_interface_routes = len(self.interface_routes.interface_routes)
-
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="zh-CN">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{self.title}</title>
-            <link rel="icon" href="data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'%3E%3Cdefs%3E%3ClinearGradient id='g' x1='0%25' y1='0%25' x2='100%25' y2='100%25'%3E%3Cstop offset='0%25' stop-color='%236366f1'/%3E%3Cstop offset='100%25' stop-color='%238b5cf6'/%3E%3C/linearGradient%3E%3C/defs%3E%3Ccircle cx='50' cy='50' r='45' fill='url(%23g)'/%3E%3Ccircle cx='50' cy='50' r='40' fill='white'/%3E%3Cpath d='M50 25 L62 45 L50 55 L38 45 Z' fill='url(%23g)'/%3E%3Ccircle cx='50' cy='50' r='5' fill='%236366f1'/%3E%3C/svg%3E">
-            <style>{self.css_style}</style>
-        </head>
-        <body>
-            <div class="sidebar">
-                <div class="logo">
-                    <h1>{self.title}</h1>
-                    <p>简洁 · 高效 · 实用</p>
-                </div>
-                <nav class="nav-categories">
-                    {nav_items}
-                </nav>
-            </div>
-
-            <div class="main-content">
-                {category_sections}
+        yield emit(f"""
 
                 <!-- 主要内容区底部留白，避免内容被固定页脚遮挡 -->
                 <div style="height: 100px;"></div>
@@ -6274,7 +8758,7 @@ class SoftNavGenerator:
 
             <!-- 固定在右下角的统计信息 -->
             <div class="stats">
-                {total_categories} 分类 ({categories_with_sub} 支持二级路由) · {total_links} 链接 · {len(self.release_notes)} 发布类型 · {total_release_notes} 版本 · {total_interface_routes} 版本仓库
+                {stats_text}
             </div>
 
             {usage_tooltip}
@@ -6295,16 +8779,231 @@ class SoftNavGenerator:
                 </div>
             </div>
 
-            <!-- 使用内联 JavaScript -->
-            <script>
-            {self.js_script}
-            </script>
+            {search_index_html}{script_html}
         </body>
         </html>
+        """)
+
+    def section_types(self):
+        """配置中实际存在的分类类型（未知类型按普通分类渲染）"""
+        return frozenset(category_type if category_type in self.SPECIAL_SECTION_TYPES else '普通分类'
+                         for category_type in (data.get('type', '普通分类') for data in self.categories.values()))
+
+    def asset_bundles(self, minifier=None, features=frozenset()):
+        """本次生成使用的 CSS/JS 资源包，只包含配置中存在的分类类型和启用的生成选项需要的部分
+
+        资源包（含压缩版本）由 AssetBundles 按进程缓存；实例上的 css_style/js_script 被替换过时按原样打包。
+        """
+        section_types = self.section_types()
+        bundles = {}
+        for kind, text in (('css', self.css_style), ('js', self.js_script)):
+            if text == AssetBundles.get(kind).text:
+                bundle = AssetBundles.get(kind, section_types, minify=minifier is not None, features=features)
+                if minifier:
+                    minifier.record(kind, AssetBundles.get(kind, section_types, features=features).text, bundle.text)
+            elif minifier:
+                bundle = AssetBundle(kind, minifier.css(text) if kind == 'css' else minifier.js(text))
+            else:
+                bundle = AssetBundle(kind, text)
+            bundles[kind] = bundle
+        return bundles
+
+    def write_external_assets(self, output_dir, bundles=None, precompressed=None):
+        """将 CSS/JS 资源包写为带内容哈希的外部文件，返回文件名
+
+        哈希只由资源包内容决定，仅修改配置不会改变文件名，浏览器缓存保持有效。
+        传入 precompressed 字典时同时写出缺少的 .gz/.br 版本（压缩结果按进程缓存），并记录各编码的字节数。
+        """
+        if bundles is None:
+            bundles = {'css': AssetBundles.get('css'), 'js': AssetBundles.get('js')}
+        assets = {}
+        for kind, bundle in bundles.items():
+            file_path = os.path.join(output_dir, bundle.file_name)
+            files = [('', bundle.data)]
+            if precompressed is not None:
+                files.extend(bundle.compressed().items())
+                precompressed[file_path] = {suffix: len(data) for suffix, data in bundle.compressed().items()}
+            # 内容寻址：同名文件内容必然相同，已存在时无需重写；预压缩版本在源文件之后写出
+            for suffix, data in files:
+                if not os.path.exists(file_path + suffix):
+                    tmp_file = file_path + suffix + '.tmp'
+                    with open(tmp_file, 'wb') as f:
+                        f.write(data)
+                    os.replace(tmp_file, file_path + suffix)
+            assets[kind] = bundle.file_name
+        return assets
+
+    @staticmethod
+    def _referenced_assets(page_file):
+        """页面引用的外部资源文件名；逐行扫描，不把大页面整个读入内存"""
+        names = set()
+        try:
+            with open(page_file, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    names.update(EXTERNAL_ASSET_REF_RE.findall(line))
+        except OSError:
+            pass
+        return names
+
+    def prune_external_assets(self, output_file, stale):
+        """删除本页面上次引用、本次不再使用的外部资源文件（含 .gz/.br），返回删除数量
+
+        资源文件按内容寻址，可能被同目录的其他页面共用，其他页面仍引用的文件保留。
         """
+        if not stale:
+            return 0
+        output_dir = os.path.dirname(os.path.abspath(output_file))
+        page_name = os.path.basename(output_file)
+        stale = set(stale)
+        for name in os.listdir(output_dir):
+            if name != page_name and name.endswith(('.html', '.htm')):
+                stale -= self._referenced_assets(os.path.join(output_dir, name))
+        removed = 0
+        for name in stale:
+            for suffix in ('', '.gz', '.br'):
+                try:
+                    os.remove(os.path.join(output_dir, name + suffix))
+                    removed += not suffix
+                except OSError:
+                    pass
+        return removed
+
+    @staticmethod
+    def _tee_chunks(chunks, consumer):
+        """逐块转发页面内容，同时提交给 consumer（预压缩线程、内容哈希等）"""
+        for chunk in chunks:
+            consumer.feed(chunk)
+            yield chunk
+
+    def generate_html(self, output_file="soft_navigation.html", stream=False, incremental=False, build_cache=None,
+                      external_assets=False, minify=False, precompress=False, lazy_interfaces=False,
+                      virtual_links=False, defer_sections=False, split_sections=False, search_index=False, pwa=False,
+                      jobs=0):
+        """生成导航网站
+
+        Args:
+            output_file: 输出 HTML 文件路径
+            stream: 流式写入模式，各分类逐块写入缓冲文件，峰值内存不随链接数增长
+            incremental: 增量构建模式，只重新渲染配置切片发生变化的片段
+            build_cache: 复用外部传入的增量构建缓存（监视模式跨多次构建共享）
+            external_assets: 将 CSS/JS 输出为 app.<hash>.css / app.<hash>.js 并在页面中引用
+            minify: 压缩CSS/JS（去注释、空白和调试日志）并折叠HTML标签间空白
+            precompress: 同时输出 .gz（最高压缩级别）和 .br（安装了 brotli 时）预压缩版本
+            lazy_interfaces: 版本接口矩阵以 JSON 内嵌，由客户端虚拟表格只渲染可见行列
+            virtual_links: 链接数不少于 VIRTUAL_LINKS_THRESHOLD 的分类以 JSON 内嵌，只渲染激活分类的可见卡片
+            defer_sections: 未激活的分类以 <template> 输出，首次导航时才插入文档
+            split_sections: 未激活的分类写为 sections/<页面名>/<slug>.<hash>.html，页面只保留按需加载的占位元素
+            search_index: 构建全文搜索索引（链接、模块、发布说明、接口）并内嵌到页面，侧边栏提供搜索框
+            pwa: 同时输出 <页面名>.webmanifest 和 <页面名>.sw.js，页面可离线访问，重复访问从本地缓存加载
+            jobs: 大于 0 时以 jobs 个工作进程（状态无法序列化时为线程）并发渲染各分类，并报告每个分类的耗时
+        """
+        self.interface_routes.lazy_render = lazy_interfaces
+        self.virtual_links = virtual_links
+        self.defer_sections = defer_sections
+        # 生成时间
+        generated_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # 统计总链接数
+        total_links = 0
+        total_categories = 0
+        categories_with_sub = 0
+
+        for cat in self.categories.values():
+            if cat.get('type') == '普通分类':
+                total_categories += 1
+                # 主分类链接
+                total_links += len(cat.get("links", []))
+                # 二级分类链接
+                if cat.get("subcategories"):
+                    categories_with_sub += 1
+                    for subcat in cat["subcategories"].values():
+                        total_links += len(subcat.get("links", []))
+
+        total_release_notes = sum(len(releases) for releases in self.release_notes.values())
+        total_interface_routes = len(self.interface_routes.interface_routes)
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        stats_text = (f"{total_categories} 分类 ({categories_with_sub} 支持二级路由) · {total_links} 链接 · "
+                      f"{len(self.release_notes)} 发布类型 · {total_release_notes} 版本 · "
+                      f"{total_interface_routes} 版本仓库")
+
+        minifier = AssetMinifier() if minify else None
+        # 只打包启用的生成选项需要的客户端代码
+        features = frozenset(name for name, enabled in (
+            ('lazy_interfaces', lazy_interfaces), ('virtual_links', virtual_links), ('defer_sections', defer_sections),
+            ('split_sections', split_sections), ('search_index', search_index), ('pwa', pwa)) if enabled)
+        bundles = self.asset_bundles(minifier, features)
+        css_style = bundles['css'].text
+        js_script = bundles['js'].text
+
+        compressors = [] if precompress else None
+        precompressed = {}
+        output_dir = os.path.dirname(os.path.abspath(output_file))
+        assets = None
+        # 本页面上次生成时引用的外部资源，页面替换后清理不再使用的旧文件
+        previous_assets = self._referenced_assets(output_file)
+        if external_assets:
+            assets = self.write_external_assets(output_dir, bundles, precompressed if precompress else None)
+        section_writer = SectionFragmentWriter(output_file, compressors) if split_sections else None
+        offline_writer = OfflineAppWriter(output_file) if pwa else None
+
+        if build_cache is None and incremental:
+            build_cache = IncrementalBuildCache.for_output(output_file, self.generator_info)
+        if build_cache is not None:
+            build_cache.begin_build()
+        self._build_cache = build_cache
+
+        page_compressor = None
+        index = None
+        section_renderer = None
+        try:
+            if search_index:
+                # 索引分片同样走增量构建缓存，只重新分词配置变化的部分
+                index = self.build_search_index()
+            if jobs:
+                # 生成器状态此时已完整（含增量构建缓存），分类渲染与页面写出同时进行
+                section_renderer = ParallelSectionRenderer(self, jobs)
+                section_renderer.start(list(self.categories.items()))
+            page_chunks = self._iter_html_page(generated_time, stats_text, assets, css_style, js_script, minifier,
+                                               section_writer, index, offline_writer, section_renderer)
+            if offline_writer:
+                page_chunks = self._tee_chunks(page_chunks, offline_writer)
+            if compressors is not None:
+                # 页面内容在写入的同时交给后台线程压缩
+                page_compressor = PrecompressWorker(output_file)
+                compressors.append(page_compressor)
+                page_chunks = self._tee_chunks(page_chunks, page_compressor)
+            # 先写入同目录临时文件再原子替换，读取方永远不会看到写了一半的页面
+            tmp_file = output_file + '.tmp'
+            if stream:
+                # 流式写入：逐块写入缓冲区，不在内存中拼接完整文档
+                with open(tmp_file, 'w', encoding='utf-8', buffering=STREAM_BUFFER_SIZE) as f:
+                    f.writelines(page_chunks)
+            else:
+                html_content = ''.join(page_chunks)
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(html_content)
+            for worker in compressors or ():
+                worker.close()
+            os.replace(tmp_file, output_file)
+            if offline_writer:
+                # service worker 在页面替换之后写出，新版本安装时预缓存的是新页面
+                offline_writer.write(self.title, assets)
+            # 预压缩文件在源文件之后替换，修改时间不早于源文件
+            for worker in compressors or ():
+                precompressed[worker.path] = worker.commit()
+            pruned = section_writer.prune() if section_writer else 0
+            pruned_assets = self.prune_external_assets(output_file, previous_assets - set((assets or {}).values()))
+
+            if build_cache is not None:
+                build_cache.save()
+        except BaseException:
+            for worker in compressors or ():
+                worker.abort()
+            raise
+        finally:
+            self._build_cache = None
+            if section_renderer:
+                section_renderer.close()
 
         # 统计不同类型页面的数量
         normal_categories = len([c for c in self.categories.values() if c.get('type') == '普通分类'])
@@ -6316,10 +9015,37 @@ class SoftNavGenerator:
         print(f"📊 包含 {total_interface_routes} 个版本仓库")
         print(f"🕒 生成时间: {generated_time}")
         print(f"📊 默认布局: {self.default_layout}")
-
-
-def parse_json_config(config_file):
-    """解析 JSON 配置文件"""
+        print(f"🎨 SVG图标库构建次数: {SVGIconRegistry.build_count}")
+        if assets:
+            print(f"📦 外部资源: {assets['css']}, {assets['js']}"
+                  f"{f' (清理旧资源 {pruned_assets} 个)' if pruned_assets else ''}")
+        if minifier:
+            print(f"🗜️ 压缩: {minifier.report()}")
+        if section_writer:
+            print(f"🧩 分类片段: {len(section_writer.files)} 个 (新写入 {section_writer.written}, "
+                  f"清理旧片段 {pruned}) -> {section_writer.directory}")
+        if index is not None:
+            index_size = len(json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+            print(f"🔍 搜索索引: {len(index['docs'])} 条目, {len(index['terms'])} 词项, {index_size / 1024:.0f} KB")
+        if offline_writer:
+            print(f"📴 离线缓存: {offline_writer.worker_file} 版本 {offline_writer.version}, "
+                  f"清单 {offline_writer.manifest_file}")
+        if page_compressor is not None:
+            variants = ', '.join(f"{suffix} {size:,} 字节" for suffix, size in precompressed[output_file].items())
+            print(f"📦 预压缩: {len(precompressed)} 个文件 ({os.path.basename(output_file)}: {variants})")
+        if build_cache is not None:
+            print(f"♻️ 增量构建: 复用 {build_cache.hits} 个片段, 重新渲染 {build_cache.misses} 个片段")
+        if section_renderer:
+            section_renderer.report()
+
+
+def parse_json_config(config_file, generator=None):
+    """解析 JSON 配置文件
+
+    Args:
+        config_file: JSON 配置文件路径
+        generator: 可选，复用已有的生成器实例（清空内容后重新加载）
+    """
     try:
         with open(config_file, 'r', encoding='utf-8') as f:
             config = json.load(f)
@@ -6330,13 +9056,26 @@ def parse_json_config(config_file):
         print(f"❌ 配置文件不存在: {config_file}")
         sys.exit(1)
 
+    return load_config_into_generator(config, generator)
+
+
+def load_config_into_generator(config, generator=None):
+    """将已解析的配置字典加载到生成器
+
+    Args:
+        config: 配置字典
+        generator: 可选，复用已有的生成器实例（清空内容后重新加载）
+    """
     # 获取网站标题和默认布局
     site_config = config.get('site', {})
     title = site_config.get('title', '嵌入式开发中心')
     default_layout = site_config.get('default_layout', 'list')
 
     # 创建生成器实例
-    generator = SoftNavGenerator(title, default_layout)
+    if generator is None:
+        generator = SoftNavGenerator(title, default_layout)
+    else:
+        generator.reset_content(title, default_layout)
 
     # 解析分类导航
     categories = config.get('categories', [])
@@ -6355,34 +9094,14 @@ def parse_json_config(config_file):
             subcategories_config = category_data.get('subcategories', {})
 
             # 转换主分类链接格式
-            links_list = []
-            for link in links:
-                links_list.append([
-                    link.get('name', ''),
-                    link.get('url', ''),
-                    link.get('description', ''),
-                    link.get('type', '网站'),
-                    link.get('tag', '')
-                ])
+            links_list = [Link.from_config(link) for link in links]
 
             # 转换二级分类
             subcategories = {}
             for subcat_name, subcat_data in subcategories_config.items():
-                subcat_links = subcat_data.get('links', [])
-                subcat_links_list = []
-
-                for link in subcat_links:
-                    subcat_links_list.append([
-                        link.get('name', ''),
-                        link.get('url', ''),
-                        link.get('description', ''),
-                        link.get('type', '网站'),
-                        link.get('tag', '')
-                    ])
-
                 subcategories[subcat_name] = {
                     'icon': subcat_data.get('icon', '📁'),
-                    'links': subcat_links_list
+                    'links': [Link.from_config(link) for link in subcat_data.get('links', [])]
                 }
 
             generator.add_category(category_name, links_list, icon, category_type, subcategories)
@@ -6441,23 +9160,9 @@ def parse_json_config(config_file):
         for version_id, version_data in versions.items():
             processed_version = version_data.copy()
 
-            # 处理interfaces字段：统一转换为字符串格式
-            interfaces = version_data.get('interfaces', '')
-            if isinstance(interfaces, list):
-                # 将列表转换为字符串格式
-                interface_strs = []
-                for item in interfaces:
-                    if isinstance(item, str):
-                        interface_strs.append(item.strip())
-                    elif isinstance(item, dict) and 'name' in item:
-                        version = item.get('version', 'v1.0')
-                        interface_strs.append(f"{item['name']}:{version}")
-                    else:
-                        interface_strs.append(str(item))
-                processed_version['interfaces'] = ', '.join(interface_strs)
-            else:
-                # 已经是字符串或空值
-                processed_version['interfaces'] = str(interfaces) if interfaces else ''
+            # 处理interfaces字段：统一解析为 [(接口, 版本), ...]
+            processed_version['interfaces'] = InterfaceRouteGenerator.normalize_interfaces(
+                version_data.get('interfaces', ''))
 
             processed_versions[version_id] = processed_version
 
@@ -6471,6 +9176,223 @@ def parse_json_config(config_file):
     return generator
 
 
+def _config_signature(config_file):
+    """配置文件签名（修改时间 + 大小），文件暂不可读时返回 None"""
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def watch_and_generate(config_file, output_file, interval=0.5, debounce=0.3, stream=False, external_assets=False,
+                       minify=False, precompress=False, lazy_interfaces=False, virtual_links=False,
+                       defer_sections=False, split_sections=False, search_index=False, pwa=False, jobs=0):
+    """监视配置文件，变化后防抖并重新生成
+
+    复用同一个生成器实例（CSS/JS 只组装一次）和内存中的增量构建缓存，
+    单条链接修改只需重新渲染对应分类。输出文件通过原子替换写入。
+
+    Args:
+        config_file: JSON 配置文件路径
+        output_file: 输出 HTML 文件路径
+        interval: 轮询间隔（秒）
+        debounce: 防抖窗口（秒），文件在该时间内保持不变才开始生成
+        stream: 是否使用流式写入
+        external_assets: 是否将 CSS/JS 输出为外部资源文件
+        minify: 是否压缩输出
+        precompress: 是否同时输出 .gz/.br 预压缩文件
+        lazy_interfaces: 是否以懒渲染模式输出版本接口矩阵
+        virtual_links: 是否对大分类启用虚拟化链接列表
+        defer_sections: 是否延迟渲染未激活的分类
+        split_sections: 是否将未激活的分类写为按需加载的片段文件
+        search_index: 是否构建并内嵌全文搜索索引
+        pwa: 是否输出 Web 应用清单和 service worker
+        jobs: 并发渲染分类的工作进程数，0 表示串行
+    """
+    generator = None
+    build_cache = IncrementalBuildCache(None, IncrementalBuildCache.source_fingerprint())
+
+    def rebuild():
+        nonlocal generator
+        start = time.perf_counter()
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            generator = load_config_into_generator(config, generator)
+            generator.generate_html(output_file, stream=stream, build_cache=build_cache,
+                                    external_assets=external_assets, minify=minify, precompress=precompress,
+                                    lazy_interfaces=lazy_interfaces, virtual_links=virtual_links,
+                                    defer_sections=defer_sections, split_sections=split_sections,
+                                    search_index=search_index, pwa=pwa, jobs=jobs)
+        except (OSError, ValueError) as e:
+            # 编辑器保存过程中可能读到不完整的文件，保留上一次的输出，等待下次变化
+            print(f"❌ 读取配置失败，保留上次生成结果: {e}")
+            return
+        except Exception as e:
+            print(f"❌ 生成网站时出错: {e}")
+            import traceback
+            traceback.print_exc()
+            return
+        print(f"⏱️ 本次生成耗时 {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    last_signature = _config_signature(config_file)
+    rebuild()
+    print(f"👀 正在监视 {config_file}（按 Ctrl+C 退出）...")
+
+    try:
+        while True:
+            time.sleep(interval)
+            signature = _config_signature(config_file)
+            if signature is None or signature == last_signature:
+                continue
+
+            # 防抖：等待文件在防抖窗口内不再变化
+            while True:
+                time.sleep(debounce)
+                settled = _config_signature(config_file)
+                if settled == signature:
+                    break
+                signature = settled
+
+            if signature is None:
+                continue
+            last_signature = signature
+            print(f"🔄 检测到配置变化: {config_file}")
+            rebuild()
+    except KeyboardInterrupt:
+        print("👋 已停止监视")
+
+
+class BatchBuilder:
+    """批量生成 - 一次调用按清单生成多个门户
+
+    清单为 JSON，列出 配置 -> 输出 对，相对路径以清单所在目录为基准：
+        {"portals": [{"config": "teamA/nav.json", "output": "teamA/index.html"}, ...]}
+    （也可以直接是上述列表）。门户分配给工作进程渲染，每个进程（线程池模式下每个线程）
+    复用同一个生成器实例；CSS/JS 资源包（AssetBundles）和 SVG 图标库在进程内共享，
+    相同分类类型组合的门户共用同一份组装和压缩结果。各门户的输出日志单独收集，最后打印汇总表。
+    """
+
+    _local = threading.local()  # 工作进程/线程复用的生成器
+
+    def __init__(self, manifest_file, jobs=0, options=None):
+        self.manifest_file = manifest_file
+        self.jobs = jobs or os.cpu_count() or 1
+        self.options = options or {}  # 传给 generate_html 的选项，对所有门户生效
+        self.mode = '串行'
+        self.workers = 1
+        self.wall_time = 0.0
+
+    def load_manifest(self):
+        """读取清单，返回 [(配置文件, 输出文件), ...]，格式错误时抛出 ValueError"""
+        with open(self.manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        entries = manifest.get('portals') if isinstance(manifest, dict) else manifest
+        if not isinstance(entries, list):
+            raise ValueError('清单应为门户列表或包含 "portals" 列表的对象')
+
+        base_dir = os.path.dirname(os.path.abspath(self.manifest_file))
+        portals = []
+        outputs = set()
+        for i, entry in enumerate(entries):
+            if not isinstance(entry, dict) or not entry.get('config') or not entry.get('output'):
+                raise ValueError(f'第 {i + 1} 项缺少 "config" 或 "output"')
+            config_file = os.path.join(base_dir, entry['config'])
+            output_file = os.path.join(base_dir, entry['output'])
+            if os.path.normcase(os.path.abspath(output_file)) in outputs:
+                raise ValueError(f'输出文件重复: {entry["output"]}')
+            outputs.add(os.path.normcase(os.path.abspath(output_file)))
+            portals.append((config_file, output_file))
+        return portals
+
+    @classmethod
+    def _build_portal(cls, config_file, output_file, options, capture=True):
+        """生成一个门户，返回 (是否成功, 耗时秒, 分类数, 链接数, 输出字节数, 日志)"""
+        log = io.StringIO()
+        started = time.perf_counter()
+        ok = False
+        categories = links = size = 0
+        try:
+            with redirect_stdout(log) if capture else nullcontext():
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+                generator = load_config_into_generator(config, getattr(cls._local, 'generator', None))
+                cls._local.generator = generator
+                # 清单中的输出目录（如 teamA/）可能尚不存在
+                os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+                generator.generate_html(output_file, **options)
+            normal = [c for c in generator.categories.values() if c.get('type') == '普通分类']
+            categories = len(normal)
+            links = sum(len(c["links"]) + sum(len(sub.get("links", [])) for sub in c["subcategories"].values())
+                        for c in normal)
+            size = os.path.getsize(output_file)
+            ok = True
+        except Exception as e:
+            log.write(f"❌ {type(e).__name__}: {e}\n")
+        return ok, time.perf_counter() - started, categories, links, size, log.getvalue()
+
+    def run(self):
+        """生成清单中的全部门户，返回 [(配置文件, 输出文件, 结果), ...]（按清单顺序）"""
+        portals = self.load_manifest()
+        started = time.perf_counter()
+        jobs = min(self.jobs, len(portals))
+        if jobs <= 1:
+            results = [self._build_portal(config_file, output_file, self.options)
+                       for config_file, output_file in portals]
+        else:
+            executor = None
+            try:
+                executor = ProcessPoolExecutor(jobs)
+                self.mode = '进程池'
+            except (OSError, NotImplementedError, ImportError) as e:
+                print(f"⚠️ 无法创建进程池（{e}），改用线程池")
+                executor = ThreadPoolExecutor(jobs, thread_name_prefix='portal')
+                self.mode = '线程池'
+            with executor:
+                # 线程共享标准输出，不能各自重定向，日志直接打印
+                capture = self.mode == '进程池'
+                futures = [executor.submit(BatchBuilder._build_portal, config_file, output_file, self.options, capture)
+                           for config_file, output_file in portals]
+                results = []
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        # 工作进程崩溃（BrokenProcessPool）或参数无法序列化时，只记该门户失败
+                        results.append((False, 0.0, 0, 0, 0, f"❌ {type(e).__name__}: {e}\n"))
+        self.workers = max(1, jobs)
+        self.wall_time = time.perf_counter() - started
+        return [(config_file, output_file, result) for (config_file, output_file), result in zip(portals, results)]
+
+    def print_summary(self, results):
+        """打印每个门户的耗时和规模，失败的门户附上日志末尾"""
+        base_dir = os.path.dirname(os.path.abspath(self.manifest_file))
+        failed = [item for item in results if not item[2][0]]
+        total = sum(result[1] for _, _, result in results)
+        print(f"\n{'状态':<4} {'耗时(ms)':>10} {'分类':>6} {'链接':>8} {'大小(KB)':>10}  配置 -> 输出")
+        for config_file, output_file, (ok, elapsed, categories, links, size, _) in results:
+            print(f"{'✅' if ok else '❌':<4} {elapsed * 1000:>10.1f} {categories:>6} {links:>8} {size / 1024:>10.0f}  "
+                  f"{os.path.relpath(config_file, base_dir)} -> {os.path.relpath(output_file, base_dir)}")
+        for config_file, _, (_, _, _, _, _, log) in failed:
+            print(f"\n❌ {config_file} 生成失败:")
+            print('\n'.join(log.strip().splitlines()[-10:]))
+        print(f"\n📦 批量生成: {len(results)} 个门户, 成功 {len(results) - len(failed)}, 失败 {len(failed)}, "
+              f"{self.mode} × {self.workers}, 墙钟 {self.wall_time:.2f} s, 各门户合计 {total:.2f} s")
+
+
+def batch_generate(manifest_file, jobs=0, **options):
+    """按清单批量生成多个门户并打印汇总表，全部成功返回 True"""
+    builder = BatchBuilder(manifest_file, jobs, options)
+    try:
+        results = builder.run()
+    except (OSError, ValueError) as e:
+        print(f"❌ 读取批量清单失败: {e}")
+        return False
+    builder.print_summary(results)
+    return all(result[0] for _, _, result in results)
+
+
 def create_sample_json():
     """创建示例 JSON 配置文件（包含二级路由）"""
     sample_content = {
@@ -6625,19 +9547,359 @@ def create_sample_json():
     print("✅ 示例配置文件已生成: config_sample.json")
 
 
+class StaticFileCache:
+    """静态文件内存缓存
+
+    文件首次请求时读入内存并预先压缩（gzip/brotli，优先使用磁盘上已有的 .gz/.br 文件），
+    之后每次请求只做一次 stat 检查，文件被重新生成后自动重新加载。
+    """
+
+    COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json',
+                          'application/manifest+json', 'application/xml', 'image/svg+xml')
+    MIN_COMPRESS_SIZE = 256
+
+    def __init__(self, root, index_file='index.html'):
+        self.root = os.path.realpath(root)
+        self.index_file = index_file
+        self.entries = {}
+
+    def resolve(self, url_path):
+        """将URL路径映射为根目录下的文件路径，越界或不存在时返回 None
+
+        路径无法按 UTF-8 解码或包含 NUL 字符时抛出 ValueError（请求本身非法）。
+        """
+        relative = urllib.parse.unquote(url_path, errors='strict').lstrip('/')
+        if '\0' in relative:
+            raise ValueError('路径包含 NUL 字符')
+        try:
+            path = os.path.realpath(os.path.join(self.root, relative))
+            if path != self.root and not path.startswith(self.root + os.sep):
+                return None
+            if os.path.isdir(path):
+                path = os.path.join(path, self.index_file)
+            return path if os.path.isfile(path) else None
+        except (ValueError, OSError):
+            # 超长路径、平台不支持的字符等
+            return None
+
+    def lookup(self, path):
+        """返回仍然有效的缓存条目；文件已变化或未缓存时返回 None"""
+        entry = self.entries.get(path)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.entries.pop(path, None)
+            return None
+        if (stat.st_mtime_ns, stat.st_size) != entry['signature']:
+            return None
+        return entry
+
+    def load(self, path):
+        """读取文件并生成各编码版本（在线程池中执行，避免阻塞事件循环）"""
+        stat = os.stat(path)
+        with open(path, 'rb') as f:
+            body = f.read()
+
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        compressible = content_type.startswith(self.COMPRESSIBLE_TYPES)
+        if content_type.startswith('text/') or content_type in ('application/javascript', 'application/json'):
+            content_type += '; charset=utf-8'
+
+        etag = hashlib.sha1(body).hexdigest()[:20]
+        variants = {'identity': (body, f'"{etag}"')}
+        if compressible and len(body) >= self.MIN_COMPRESS_SIZE:
+            gz_body = self._read_sibling(path + '.gz', stat) or gzip.compress(body, compresslevel=9, mtime=0)
+            variants['gzip'] = (gz_body, f'"{etag}-gz"')
+            br_body = self._read_sibling(path + '.br', stat)
+            if br_body is None and brotli is not None:
+                br_body = brotli.compress(body, quality=11)
+            if br_body is not None:
+                variants['br'] = (br_body, f'"{etag}-br"')
+
+        # 带内容哈希的资源永不变化，允许浏览器永久缓存；其他文件每次重新验证
+        if FINGERPRINTED_ASSET_RE.search(os.path.basename(path)):
+            cache_control = 'public, max-age=31536000, immutable'
+        else:
+            cache_control = 'no-cache'
+
+        entry = {
+            'signature': (stat.st_mtime_ns, stat.st_size),
+            'cache_control': cache_control,
+            'mtime': int(stat.st_mtime),
+            'last_modified': email.utils.formatdate(stat.st_mtime, usegmt=True),
+            'content_type': content_type,
+            'variants': variants
+        }
+        self.entries[path] = entry
+        return entry
+
+    @staticmethod
+    def _read_sibling(sibling_path, source_stat):
+        """读取不早于源文件的预压缩文件"""
+        try:
+            if os.stat(sibling_path).st_mtime_ns < source_stat.st_mtime_ns:
+                return None
+            with open(sibling_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+
+class AsyncStaticServer:
+    """基于 asyncio 的静态文件服务器
+
+    支持 HTTP/1.1 keep-alive、HEAD、ETag/If-None-Match 与 Last-Modified/If-Modified-Since
+    条件请求（304），并按 Accept-Encoding 返回预压缩的 br/gzip 版本。
+    """
+
+    KEEPALIVE_TIMEOUT = 15
+    MAX_HEADER_SIZE = 64 * 1024
+    SERVER_NAME = 'FastNavServer'
+
+    def __init__(self, root='.', host='0.0.0.0', port=8002, index_file='index.html', quiet=False):
+        self.host = host
+        self.port = port
+        self.quiet = quiet
+        self.files = StaticFileCache(root, index_file)
+
+    async def serve_forever(self):
+        """启动服务并持续运行"""
+        server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                            limit=self.MAX_HEADER_SIZE)
+        print(f"🌐 静态服务已启动: http://{'localhost' if self.host in ('0.0.0.0', '') else self.host}:{self.port}")
+        print(f"📂 根目录: {self.files.root}")
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(self, reader, writer):
+        """处理单个连接上的一个或多个请求（keep-alive）"""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.KEEPALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                parts = lines[0].split()
+                if len(parts) != 3:
+                    await self._send(writer, 400, {}, b'Bad Request', 'GET', False)
+                    break
+                method, target, version = parts
+
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                # 丢弃请求体（仅支持 GET/HEAD）；长度非法时无法定位下一个请求，直接关闭连接
+                content_length = headers.get('content-length', '0').strip() or '0'
+                if not (content_length.isascii() and content_length.isdigit()):
+                    await self._send(writer, 400, {}, b'Bad Request', method, False)
+                    break
+                content_length = int(content_length)
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                connection = headers.get('connection', '').lower()
+                if version == 'HTTP/1.1':
+                    keep_alive = connection != 'close'
+                else:
+                    keep_alive = connection == 'keep-alive'
+
+                status, response_headers, body = await self._respond(method, target, headers)
+                await self._send(writer, status, response_headers, body, method, keep_alive)
+                if not self.quiet:
+                    encoding = response_headers.get('Content-Encoding', '')
+                    print(f"[serve] {method} {target} {status}{' ' + encoding if encoding else ''}")
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method, target, headers):
+        """生成响应状态、响应头和响应体，处理出错时返回 500，保证每个请求都有响应"""
+        try:
+            return await self._respond_file(method, target, headers)
+        except Exception as e:
+            print(f"[serve] ❌ {method} {target} 处理失败: {type(e).__name__}: {e}")
+            return 500, {'Content-Type': 'text/plain; charset=utf-8'}, b'Internal Server Error'
+
+    async def _respond_file(self, method, target, headers):
+        """按请求路径返回静态文件"""
+        if method not in ('GET', 'HEAD'):
+            return 405, {'Allow': 'GET, HEAD', 'Content-Type': 'text/plain; charset=utf-8'}, b'Method Not Allowed'
+
+        try:
+            path = self.files.resolve(urllib.parse.urlsplit(target).path)
+        except ValueError:
+            return 400, {'Content-Type': 'text/plain; charset=utf-8'}, b'Bad Request'
+        if path is None:
+            return 404, {'Content-Type': 'text/plain; charset=utf-8'}, b'Not Found'
+
+        entry = self.files.lookup(path)
+        if entry is None:
+            entry = await asyncio.get_running_loop().run_in_executor(None, self.files.load, path)
+
+        encoding = self._choose_encoding(headers.get('accept-encoding', ''), entry['variants'])
+        body, etag = entry['variants'][encoding]
+
+        response_headers = {
+            'Content-Type': entry['content_type'],
+            'ETag': etag,
+            'Last-Modified': entry['last_modified'],
+            'Cache-Control': entry['cache_control'],
+            'Vary': 'Accept-Encoding'
+        }
+        if encoding != 'identity':
+            response_headers['Content-Encoding'] = encoding
+
+        if self._not_modified(headers, etag, entry['mtime']):
+            return 304, response_headers, b''
+        return 200, response_headers, body
+
+    @staticmethod
+    def _choose_encoding(accept_encoding, variants):
+        """根据 Accept-Encoding 选择最优编码（br > gzip > identity）"""
+        accepted = set()
+        for item in accept_encoding.split(','):
+            name, _, params = item.strip().partition(';')
+            params = params.replace(' ', '')
+            if name and params not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+                accepted.add(name.lower())
+        for encoding in ('br', 'gzip'):
+            if encoding in variants and (encoding in accepted or '*' in accepted):
+                return encoding
+        return 'identity'
+
+    @staticmethod
+    def _not_modified(headers, etag, mtime):
+        """判断条件请求是否可以返回 304"""
+        if_none_match = headers.get('if-none-match')
+        if if_none_match is not None:
+            candidates = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in candidates or any(tag.replace('W/', '', 1) == etag for tag in candidates)
+
+        if_modified_since = headers.get('if-modified-since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return since is not None and mtime <= since.timestamp()
+        return False
+
+    async def _send(self, writer, status, headers, body, method, keep_alive):
+        """写出响应"""
+        reason = HTTPStatus(status).phrase
+        lines = [f'HTTP/1.1 {status} {reason}',
+                 f'Date: {email.utils.formatdate(usegmt=True)}',
+                 f'Server: {self.SERVER_NAME}']
+        lines.extend(f'{name}: {value}' for name, value in headers.items())
+        if status != 304:
+            lines.append(f'Content-Length: {len(body)}')
+        if keep_alive:
+            lines.append('Connection: keep-alive')
+            lines.append(f'Keep-Alive: timeout={self.KEEPALIVE_TIMEOUT}')
+        else:
+            lines.append('Connection: close')
+
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if method != 'HEAD' and status != 304:
+            writer.write(body)
+        await writer.drain()
+
+
+def serve_main(argv):
+    """serve 子命令 - 启动内置静态服务器"""
+    parser = argparse.ArgumentParser(prog='FastNavGenerator.py serve', description='启动内置静态服务器')
+    parser.add_argument('--root', type=str, default='.', help='网站根目录')
+    parser.add_argument('--host', type=str, default='0.0.0.0', help='监听地址')
+    parser.add_argument('--port', type=int, default=8002, help='监听端口')
+    parser.add_argument('--index', type=str, default='index.html', help='目录默认页面')
+    parser.add_argument('--quiet', action='store_true', help='不输出请求日志')
+    args = parser.parse_args(argv)
+
+    server = AsyncStaticServer(args.root, args.host, args.port, args.index, args.quiet)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("👋 服务已停止")
+
+
 def main():
     """主函数 - 命令行参数版本"""
-    parser = argparse.ArgumentParser(description='生成导航网站（支持二级路由）')
-    parser.add_argument('--config', type=str, required=True, help='JSON 配置文件路径')
-    parser.add_argument('--output', type=str, default='navigation.html', help='输出 HTML 文件路径')
+    if sys.argv[1:2] == ['serve']:
+        serve_main(sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(description='生成导航网站（支持二级路由）',
+                                     epilog='子命令: serve  启动内置静态服务器（详见 serve --help）')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--config', type=str, help='JSON 配置文件路径')
+    source.add_argument('--batch', type=str, metavar='MANIFEST',
+                        help='批量生成：清单 JSON 列出多个 配置 -> 输出，由工作进程池渲染（--jobs 为进程数，默认CPU核数）')
+    parser.add_argument('--output', type=str, help='输出 HTML 文件路径（默认 navigation.html）')
     parser.add_argument('--create-sample', action='store_true', help='创建示例配置文件')
+    parser.add_argument('--stream', action='store_true', help='流式写入输出文件，降低大配置下的峰值内存')
+    parser.add_argument('--incremental', action='store_true', help='增量构建，只重新渲染配置发生变化的分类（缓存保存在输出文件旁）')
+    parser.add_argument('--external-assets', action='store_true',
+                        help='将 CSS/JS 输出为带内容哈希的外部文件（app.<hash>.css/js），可被浏览器长期缓存')
+    parser.add_argument('--minify', action='store_true', help='压缩CSS/JS并折叠HTML空白，输出压缩前后字节数')
+    parser.add_argument('--precompress', action='store_true',
+                        help='同时输出 .gz（以及安装 brotli 时的 .br）预压缩文件，供静态服务器直接使用')
+    parser.add_argument('--lazy-interfaces', action='store_true',
+                        help='版本接口矩阵以内嵌 JSON 输出，浏览器端虚拟滚动渲染（适合大规模版本仓库）')
+    parser.add_argument('--virtual-links', action='store_true',
+                        help=f'链接数不少于 {VIRTUAL_LINKS_THRESHOLD} 的分类改为浏览器端虚拟滚动渲染')
+    parser.add_argument('--defer-sections', action='store_true',
+                        help='未激活的分类以 <template> 输出，首次切换到该分类时再渲染，加快首屏')
+    parser.add_argument('--split-sections', action='store_true',
+                        help='未激活的分类写为 sections/ 下带内容哈希的片段文件，由页面按需加载（需通过HTTP访问）')
+    parser.add_argument('--search-index', action='store_true',
+                        help='构建全文搜索索引（链接、模块、发布说明、接口）内嵌到页面，侧边栏提供即时搜索')
+    parser.add_argument('--pwa', action='store_true',
+                        help='输出 <页面名>.webmanifest 和 <页面名>.sw.js，页面可离线访问并从本地缓存秒开（需通过HTTP访问）')
+    parser.add_argument('--jobs', type=int, default=0, metavar='N',
+                        help='以 N 个工作进程并发渲染各分类（无法使用进程时改用线程），并报告每个分类的渲染耗时；'
+                             '批量模式下为并发生成的门户数；超过 CPU 核数时按核数处理')
+    parser.add_argument('--watch', action='store_true', help='监视配置文件，变化后自动重新生成')
+    parser.add_argument('--watch-interval', type=float, default=0.5, help='监视模式的轮询间隔（秒）')
+    parser.add_argument('--debounce', type=float, default=0.3, help='监视模式的防抖窗口（秒）')
 
     args = parser.parse_args()
 
+    cpu_count = os.cpu_count() or 1
+    if args.jobs > cpu_count:
+        print(f"⚠️ --jobs {args.jobs} 超过 CPU 核数，改为 {cpu_count}")
+        args.jobs = cpu_count
+
     if args.create_sample:
         create_sample_json()
         return
 
+    if args.batch:
+        if args.watch:
+            parser.error('--batch 不支持 --watch')
+        if args.output:
+            parser.error('--batch 不支持 --output，输出路径在清单中指定')
+        # 门户之间并行，单个门户内的分类串行渲染
+        ok = batch_generate(args.batch, args.jobs, stream=args.stream, incremental=args.incremental,
+                            external_assets=args.external_assets, minify=args.minify,
+                            precompress=args.precompress, lazy_interfaces=args.lazy_interfaces,
+                            virtual_links=args.virtual_links, defer_sections=args.defer_sections,
+                            split_sections=args.split_sections, search_index=args.search_index, pwa=args.pwa)
+        if not ok:
+            sys.exit(1)
+        return
+
+    args.output = args.output or 'navigation.html'
+
     # 检查配置文件是否存在
     if not os.path.exists(args.config):
         print(f"❌ 配置文件不存在: {args.config}")
@@ -6646,10 +9908,23 @@ def main():
         print("💡 请编辑 config_sample.json 并根据需要重命名")
         return
 
+    if args.watch:
+        watch_and_generate(args.config, args.output, args.watch_interval, args.debounce, stream=args.stream,
+                           external_assets=args.external_assets, minify=args.minify, precompress=args.precompress,
+                           lazy_interfaces=args.lazy_interfaces, virtual_links=args.virtual_links,
+                           defer_sections=args.defer_sections, split_sections=args.split_sections,
+                           search_index=args.search_index, pwa=args.pwa, jobs=args.jobs)
+        return
+
     try:
         # 解析配置文件并生成网站
         generator = parse_json_config(args.config)
-        generator.generate_html(args.output)
+        generator.generate_html(args.output, stream=args.stream, incremental=args.incremental,
+                                external_assets=args.external_assets, minify=args.minify,
+                                precompress=args.precompress, lazy_interfaces=args.lazy_interfaces,
+                                virtual_links=args.virtual_links, defer_sections=args.defer_sections,
+                                split_sections=args.split_sections, search_index=args.search_index,
+                                pwa=args.pwa, jobs=args.jobs)
     except Exception as e:
         print(f"❌ 生成网站时出错: {e}")
         import traceback
@@ -6658,4 +9933,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 打包为可执行文件后，Windows 下的渲染工作进程需要由此进入
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
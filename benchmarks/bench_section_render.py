@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+分类页面渲染微基准测试
+验证单个分类从 1k 到 100k 链接时渲染耗时线性增长（每链接耗时基本恒定）
+
+用法: python benchmarks/bench_section_render.py [--sizes 1000,10000,100000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FastNavGenerator import SoftNavGenerator  # noqa: E402
+
+
+def build_generator(link_count, with_subcategories):
+    """构造只有一个分类、包含 link_count 个链接的生成器"""
+    generator = SoftNavGenerator("基准测试")
+    links = [
+        [f"链接{i}", f"https://example.com/{i}", f"第 {i} 个链接的描述", "网站", f"标签{i % 40}"]
+        for i in range(link_count)
+    ]
+
+    subcategories = {}
+    if with_subcategories:
+        # 一半链接放在主分类，另一半平均分到 10 个二级分类
+        half = link_count // 2
+        step = max(1, (link_count - half) // 10)
+        for j in range(10):
+            subcategories[f"二级{j}"] = {"icon": "📁", "links": links[half + j * step: half + (j + 1) * step]}
+        links = links[:half]
+
+    generator.add_category("基准分类", links, "📁", "普通分类", subcategories)
+    return generator
+
+
+def measure(link_count, with_subcategories, repeat):
+    """返回渲染分类页面的最短耗时（秒）和输出大小"""
+    generator = build_generator(link_count, with_subcategories)
+    category_data = generator.categories["基准分类"]
+    best = None
+    html = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        html = generator._generate_normal_category_section("基准分类", category_data, "active")
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(html)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='分类页面渲染微基准测试')
+    parser.add_argument('--sizes', type=str, default='1000,10000,100000', help='链接数量列表，逗号分隔')
+    parser.add_argument('--repeat', type=int, default=3, help='每个规模重复次数（取最短耗时）')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+
+    for with_subcategories in (False, True):
+        print(f"\n{'带二级分类' if with_subcategories else '普通分类'}")
+        print(f"{'链接数':>10} {'耗时(ms)':>12} {'每链接(µs)':>12} {'输出(KB)':>12} {'相对首档':>12}")
+        baseline = None
+        for size in sizes:
+            elapsed, output_size = measure(size, with_subcategories, args.repeat)
+            per_link = elapsed / size * 1e6
+            baseline = baseline or per_link
+            print(f"{size:>10} {elapsed * 1000:>12.1f} {per_link:>12.2f} "
+                  f"{output_size / 1024:>12.0f} {per_link / baseline:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
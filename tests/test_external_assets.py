@@ -0,0 +1,51 @@
+"""外部资源文件（--external-assets）清理回归测试"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import FastNavGenerator  # noqa: E402
+
+CONFIG_FILE = os.path.join(ROOT, 'FastNavGenerator.json')
+
+
+def generate(output_file, **options):
+    """生成页面（不输出日志）"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator = FastNavGenerator.parse_json_config(CONFIG_FILE)
+        generator.generate_html(output_file, **options)
+
+
+def asset_files(output_dir):
+    return {name for name in os.listdir(output_dir) if name.startswith('app.')}
+
+
+class ExternalAssetPruneTest(unittest.TestCase):
+    def test_rebuild_removes_assets_only_this_page_used(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            page_a = os.path.join(output_dir, 'a.html')
+            page_b = os.path.join(output_dir, 'b.html')
+            generate(page_a, external_assets=True)
+            plain = asset_files(output_dir)
+            generate(page_b, external_assets=True, minify=True, precompress=True)
+            minified = asset_files(output_dir) - plain
+
+            # a.html 改用压缩资源后，未压缩的旧资源不再被任何页面引用
+            generate(page_a, external_assets=True, minify=True)
+            self.assertEqual(asset_files(output_dir), minified)
+
+            # b.html 不再使用外部资源，但 a.html 仍引用同一组文件
+            generate(page_b)
+            self.assertEqual(asset_files(output_dir), minified)
+
+            generate(page_a)
+            self.assertEqual(asset_files(output_dir), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""分片输出（--split-sections）回归测试"""
+import contextlib
+import io
+import os
+import re
+import sys
+import tempfile
+import unittest
+import urllib.parse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import FastNavGenerator  # noqa: E402
+
+CONFIG_FILE = os.path.join(ROOT, 'FastNavGenerator.json')
+
+
+def generate(output_file, **options):
+    """生成页面（不输出日志）"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator = FastNavGenerator.parse_json_config(CONFIG_FILE)
+        generator.generate_html(output_file, **options)
+
+
+def fragment_paths(output_file):
+    """页面中引用的片段文件路径"""
+    with open(output_file, 'r', encoding='utf-8') as f:
+        sources = re.findall(r'class="section-fragment"[^>]* data-src="([^"]+)"', f.read())
+    output_dir = os.path.dirname(output_file)
+    return [os.path.join(output_dir, *map(urllib.parse.unquote, src.split('/'))) for src in sources]
+
+
+class SharedOutputDirectoryTest(unittest.TestCase):
+    def test_pages_sharing_directory_keep_their_fragments(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            page_a = os.path.join(output_dir, 'a.html')
+            page_b = os.path.join(output_dir, 'b.html')
+            generate(page_a, split_sections=True)
+            # 两个页面的片段内容不同（b.html 压缩输出），各自的清理都不能删除对方的片段
+            generate(page_b, split_sections=True, minify=True)
+            generate(page_a, split_sections=True)
+
+            for page in (page_a, page_b):
+                paths = fragment_paths(page)
+                self.assertTrue(paths)
+                for path in paths:
+                    self.assertTrue(os.path.exists(path), f'{os.path.basename(page)} 缺少片段 {path}')
+
+    def test_stale_fragments_of_same_page_are_pruned(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            page = os.path.join(output_dir, 'index.html')
+            generate(page, split_sections=True)
+            old_paths = set(fragment_paths(page))
+            generate(page, split_sections=True, minify=True)
+            new_paths = set(fragment_paths(page))
+
+            self.assertTrue(new_paths)
+            for path in old_paths - new_paths:
+                self.assertFalse(os.path.exists(path), f'旧片段未清理: {path}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""内置静态服务器（serve 子命令）回归测试"""
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import FastNavGenerator  # noqa: E402
+
+
+async def request(server, raw_request):
+    """在临时端口上启动服务器，发送原始请求并返回响应状态行"""
+    listener = await asyncio.start_server(server._handle_connection, '127.0.0.1', 0)
+    port = listener.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(raw_request)
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), 5)
+        writer.close()
+        return status_line.decode('latin-1').strip()
+    finally:
+        listener.close()
+        await listener.wait_closed()
+
+
+class MalformedPathTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.root.name, 'index.html'), 'w', encoding='utf-8') as f:
+            f.write('<html></html>')
+        self.server = FastNavGenerator.AsyncStaticServer(self.root.name, quiet=True)
+
+    def tearDown(self):
+        self.root.cleanup()
+
+    def get(self, path):
+        raw = f'GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n'.encode('latin-1')
+        return asyncio.run(request(self.server, raw))
+
+    def test_nul_byte_is_bad_request(self):
+        self.assertEqual(self.get('/%00'), 'HTTP/1.1 400 Bad Request')
+        self.assertEqual(self.get('/index.html%00.txt'), 'HTTP/1.1 400 Bad Request')
+
+    def test_undecodable_path_is_bad_request(self):
+        self.assertEqual(self.get('/%ff%fe'), 'HTTP/1.1 400 Bad Request')
+
+    def test_valid_and_missing_paths(self):
+        self.assertEqual(self.get('/'), 'HTTP/1.1 200 OK')
+        self.assertEqual(self.get('/missing.html'), 'HTTP/1.1 404 Not Found')
+        self.assertEqual(self.get('/../../etc/passwd'), 'HTTP/1.1 404 Not Found')
+
+    def test_unexpected_error_returns_500(self):
+        def broken_lookup(path):
+            raise RuntimeError('boom')
+
+        self.server.files.lookup = broken_lookup
+        self.assertEqual(self.get('/'), 'HTTP/1.1 500 Internal Server Error')
+
+
+if __name__ == '__main__':
+    unittest.main()